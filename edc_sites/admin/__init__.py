@@ -1,5 +1,6 @@
+from .paginator import SiteCountPaginator
 from .site_admin import SiteAdmin
 from .site_fieldset_tuple import site_fieldset_tuple
 from .site_model_admin_mixin import SiteModelAdminMixin
 
-__all__ = ["SiteAdmin", "SiteModelAdminMixin", "site_fieldset_tuple"]
+__all__ = ["SiteAdmin", "SiteCountPaginator", "SiteModelAdminMixin", "site_fieldset_tuple"]
@@ -1,6 +1,7 @@
 from django.contrib.admin import SimpleListFilter
 from django.contrib.sites.models import Site
 
+from ..query_recorder import record_site_queries
 from ..site import sites
 
 __all__ = ["SiteListFilter"]
@@ -10,6 +11,7 @@ class SiteListFilter(SimpleListFilter):
     title = "Site"
     parameter_name = "site"
 
+    @record_site_queries("SiteListFilter.lookups")
     def lookups(self, request, model_admin):
         names = []
         if model_admin.has_viewallsites_permission(request):
@@ -20,6 +22,7 @@ class SiteListFilter(SimpleListFilter):
             names.append((site.id, f"{site.id} {sites.get(site.id).description}"))
         return tuple(names)
 
+    @record_site_queries("SiteListFilter.queryset")
     def queryset(self, request, queryset):
         if self.value() and self.value() != "none":
             queryset = queryset.filter(site__id=self.value())
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from functools import cached_property
+
+from django.contrib.admin.options import IS_POPUP_VAR, TO_FIELD_VAR
+from django.contrib.admin.views.main import (
+    ALL_VAR,
+    ERROR_FLAG,
+    IS_FACETS_VAR,
+    ORDER_VAR,
+    PAGE_VAR,
+    SEARCH_VAR,
+)
+from django.core.paginator import EmptyPage, Paginator
+
+__all__ = ["EXACT_COUNT_VAR", "SiteCountPaginator", "is_unfiltered_changelist"]
+
+# GET param to request an exact count on a changelist, e.g. ?_exact_count=1
+EXACT_COUNT_VAR = "_exact_count"
+
+
+def is_unfiltered_changelist(request) -> bool:
+    """Returns True if the changelist request has no list filter
+    or search params.
+    """
+    ignored_params = (
+        ALL_VAR,
+        ORDER_VAR,
+        PAGE_VAR,
+        IS_POPUP_VAR,
+        IS_FACETS_VAR,
+        TO_FIELD_VAR,
+        ERROR_FLAG,
+        EXACT_COUNT_VAR,
+    )
+    return not [
+        k for k, v in request.GET.items() if k not in ignored_params and (k != SEARCH_VAR or v)
+    ]
+
+
+class SiteCountPaginator(Paginator):
+    """A Paginator that avoids a full COUNT(*) on large changelists.
+
+    * If `site_counts` is given, the count is the sum of the cached
+      per-site counts (see `get_site_counts`).
+    * Otherwise, if `threshold` is given, rows are counted up to
+      `threshold` + 1. Beyond that the count is estimated as
+      `threshold` and `estimated` is True. Requesting a page
+      beyond the estimate triggers an exact count.
+    * If `exact` is True, the count is exact.
+
+    See also SiteModelAdminMixin.get_paginator.
+    """
+
+    def __init__(
+        self,
+        object_list,
+        per_page,
+        orphans=0,
+        allow_empty_first_page=True,
+        site_counts: dict[int, int] | None = None,
+        threshold: int | None = None,
+        exact: bool | None = None,
+    ):
+        super().__init__(
+            object_list,
+            per_page,
+            orphans=orphans,
+            allow_empty_first_page=allow_empty_first_page,
+        )
+        self.site_counts = site_counts
+        self.threshold = threshold
+        self.exact = exact
+        self.estimated = False
+
+    @cached_property
+    def count(self) -> int:
+        if self.exact:
+            return Paginator.count.func(self)
+        if self.site_counts is not None:
+            return sum(self.site_counts.values())
+        if self.threshold is not None:
+            count = len(
+                self.object_list.order_by().values_list("pk", flat=True)[: self.threshold + 1]
+            )
+            if count > self.threshold:
+                self.estimated = True
+                return self.threshold
+            return count
+        return Paginator.count.func(self)
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if self.exact or not (self.estimated or self.site_counts is not None):
+                raise
+        self.exact = True
+        self.estimated = False
+        for attr in ["count", "num_pages"]:
+            self.__dict__.pop(attr, None)
+        return super().validate_number(number)
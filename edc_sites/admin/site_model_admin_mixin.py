@@ -9,8 +9,11 @@ from django.core.exceptions import FieldError, ObjectDoesNotExist
 from django.db.models import QuerySet
 
 from ..models import SiteProfile
+from ..query_recorder import record_site_queries
 from ..site import sites
+from ..utils import get_site_counts
 from .list_filters import SiteListFilter
+from .paginator import EXACT_COUNT_VAR, SiteCountPaginator, is_unfiltered_changelist
 
 if TYPE_CHECKING:
     from django.contrib.admin import SimpleListFilter
@@ -30,9 +33,21 @@ class SiteModelAdminMixin:
     limit_related_to_current_site: list[str] = None
     site_list_display_insert_pos: int = 1
 
+    # changelist paginator options, see get_paginator
+    site_paginator_threshold: int | None = None
+    site_paginator_use_site_counts: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.raise_on_dups_in_field_lists(
+            cls.limit_related_to_current_country,
+            cls.limit_related_to_current_site,
+        )
+
     def user_may_view_other_sites(self, request) -> bool:
         return sites.user_may_view_other_sites(request)
 
+    @record_site_queries("get_view_only_site_ids_for_user")
     def get_view_only_site_ids_for_user(self, request) -> list[int]:
         """Returns a list of sites, not including the current, that
         the user has permissions for.
@@ -61,6 +76,7 @@ class SiteModelAdminMixin:
         return obj.site.id
 
     @admin.display(description="Site", ordering="site__id")
+    @record_site_queries("site_name")
     def site_name(self, obj=None):
         try:
             site_profile = SiteProfile.objects.get(site__id=obj.site.id)
@@ -68,6 +84,7 @@ class SiteModelAdminMixin:
             return obj.site.name
         return f"{site_profile.site.id} {site_profile.description}"
 
+    @record_site_queries("get_list_filter")
     def get_list_filter(self, request) -> tuple[str | Type[SimpleListFilter], ...]:
         """Insert `SiteListFilter` before field name `created`.
 
@@ -86,6 +103,7 @@ class SiteModelAdminMixin:
             list_filter.insert(index, SiteListFilter)
         return tuple(list_filter)
 
+    @record_site_queries("get_list_display")
     def get_list_display(self, request) -> tuple[str]:
         """Insert `site` after the first column"""
         list_display = super().get_list_display(request)
@@ -103,6 +121,7 @@ class SiteModelAdminMixin:
             list_display = list_display[:pos] + (self.site_code,) + list_display[pos:]
         return list_display
 
+    @record_site_queries("get_queryset")
     def get_queryset(self, request) -> QuerySet:
         """Limit modeladmin queryset for the current site only"""
         qs = super().get_queryset(request)
@@ -116,6 +135,64 @@ class SiteModelAdminMixin:
             )
         return qs
 
+    @property
+    def show_full_result_count(self) -> bool:
+        """Returns False if the site paginator is enabled to avoid
+        the extra COUNT of the unfiltered queryset.
+        """
+        if self.site_paginator_threshold is not None or self.site_paginator_use_site_counts:
+            return False
+        return getattr(super(), "show_full_result_count", True)
+
+    def changelist_view(self, request, extra_context=None):
+        """Remove the exact count param, if given, before the
+        ChangeList reads the list filter params.
+        """
+        if EXACT_COUNT_VAR in request.GET:
+            request.GET = request.GET.copy()
+            del request.GET[EXACT_COUNT_VAR]
+            request.edc_sites_exact_count = True
+        return super().changelist_view(request, extra_context=extra_context)
+
+    def get_paginator(
+        self, request, queryset, per_page, orphans=0, allow_empty_first_page=True
+    ):
+        """Returns a SiteCountPaginator if `site_paginator_threshold`
+        or `site_paginator_use_site_counts` is set.
+
+        If `site_paginator_use_site_counts` is True, the count of an
+        unfiltered changelist is taken from the cached per-site counts.
+        Only use if `get_queryset` limits the queryset by site and
+        nothing else.
+
+        Add `?_exact_count=1` to the changelist url for an exact count.
+        """
+        if self.site_paginator_threshold is None and not self.site_paginator_use_site_counts:
+            return super().get_paginator(
+                request, queryset, per_page, orphans, allow_empty_first_page
+            )
+        exact = getattr(request, "edc_sites_exact_count", False)
+        site_counts = None
+        if (
+            not exact
+            and self.site_paginator_use_site_counts
+            and is_unfiltered_changelist(request)
+        ):
+            counts = get_site_counts(self.model)
+            site_ids = [request.site.id] + self.get_view_only_site_ids_for_user(
+                request=request
+            )
+            site_counts = {site_id: counts.get(site_id, 0) for site_id in site_ids}
+        return SiteCountPaginator(
+            queryset,
+            per_page,
+            orphans=orphans,
+            allow_empty_first_page=allow_empty_first_page,
+            site_counts=site_counts,
+            threshold=self.site_paginator_threshold,
+            exact=exact,
+        )
+
     def get_form(self, request, obj=None, change=False, **kwargs):
         """Add current_site attr to form instance"""
         form = super().get_form(request, obj=obj, change=change, **kwargs)
@@ -142,16 +219,17 @@ class SiteModelAdminMixin:
 
         Note, a queryset set by the ModelForm class will overwrite
         the field's queryset added here.
+
+        Site ids for the current country are read from the `sites`
+        registry, so no join on SiteProfile is needed.
         """
-        self.raise_on_dups_in_field_lists(
-            self.limit_related_to_current_country,
-            self.limit_related_to_current_site,
-        )
         if db_field.name in (self.limit_related_to_current_country or []):
             self.raise_on_queryset_exists(db_field, kwargs)
             country = sites.get_current_country(request)
             model_cls = getattr(self.model, db_field.name).field.related_model
-            kwargs["queryset"] = model_cls.objects.filter(siteprofile__country=country)
+            kwargs["queryset"] = model_cls.objects.filter(
+                id__in=sites.get_site_ids_by_country(country)
+            )
         elif db_field.name in (self.limit_related_to_current_site or []) and getattr(
             request, "site", None
         ):
@@ -170,10 +248,6 @@ class SiteModelAdminMixin:
         Note, a queryset set by the ModelForm class will overwrite
         the field's queryset added here.
         """
-        self.raise_on_dups_in_field_lists(
-            self.limit_related_to_current_country,
-            self.limit_related_to_current_site,
-        )
         if db_field.name in (self.limit_related_to_current_site or []):
             self.raise_on_queryset_exists(db_field, kwargs)
             model_cls = getattr(self.model, db_field.name).remote_field.model
@@ -181,7 +255,9 @@ class SiteModelAdminMixin:
         elif db_field.name in (self.limit_related_to_current_country or []):
             country = sites.get_current_country(request)
             model_cls = getattr(self.model, db_field.name).remote_field.model
-            kwargs["queryset"] = model_cls.objects.filter(siteprofile__country=country)
+            kwargs["queryset"] = model_cls.objects.filter(
+                id__in=sites.get_site_ids_by_country(country)
+            )
         return super().formfield_for_manytomany(db_field, request, **kwargs)
 
     def raise_on_queryset_exists(self, db_field, kwargs):
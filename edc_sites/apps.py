@@ -16,6 +16,13 @@ class AppConfig(DjangoAppConfig):
     include_in_administration_section = True
 
     def ready(self) -> None:
+        from .signals import (
+            connect_site_counts_receivers,
+            connect_sites_fingerprint_receivers,
+        )
+
+        connect_site_counts_receivers()
+        connect_sites_fingerprint_receivers()
         parser = ArgumentParser()
         _, args = parser.parse_known_args()
         django_settings_module = getattr(settings, ENVIRONMENT_VARIABLE, None)
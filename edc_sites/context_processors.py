@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from django.apps import apps as django_apps
+from django.core.exceptions import ImproperlyConfigured
+
+from .exceptions import InvalidSiteForUser
+from .site import SiteNotRegistered, sites
+from .utils import get_current_site_obj
+
+if TYPE_CHECKING:
+    from django.core.handlers.wsgi import WSGIRequest
+
+    from .models import SiteProfile
+    from .single_site import SingleSite
+
+__all__ = ["SiteContext", "get_site_context", "site"]
+
+
+class SiteContext:
+    """Site attributes for templates, each resolved on first
+    access and at most once per request.
+
+    See `get_site_context`.
+    """
+
+    def __init__(self, request: WSGIRequest):
+        self.request = request
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(request={self.request!r})"
+
+    @cached_property
+    def site_id(self) -> int:
+        return get_current_site_obj(self.request).id
+
+    @cached_property
+    def single_site(self) -> SingleSite | None:
+        try:
+            return sites.get(self.site_id)
+        except SiteNotRegistered:
+            return None
+
+    @cached_property
+    def country(self) -> str | None:
+        return getattr(self.single_site, "country", None)
+
+    @cached_property
+    def title(self) -> str | None:
+        return getattr(self.single_site, "description", None)
+
+    @cached_property
+    def site_profile(self) -> SiteProfile | None:
+        return (
+            django_apps.get_model("edc_sites.siteprofile")
+            .objects.filter(site_id=self.site_id)
+            .first()
+        )
+
+    @cached_property
+    def site_ids(self) -> list[int]:
+        """Returns the ids of the sites the user may access,
+        current site first.
+        """
+        user = getattr(self.request, "user", None)
+        if not self.site_id or not user or not user.is_authenticated:
+            return [self.site_id] if self.site_id else []
+        try:
+            return sites.get_site_ids_for_user(user=user, site_id=self.site_id)
+        except (InvalidSiteForUser, ImproperlyConfigured):
+            return [self.site_id]
+
+    @cached_property
+    def accessible_sites(self) -> list[SingleSite]:
+        return [sites.get(site_id) for site_id in self.site_ids if site_id in sites.all()]
+
+    @property
+    def may_view_other_sites(self) -> bool:
+        return len(self.site_ids) > 1
+
+
+def get_site_context(request: WSGIRequest) -> SiteContext:
+    """Returns the SiteContext for this request, created once
+    and kept on the request.
+    """
+    if not (site_context := getattr(request, "edc_site_context", None)):
+        site_context = SiteContext(request)
+        request.edc_site_context = site_context
+    return site_context
+
+
+def site(request: WSGIRequest) -> dict:
+    """A context processor that adds `edc_site`, a SiteContext.
+
+    In templates, for example:
+        {{ edc_site.title }} {{ edc_site.country }}
+
+    Add `edc_sites.context_processors.site` to
+    TEMPLATES[...]["OPTIONS"]["context_processors"].
+    """
+    return {"edc_site": get_site_context(request)}
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from django.apps import apps as django_apps
 
+from .utils import get_current_site_obj, get_site_obj
+
 if TYPE_CHECKING:
     from django.contrib.sites.models import Site
 
@@ -14,10 +17,19 @@ class SiteFormValidatorMixin:
     def site_model_cls(self) -> Site:
         return django_apps.get_model("sites.site")
 
-    @property
+    @cached_property
     def site(self) -> Site:
-        return (
-            self.cleaned_data.get("site")
-            or getattr(self.instance, "site", None)
-            or self.site_model_cls.objects.get_current()
-        )
+        """Returns the site for this form validator.
+
+        Resolved once per instance by site_id. See `get_site_id`.
+        """
+        return get_site_obj(self.get_site_id())
+
+    def get_site_id(self) -> int:
+        """Returns the site id from the `site` field, the instance
+        or the current site, in that order, without fetching the
+        related Site.
+        """
+        if site := self.cleaned_data.get("site"):
+            return site.id
+        return getattr(self.instance, "site_id", None) or get_current_site_obj().id
@@ -0,0 +1,102 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import color_style
+
+from edc_sites.utils.delta_export import (
+    DeltaCheckpoint,
+    DeltaExportError,
+    checkpoint_filename,
+    export_site_delta,
+)
+
+style = color_style()
+
+
+class Command(BaseCommand):
+    help = (
+        "Export rows of models with a site foreign key modified since a watermark "
+        "as gzipped JSON lines chunks, with a resumable checkpoint"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output-dir",
+            dest="output_dir",
+            metavar="PATH",
+            required=True,
+            help="Folder for the chunks and checkpoint",
+        )
+        parser.add_argument(
+            "--site-id",
+            dest="site_ids",
+            type=int,
+            action="append",
+            help="Site id to export. Repeat for more than one. Default: all registered",
+        )
+        parser.add_argument(
+            "--since",
+            dest="since",
+            metavar="DATETIME",
+            help="Export rows modified after this ISO datetime. Default: all rows",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            dest="checkpoint_path",
+            metavar="PATH",
+            help=(
+                "Checkpoint of a previous export. Resumes it if incomplete, otherwise "
+                f"exports from its watermark. Default: {checkpoint_filename} in the "
+                "output folder, if it exists"
+            ),
+        )
+        parser.add_argument(
+            "--chunk-size",
+            dest="chunk_size",
+            type=int,
+            default=1000,
+            help="Rows per chunk. Default: 1000",
+        )
+        parser.add_argument(
+            "--lag",
+            dest="lag",
+            type=int,
+            metavar="SECONDS",
+            help=(
+                "Export rows modified up to this many seconds ago, to allow open "
+                "transactions to commit. Default: settings.EDC_SITES_DELTA_EXPORT_LAG "
+                "or 300"
+            ),
+        )
+
+    def handle(self, *args, **options) -> None:
+        output_dir = Path(options.get("output_dir"))
+        checkpoint_path = options.get("checkpoint_path") or output_dir / checkpoint_filename
+        checkpoint = None
+        if Path(checkpoint_path).exists():
+            checkpoint = DeltaCheckpoint.load(checkpoint_path)
+        elif options.get("checkpoint_path"):
+            raise CommandError(f"Checkpoint not found. Got {checkpoint_path}.")
+        try:
+            since = datetime.fromisoformat(options["since"]) if options.get("since") else None
+        except ValueError as e:
+            raise CommandError(f"Invalid --since. Got {e}.")
+        try:
+            checkpoint = export_site_delta(
+                output_dir,
+                site_ids=options.get("site_ids"),
+                since=since,
+                checkpoint=checkpoint,
+                chunk_size=options.get("chunk_size"),
+                lag=None if options.get("lag") is None else timedelta(seconds=options["lag"]),
+            )
+        except DeltaExportError as e:
+            raise CommandError(e)
+        sys.stdout.write(
+            style.SUCCESS(
+                f" Edc Sites : exported {checkpoint.rows} rows in {checkpoint.chunks} "
+                f"chunks to {output_dir}. Watermark {checkpoint.until.isoformat()}.\n"
+            )
+        )
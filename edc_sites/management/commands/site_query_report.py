@@ -0,0 +1,50 @@
+import sys
+
+from django.core.management.base import BaseCommand
+from django.core.management.color import color_style
+
+from edc_sites.query_recorder import get_query_recorder_enabled, site_query_recorder
+
+style = color_style()
+
+
+class Command(BaseCommand):
+    help = (
+        "Report the number and duration of queries run by the site-resolution "
+        "code of site-scoped admin classes. See settings.EDC_SITES_RECORD_QUERIES"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            default=False,
+            action="store_true",
+            dest="reset",
+            help="Reset the recorded stats after reporting",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if not get_query_recorder_enabled():
+            sys.stdout.write(
+                style.WARNING(
+                    "\n Recording is disabled. Set settings.EDC_SITES_RECORD_QUERIES=True.\n"
+                )
+            )
+        stats = site_query_recorder.get_cached_stats()
+        sys.stdout.write("\n Edc Sites : site-resolution queries per admin view\n\n")
+        sys.stdout.write(
+            f"  {'view':<50} {'label':<35} {'calls':>7} {'queries':>8} "
+            f"{'q/call':>7} {'ms/call':>8}\n"
+        )
+        for (view, label), stat in sorted(stats.items(), key=lambda x: -x[1].queries):
+            sys.stdout.write(
+                f"  {view:<50} {label:<35} {stat.calls:>7} {stat.queries:>8} "
+                f"{stat.queries / stat.calls:>7.1f} "
+                f"{stat.duration * 1000 / stat.calls:>8.2f}\n"
+            )
+        if not stats:
+            sys.stdout.write("  Nothing recorded.\n")
+        if options.get("reset"):
+            site_query_recorder.reset()
+            sys.stdout.write("\n Reset.\n")
+        sys.stdout.write("Done     \n")
@@ -0,0 +1,67 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import color_style
+
+from edc_sites.utils.sites_snapshot import (
+    SitesSnapshotError,
+    export_sites_snapshot,
+    import_sites_snapshot,
+)
+
+style = color_style()
+
+
+class Command(BaseCommand):
+    help = (
+        "Export or import the Site, SiteProfile and multisite Alias rows as a "
+        "JSON lines snapshot"
+    )
+
+    def add_arguments(self, parser):
+        group = parser.add_mutually_exclusive_group(required=True)
+        group.add_argument(
+            "--export",
+            dest="export_path",
+            metavar="PATH",
+            help="Export a snapshot to PATH. Use '-' for stdout",
+        )
+        group.add_argument(
+            "--import",
+            dest="import_path",
+            metavar="PATH",
+            help="Import a snapshot from PATH. Use '-' for stdin",
+        )
+        parser.add_argument(
+            "--skip-verify",
+            default=False,
+            action="store_true",
+            dest="skip_verify",
+            help="Do not verify the snapshot against the sites registry before importing",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if path := options.get("export_path"):
+            if path == "-":
+                export_sites_snapshot(sys.stdout)
+            else:
+                with open(path, "w") as f:
+                    count = export_sites_snapshot(f)
+                sys.stdout.write(f" Edc Sites : exported {count} rows to {path}.\n")
+        else:
+            path = options.get("import_path")
+            try:
+                if path == "-":
+                    fingerprint = import_sites_snapshot(
+                        sys.stdin, verify=not options.get("skip_verify")
+                    )
+                else:
+                    with open(path) as f:
+                        fingerprint = import_sites_snapshot(
+                            f, verify=not options.get("skip_verify")
+                        )
+            except SitesSnapshotError as e:
+                raise CommandError(e)
+            sys.stdout.write(
+                style.SUCCESS(f" Edc Sites : imported {path}. Fingerprint {fingerprint}.\n")
+            )
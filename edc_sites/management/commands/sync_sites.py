@@ -2,7 +2,7 @@ import socket
 import sys
 
 from django.conf import settings
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.core.management.color import color_style
 
 from edc_sites.site import sites as site_sites
@@ -32,6 +32,17 @@ class Command(BaseCommand):
             help="Suggest ALLOWED_HOSTS",
         )
 
+        parser.add_argument(
+            "--full-alias-sync",
+            default=False,
+            action="store_true",
+            dest="full_alias_sync",
+            help=(
+                "Re-sync the multisite aliases of all sites. By default, only aliases "
+                "of changed sites or sites without a canonical alias are synced"
+            ),
+        )
+
     def handle(self, *args, **options) -> None:
         sys.stdout.write("\n\n")
         sys.stdout.write(" Edc Sites : Adding / Updating sites ...     \n")
@@ -41,15 +52,21 @@ class Command(BaseCommand):
             or "multisite.apps.AppConfig" in settings.INSTALLED_APPS
         ):
             from multisite.models import Alias
-            from multisite.utils import create_or_sync_canonical_from_all_sites
 
             sys.stdout.write("\n Multisite. \n")
-            create_or_sync_canonical_from_all_sites(verbose=True)
-
+            if options.get("full_alias_sync"):
+                try:
+                    from multisite.utils import create_or_sync_canonical_from_all_sites
+                except ImportError:
+                    raise CommandError(
+                        "--full-alias-sync requires a multisite that provides "
+                        "`create_or_sync_canonical_from_all_sites`."
+                    )
+                create_or_sync_canonical_from_all_sites(verbose=True)
             sys.stdout.write("    multisite.Alias \n")
-            for obj in Alias.objects.all():
+            for obj in Alias.objects.select_related("site").order_by("site_id", "domain"):
                 sys.stdout.write(
-                    f"      - Site model: {obj.site.id}: {obj.domain} "
+                    f"      - Site model: {obj.site.id}: {obj.site.name}: {obj.domain} "
                     f"is_canonical={obj.is_canonical}.\n"
                 )
         arg = [arg for arg in sys.argv if arg.startswith("--settings")]
@@ -1,8 +1,144 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from django.conf import settings
 from django.contrib.sites.managers import CurrentSiteManager as BaseCurrentSiteManager
+from django.db import models
+from django.db.models import Q
+
+from .utils import get_pinned_site
+
+if TYPE_CHECKING:
+    from django.db.models import Model, QuerySet
+
+__all__ = ["CurrentSiteManager", "SiteNaturalKeyManager", "prefetch_natural_keys"]
+
+_prefetched_natural_keys: ContextVar[dict | None] = ContextVar(
+    "edc_sites_prefetched_natural_keys", default=None
+)
+
+
+@contextmanager
+def prefetch_natural_keys(
+    model_cls: type[Model], natural_keys: Iterable[tuple[str, int]]
+) -> Iterator[dict[tuple[str, int], Model]]:
+    """Context manager to resolve many (subject_identifier, site_id)
+    natural keys in one query.
+
+    Within the block, `get_by_natural_key` returns the prefetched
+    instance without a query, e.g. when deserializing a fixture:
+
+        with prefetch_natural_keys(MyModel, natural_keys):
+            for obj in serializers.deserialize("json", data):
+                obj.save()
+    """
+    objs = model_cls._default_manager.get_by_natural_keys(natural_keys)
+    prefetched = dict(_prefetched_natural_keys.get() or {})
+    prefetched[model_cls._meta.label_lower] = objs
+    token = _prefetched_natural_keys.set(prefetched)
+    try:
+        yield objs
+    finally:
+        _prefetched_natural_keys.reset(token)
+
+
+class SiteNaturalKeyManagerMixin:
+    """Manager methods for the natural key (subject_identifier,
+    site_id).
+
+    See also: SiteNaturalKeyModelMixin.
+    """
+
+    site_id_lookup = "site_id"
 
+    def get_natural_key_queryset(self) -> QuerySet:
+        """Returns a queryset not limited to the current site."""
+        return models.Manager.get_queryset(self)
+
+    def get_by_natural_key(self, subject_identifier: str, site_id: int | None = None):
+        """Returns the instance for this subject_identifier and site.
+
+        If `site_id` is None, the lookup is on the queryset of the
+        manager.
+        """
+        if site_id is None:
+            return self.get(subject_identifier=subject_identifier)
+        prefetched = (_prefetched_natural_keys.get() or {}).get(
+            self.model._meta.label_lower, {}
+        )
+        if obj := prefetched.get((subject_identifier, site_id)):
+            return obj
+        return self.get_natural_key_queryset().get(
+            **{"subject_identifier": subject_identifier, self.site_id_lookup: site_id}
+        )
+
+    def get_by_natural_keys(
+        self, natural_keys: Iterable[tuple[str, int]]
+    ) -> dict[tuple[str, int], Model]:
+        """Returns a dictionary of instances by natural key
+        (subject_identifier, site_id) fetched in a single query.
+
+        Natural keys not found are not included.
+        """
+        subject_identifiers_by_site = defaultdict(list)
+        for subject_identifier, site_id in natural_keys:
+            subject_identifiers_by_site[site_id].append(subject_identifier)
+        if not subject_identifiers_by_site:
+            return {}
+        q = Q()
+        for site_id, subject_identifiers in subject_identifiers_by_site.items():
+            q |= Q(
+                **{"subject_identifier__in": subject_identifiers, self.site_id_lookup: site_id}
+            )
+        return {
+            (obj.subject_identifier, getattr(obj, self.site_id_lookup)): obj
+            for obj in self.get_natural_key_queryset().filter(q)
+        }
+
+
+class SiteNaturalKeyManager(SiteNaturalKeyManagerMixin, models.Manager):
+    use_in_migrations = True
+
+
+class CurrentSiteManager(SiteNaturalKeyManagerMixin, BaseCurrentSiteManager):
+    """Limits objects to those associated with the current site.
+
+    The current site id is read from the site pinned by
+    `pin_current_site` or `SiteContextMiddleware`, if set,
+    otherwise from `settings.SITE_ID`. The lookup on the site
+    field is resolved once per model.
+
+    `get_by_natural_key` with a `site_id` is not limited to the
+    current site.
+    """
 
-class CurrentSiteManager(BaseCurrentSiteManager):
     use_in_migrations = True
 
-    def get_by_natural_key(self, subject_identifier):
-        return self.get(subject_identifier=subject_identifier)
+    def __init__(self, field_name=None):
+        super().__init__(field_name=field_name)
+        self._site_id_lookup = None
+
+    @property
+    def site_id_lookup(self) -> str:
+        if not self._site_id_lookup:
+            field = self.model._meta.get_field(self._get_field_name())
+            if field.many_to_many:
+                self._site_id_lookup = f"{field.name}__id"
+            else:
+                self._site_id_lookup = field.attname
+        return self._site_id_lookup
+
+    @staticmethod
+    def get_current_site_id():
+        if site := get_pinned_site():
+            return site.id
+        return settings.SITE_ID
+
+    def get_queryset(self):
+        return models.Manager.get_queryset(self).filter(
+            **{self.site_id_lookup: self.get_current_site_id()}
+        )
@@ -0,0 +1,83 @@
+from edc_auth.utils import user_has_change_perms
+
+from .query_recorder import get_query_recorder_enabled, site_query_recorder
+from .routers import get_replica_db_alias, use_replica_for_reads
+from .utils import pin_current_site
+
+
+class SiteContextMiddleware:
+    """Pins `request.site` as the current site for the duration
+    of the request.
+
+    Place after the middleware that sets `request.site`, e.g.
+    `django.contrib.sites.middleware.CurrentSiteMiddleware` or
+    `multisite.middleware.DynamicSiteMiddleware`.
+
+    See also: pin_current_site, CurrentSiteManager.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if site := getattr(request, "site", None):
+            with pin_current_site(site):
+                return self.get_response(request)
+        return self.get_response(request)
+
+
+class SiteReplicaMiddleware:
+    """Routes reads to the read replica for the duration of a
+    GET, HEAD or OPTIONS request by a multisite viewer
+    (UserProfile.is_multisite_viewer) without `add`, `change` or
+    `delete` perms.
+
+    Multisite viewers run the heaviest cross-site queries. A
+    viewer with change perms is not routed to the replica to
+    avoid reading a lagging replica after a write.
+
+    Requires settings.EDC_SITES_REPLICA_DB_ALIAS and
+    `edc_sites.routers.SiteReplicaRouter` in
+    settings.DATABASE_ROUTERS. Place after
+    `django.contrib.auth.middleware.AuthenticationMiddleware`.
+    """
+
+    safe_methods = ("GET", "HEAD", "OPTIONS")
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if self.use_replica(request):
+            with use_replica_for_reads():
+                return self.get_response(request)
+        return self.get_response(request)
+
+    def use_replica(self, request) -> bool:
+        if not get_replica_db_alias() or request.method not in self.safe_methods:
+            return False
+        user = getattr(request, "user", None)
+        if not user or not user.is_authenticated:
+            return False
+        userprofile = getattr(user, "userprofile", None)
+        if not getattr(userprofile, "is_multisite_viewer", False):
+            return False
+        return not user_has_change_perms(user=user)
+
+
+class SiteQueryRecorderMiddleware:
+    """Collects the query stats recorded during a request and adds
+    them to the cache once, at the end of the request.
+
+    Only active if settings.EDC_SITES_RECORD_QUERIES is True.
+    See also SiteQueryRecorder.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if get_query_recorder_enabled():
+            with site_query_recorder.recording():
+                return self.get_response(request)
+        return self.get_response(request)
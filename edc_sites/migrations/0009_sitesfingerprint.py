@@ -0,0 +1,24 @@
+# Generated by Django 5.1 on 2026-10-19 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("edc_sites", "0008_delete_edcsite_remove_siteprofile_description"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SitesFingerprint",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("fingerprint", models.CharField(max_length=64)),
+                ("modified", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Sites fingerprint",
+                "verbose_name_plural": "Sites fingerprint",
+            },
+        ),
+    ]
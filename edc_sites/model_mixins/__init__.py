@@ -1 +1,2 @@
 from .site_model_mixin import SiteModelMixin, SiteModelMixinError
+from .site_natural_key_model_mixin import SiteNaturalKeyModelMixin
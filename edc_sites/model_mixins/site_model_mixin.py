@@ -5,9 +5,10 @@ from django.contrib.sites.models import Site
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models, transaction
 
+from ..exceptions import InvalidSiteError
 from ..managers import CurrentSiteManager
 from ..site import sites
-from ..utils import get_site_model_cls
+from ..utils import get_current_site_obj, get_pinned_site, site_validation_bypassed
 
 
 class SiteModelMixinError(Exception):
@@ -24,6 +25,11 @@ class SiteModelMixin(models.Model):
 
     on_site = CurrentSiteManager()
 
+    # set to True to validate the site against the current site on
+    # update. If None, settings.EDC_SITES_VALIDATE_SITE_ON_UPDATE
+    # (default False). See validate_site_against_current.
+    validate_site_on_update: bool | None = None
+
     def save(self, *args, **kwargs):
         self.update_site_on_save(*args, **kwargs)
         super().save(*args, **kwargs)
@@ -53,7 +59,7 @@ class SiteModelMixin(models.Model):
             else:
                 try:
                     with transaction.atomic():
-                        site_obj = get_site_model_cls().objects.get_current()
+                        site_obj = get_current_site_obj()
                 except ObjectDoesNotExist as e:
                     site_ids = [str(s) for s in sites.all()]
                     raise SiteModelMixinError(
@@ -64,7 +70,27 @@ class SiteModelMixin(models.Model):
         return site_obj
 
     def validate_site_against_current(self) -> None:
-        """Validate existing site instance matches current_site."""
+        """Validate existing site instance matches current_site.
+
+        Compares `site_id` with the id of the site pinned for the
+        request (see SiteContextMiddleware) or block of work (see
+        `pin_current_site`). Does not query the DB.
+
+        Opt-in. Only if `validate_site_on_update` is True or, if
+        None, settings.EDC_SITES_VALIDATE_SITE_ON_UPDATE is True.
+        Skipped if no site is pinned or within
+        `bypass_site_validation()`.
+        """
+        validate = self.validate_site_on_update
+        if validate is None:
+            validate = getattr(settings, "EDC_SITES_VALIDATE_SITE_ON_UPDATE", False)
+        if not validate or site_validation_bypassed():
+            return None
+        if (current_site := get_pinned_site()) and self.site_id != current_site.id:
+            raise InvalidSiteError(
+                f"Invalid site for {self._meta.label_lower}. Expected the current site. "
+                f"Current site is {current_site.id}. Got {self.site_id}."
+            )
         return None
 
     class Meta:
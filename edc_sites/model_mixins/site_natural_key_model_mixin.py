@@ -0,0 +1,31 @@
+from django.db import models
+
+from ..managers import SiteNaturalKeyManager
+
+
+class SiteNaturalKeyModelMixin(models.Model):
+    """A model mixin for models where `subject_identifier` is unique
+    within a site only.
+
+    Declare with SiteModelMixin. The natural key is
+    (subject_identifier, site_id) backed by a composite unique
+    constraint. If you declare a Meta class, inherit from
+    `SiteNaturalKeyModelMixin.Meta`.
+    """
+
+    objects = SiteNaturalKeyManager()
+
+    def natural_key(self) -> tuple[str, int]:
+        return self.subject_identifier, self.site_id
+
+    natural_key.dependencies = ["sites.Site"]
+
+    class Meta:
+        abstract = True
+        default_manager_name = "objects"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["subject_identifier", "site"],
+                name="%(app_label)s_%(class)s_subject_site_uniq",
+            )
+        ]
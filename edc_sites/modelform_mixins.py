@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING, Type
 
 from django import forms
 from django.apps import apps as django_apps
 
+from .utils import get_current_site_obj, get_site_obj
+
 if TYPE_CHECKING:
     from django.contrib.sites.models import Site
 
@@ -35,15 +38,24 @@ class SiteModelFormMixin:
     def site_model_cls(self) -> Type[Site]:
         return django_apps.get_model("sites.site")
 
-    @property
+    @cached_property
     def site(self) -> Site:
+        """Returns the site for this form.
+
+        Resolved once per form instance by site_id. See `get_site_id`.
+        """
+        return get_site_obj(self.get_site_id())
+
+    def get_site_id(self) -> int:
+        """Returns the site id from the related visit, the `site`
+        field, the instance or the current site, in that order,
+        without fetching the related Site.
+        """
         if related_visit := getattr(self, "related_visit", None):
-            return related_visit.site
-        return (
-            self.cleaned_data.get("site")
-            or self.instance.site
-            or self.site_model_cls.objects.get_current()
-        )
+            return related_visit.site_id
+        if site := self.cleaned_data.get("site"):
+            return site.id
+        return self.instance.site_id or get_current_site_obj().id
 
     def validate_with_current_site(self) -> None:
         current_site = getattr(self, "current_site", None)
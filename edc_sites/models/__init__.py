@@ -1,3 +1,4 @@
 from ..managers import CurrentSiteManager  # noqa (leave for old migrations)
 from .edc_permissions import EdcPermissions
 from .site_profile import SiteProfile
+from .sites_fingerprint import SitesFingerprint
@@ -0,0 +1,23 @@
+from django.db import models
+
+
+class SitesFingerprint(models.Model):
+    """A single row model to store the fingerprint of the `sites`
+    registry at the time the Site / SiteProfile tables were last
+    synced.
+
+    See also: add_or_update_django_sites, sites_check.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+
+    fingerprint = models.CharField(max_length=64)
+
+    modified = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.fingerprint
+
+    class Meta:
+        verbose_name = "Sites fingerprint"
+        verbose_name_plural = "Sites fingerprint"
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from functools import wraps
+from typing import Any, Callable, Iterator
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+__all__ = [
+    "QueryStats",
+    "SiteQueryRecorder",
+    "get_query_recorder_enabled",
+    "record_site_queries",
+    "site_query_recorder",
+]
+
+logger = logging.getLogger("edc_sites.queries")
+
+cache_key_prefix = "edc_sites.query_recorder"
+
+_pending_stats: ContextVar[dict[str, tuple[int, int, float]] | None] = ContextVar(
+    "edc_sites_pending_query_stats", default=None
+)
+
+
+def get_query_recorder_enabled() -> bool:
+    return getattr(settings, "EDC_SITES_RECORD_QUERIES", False)
+
+
+def get_cache_key(*parts: str) -> str:
+    return ".".join([cache_key_prefix, *parts])
+
+
+def get_stats_cache_keys(key: str) -> list[str]:
+    """Returns the cache keys of the calls, queries and duration
+    counters and of the marker for a "view|label" key.
+    """
+    digest = hashlib.md5(key.encode()).hexdigest()  # nosec B324
+    return [get_cache_key(digest, name) for name in ["calls", "queries", "duration", "key"]]
+
+
+@dataclass
+class QueryStats:
+    calls: int = 0
+    queries: int = 0
+    duration: float = 0.0
+
+
+class QueryCounter:
+    """A `connection.execute_wrapper` that counts and times queries."""
+
+    def __init__(self):
+        self.queries = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.duration += time.perf_counter() - start
+
+
+class SiteQueryRecorder:
+    """Collects the number and duration of queries run by the
+    site-resolution code of site-scoped admin classes.
+
+    Stats are keyed by (view, label). The view is the url name of
+    the request, if known, otherwise the label of the model.
+
+    Stats are also accumulated in the default cache so that the
+    `site_query_report` management command can report on stats
+    collected by other processes. Each (view, label) has its own
+    counters updated with `cache.incr`, so concurrent workers do
+    not overwrite each other's totals. This requires a cache
+    backend shared by all processes, e.g. Redis or Memcached. With
+    the default LocMemCache, the report only sees the stats of
+    its own process.
+
+    Duration is accumulated in the cache in microseconds.
+
+    Within `recording()`, e.g. per request with
+    SiteQueryRecorderMiddleware, stats are collected in a local
+    dict and added to the cache once on exit. Otherwise, each call
+    is added to the cache as it is recorded.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stats: dict[tuple[str, str], QueryStats] = defaultdict(QueryStats)
+        self._cached_keys: set[str] = set()
+
+    def record(self, view: str, label: str, queries: int, duration: float) -> None:
+        with self._lock:
+            stats = self.stats[(view, label)]
+            stats.calls += 1
+            stats.queries += queries
+            stats.duration += duration
+        logger.debug(
+            "%s %s queries=%s duration=%.6f", view, label, queries, duration, stacklevel=3
+        )
+        key = f"{view}|{label}"
+        if (pending_stats := _pending_stats.get()) is not None:
+            calls, pending_queries, pending_duration = pending_stats.get(key, (0, 0, 0.0))
+            pending_stats[key] = (
+                calls + 1,
+                pending_queries + queries,
+                pending_duration + duration,
+            )
+        else:
+            self.flush({key: (1, queries, duration)})
+
+    @contextmanager
+    def recording(self) -> Iterator[None]:
+        """Context manager to collect stats for a block of work,
+        e.g. a request, and add them to the cache once on exit.
+        """
+        token = _pending_stats.set({})
+        try:
+            yield
+        finally:
+            pending_stats = _pending_stats.get()
+            _pending_stats.reset(token)
+            if pending_stats:
+                self.flush(pending_stats)
+
+    def flush(self, pending_stats: dict[str, tuple[int, int, float]]) -> None:
+        """Adds stats keyed by "view|label" to the cached counters."""
+        for key, (calls, queries, duration) in pending_stats.items():
+            try:
+                self.incr_cached_stats(key, calls, queries, duration)
+            except ValueError:
+                # counters not in the cache, e.g. reset by another process
+                self._cached_keys.discard(key)
+                self.incr_cached_stats(key, calls, queries, duration)
+
+    def incr_cached_stats(self, key: str, calls: int, queries: int, duration: float) -> None:
+        if key not in self._cached_keys:
+            self.add_cached_key(key)
+            self._cached_keys.add(key)
+        calls_key, queries_key, duration_key, _ = get_stats_cache_keys(key)
+        cache.incr(calls_key, calls)
+        cache.incr(queries_key, queries)
+        cache.incr(duration_key, round(duration * 1_000_000))
+
+    @staticmethod
+    def add_cached_key(key: str) -> None:
+        """Adds the counters for `key` to the cache, if not already
+        added, and appends `key` to the index of cached keys.
+        """
+        *counter_keys, marker_key = get_stats_cache_keys(key)
+        for counter_key in counter_keys:
+            cache.add(counter_key, 0, timeout=None)
+        if cache.add(marker_key, key, timeout=None):
+            cache.add(get_cache_key("count"), 0, timeout=None)
+            index = cache.incr(get_cache_key("count"))
+            cache.set(get_cache_key("index", str(index)), key, timeout=None)
+
+    @staticmethod
+    def get_cached_keys() -> list[str]:
+        count = cache.get(get_cache_key("count"), 0)
+        return list(
+            cache.get_many(
+                [get_cache_key("index", str(i)) for i in range(1, count + 1)]
+            ).values()
+        )
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stats.clear()
+        cache_keys = [get_cache_key("count")]
+        count = cache.get(get_cache_key("count"), 0)
+        for key in self.get_cached_keys():
+            cache_keys.extend(get_stats_cache_keys(key))
+        cache_keys.extend(get_cache_key("index", str(i)) for i in range(1, count + 1))
+        cache.delete_many(cache_keys)
+        self._cached_keys.clear()
+
+    def get_cached_stats(self) -> dict[tuple[str, str], QueryStats]:
+        stats = {}
+        for key in self.get_cached_keys():
+            counter_keys = get_stats_cache_keys(key)[:3]
+            values = cache.get_many(counter_keys)
+            calls, queries, duration = [values.get(k, 0) for k in counter_keys]
+            if calls:
+                stats[tuple(key.split("|", 1))] = QueryStats(
+                    calls, queries, duration / 1_000_000
+                )
+        return stats
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        return {
+            f"{view}|{label}": asdict(stats) for (view, label), stats in self.stats.items()
+        }
+
+
+site_query_recorder = SiteQueryRecorder()
+
+
+def get_view_name(obj: Any, request: Any) -> str:
+    if view_name := getattr(getattr(request, "resolver_match", None), "view_name", None):
+        return view_name
+    if opts := getattr(obj, "opts", None) or getattr(obj, "_meta", None):
+        return opts.label_lower
+    return obj.__class__.__name__
+
+
+def record_site_queries(label: str | None = None) -> Callable:
+    """Method decorator to record the queries run by the decorated
+    method if `settings.EDC_SITES_RECORD_QUERIES` is True.
+
+    The request is looked for in the arguments of the decorated
+    method to determine the view name.
+
+    Calls are recorded inclusively. That is, if a decorated method
+    calls another decorated method, the queries of the inner call
+    are counted for both.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def inner(obj, *args, **kwargs):
+            if not get_query_recorder_enabled():
+                return func(obj, *args, **kwargs)
+            request = kwargs.get("request") or next(
+                (arg for arg in args if hasattr(arg, "META")), None
+            )
+            query_counter = QueryCounter()
+            try:
+                with ExitStack() as stack:
+                    for connection in connections.all():
+                        stack.enter_context(connection.execute_wrapper(query_counter))
+                    return func(obj, *args, **kwargs)
+            finally:
+                site_query_recorder.record(
+                    get_view_name(obj, request),
+                    label or func.__qualname__,
+                    query_counter.queries,
+                    query_counter.duration,
+                )
+
+        return inner
+
+    return decorator
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import DEFAULT_DB_ALIAS
+
+from .utils import get_pinned_site
+
+if TYPE_CHECKING:
+    from django.db.models import Model, QuerySet
+
+__all__ = [
+    "SiteReplicaRouter",
+    "SiteShardRouter",
+    "fan_out",
+    "fan_out_count",
+    "get_replica_db_alias",
+    "is_site_model",
+    "use_replica_for_reads",
+]
+
+_use_replica: ContextVar[bool] = ContextVar("edc_sites_use_replica", default=False)
+
+
+def get_replica_db_alias() -> str | None:
+    """Returns the database alias of the read replica or None."""
+    return getattr(settings, "EDC_SITES_REPLICA_DB_ALIAS", None)
+
+
+@contextmanager
+def use_replica_for_reads() -> Iterator[None]:
+    """Context manager to route reads to the read replica for a
+    block of work, e.g. a cross-site report.
+
+    Requires `SiteReplicaRouter` in settings.DATABASE_ROUTERS.
+    See also SiteReplicaMiddleware.
+    """
+    token = _use_replica.set(True)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+class SiteReplicaRouter:
+    """A database router that sends reads to the database alias
+    in settings.EDC_SITES_REPLICA_DB_ALIAS within
+    `use_replica_for_reads`.
+
+    Writes are not routed. Reads that must see writes made in the
+    same block should not be made within `use_replica_for_reads`.
+    """
+
+    @staticmethod
+    def db_for_read(model, **hints) -> str | None:
+        if _use_replica.get():
+            return get_replica_db_alias()
+        return None
+
+    @staticmethod
+    def db_for_write(model, **hints) -> str | None:
+        return None
+
+    @staticmethod
+    def allow_relation(obj1, obj2, **hints) -> bool | None:
+        if (alias := get_replica_db_alias()) and {obj1._state.db, obj2._state.db} <= {
+            DEFAULT_DB_ALIAS,
+            alias,
+        }:
+            return True
+        return None
+
+    @staticmethod
+    def allow_migrate(db, app_label, model_name=None, **hints) -> bool | None:
+        if db == get_replica_db_alias():
+            return False
+        return None
+
+
+# apps with rows on every shard, see `sync_sites_to_shards`
+replicated_app_labels = ("auth", "contenttypes", "edc_sites", "sites")
+
+
+def get_sites():
+    from .site import sites  # prevent circular import
+
+    return sites
+
+
+def is_site_model(model: type[Model]) -> bool:
+    """Returns True if the model has a `site` foreign key
+    to sites.Site, e.g. a model declared with SiteModelMixin.
+    """
+    try:
+        field = model._meta.get_field("site")
+    except FieldDoesNotExist:
+        return False
+    return (
+        field.many_to_one
+        and field.related_model is not None
+        and field.related_model._meta.label_lower == "sites.site"
+    )
+
+
+class SiteShardRouter:
+    """A database router that routes reads and writes of site
+    models to the database alias of the site. See Sites.get_shard.
+
+    The site is taken from the `site_id` of the instance, if
+    given, otherwise from the pinned current site (see
+    `pin_current_site` and SiteContextMiddleware). If neither,
+    the model is not routed, i.e. `default`. Models without a
+    `site` foreign key are not routed.
+
+    Reads without a pinned site, e.g. a cross-site admin
+    changelist or report, go to `default` only and do not see
+    rows on other shards. Use `fan_out` / `fan_out_count` for
+    cross-site reads.
+
+    Site and SiteProfile rows are copied to each shard by
+    `add_or_update_django_sites`. Relations across databases are
+    only allowed to models replicated to every shard.
+
+    Django passes the instance only from `Model.save()` and
+    `Model.delete()`. Queryset writes, e.g. `objects.create()`,
+    `get_or_create()`, `bulk_create()`, `update()` and `delete()`,
+    are routed by the pinned site and ignore the `site_id` of the
+    rows. Outside of `pin_current_site`, use
+    `.using(sites.get_shard(site_id))` or `obj.save()`.
+
+    Each shard holds all tables. Use `fan_out` to read across
+    shards.
+    """
+
+    @staticmethod
+    def get_shard(model, **hints) -> str | None:
+        if not is_site_model(model):
+            return None
+        if (instance := hints.get("instance")) is not None and is_site_model(
+            instance.__class__
+        ):
+            site_id = instance.site_id
+        else:
+            site_id = getattr(get_pinned_site(), "id", None)
+        return get_sites().get_shard(site_id) if site_id else None
+
+    def db_for_read(self, model, **hints) -> str | None:
+        return self.get_shard(model, **hints)
+
+    def db_for_write(self, model, **hints) -> str | None:
+        return self.get_shard(model, **hints)
+
+    @staticmethod
+    def allow_relation(obj1, obj2, **hints) -> bool | None:
+        """Allows a relation on the same database or, across
+        shards, to a model replicated to every shard, e.g. Site.
+        """
+        if obj1._state.db == obj2._state.db:
+            return True
+        if (
+            obj1._meta.app_label in replicated_app_labels
+            or obj2._meta.app_label in replicated_app_labels
+        ) and {obj1._state.db, obj2._state.db} <= {DEFAULT_DB_ALIAS, *get_sites().shards}:
+            return True
+        return None
+
+    @staticmethod
+    def allow_migrate(db, app_label, model_name=None, **hints) -> bool | None:
+        return None
+
+
+def fan_out(
+    queryset: QuerySet,
+    key: Callable[[Model], Any] | None = None,
+    shards: list[str] | None = None,
+) -> Iterator[Model]:
+    """Returns an iterator over the rows of the queryset from each
+    shard. See SiteShardRouter.
+
+    Rows are in queryset order within each shard. If `key` is
+    given, rows are merged across shards in `key` order, where
+    `key` should agree with the queryset ordering.
+    """
+    querysets = [queryset.using(alias) for alias in shards or get_sites().shards]
+    if key:
+        return heapq.merge(*querysets, key=key)
+    return itertools.chain(*querysets)
+
+
+def fan_out_count(queryset: QuerySet, shards: list[str] | None = None) -> int:
+    """Returns the sum of `count()` of the queryset on each shard."""
+    return sum(queryset.using(alias).count() for alias in shards or get_sites().shards)
@@ -0,0 +1,108 @@
+from functools import partial
+
+from django.apps import apps as django_apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+
+from .utils.add_or_update_django_sites import sites_sync_in_progress
+from .utils.get_site_counts import update_site_count
+from .utils.get_site_model_cls import get_site_model_cls
+
+
+def get_site_counts_models() -> list[str]:
+    return getattr(settings, "EDC_SITES_SITE_COUNTS_MODELS", [])
+
+
+# instance attribute holding the site_id as loaded or last saved
+site_counts_site_id_attr = "_site_counts_site_id"
+
+
+def update_site_count_on_commit(sender, site_id: int, delta: int, using: str) -> None:
+    """Updates the cached count once the transaction commits. If
+    the transaction is rolled back, the cached count is unchanged.
+    """
+    transaction.on_commit(partial(update_site_count, sender, site_id, delta), using=using)
+
+
+def update_site_counts_on_post_init(sender, instance, **kwargs):
+    # skip if deferred to avoid a query
+    if "site_id" in instance.__dict__:
+        setattr(instance, site_counts_site_id_attr, instance.site_id)
+
+
+def update_site_counts_on_post_save(sender, instance, raw, created, using, **kwargs):
+    if raw:
+        return
+    original_site_id = getattr(instance, site_counts_site_id_attr, None)
+    if created:
+        update_site_count_on_commit(sender, instance.site_id, 1, using)
+    elif original_site_id is not None and original_site_id != instance.site_id:
+        update_site_count_on_commit(sender, original_site_id, -1, using)
+        update_site_count_on_commit(sender, instance.site_id, 1, using)
+    setattr(instance, site_counts_site_id_attr, instance.site_id)
+
+
+def update_site_counts_on_post_delete(sender, instance, using, **kwargs):
+    update_site_count_on_commit(sender, instance.site_id, -1, using)
+
+
+def invalidate_sites_fingerprint(sender, instance, using=None, **kwargs):
+    if sites_sync_in_progress():
+        return
+    django_apps.get_model("edc_sites.sitesfingerprint").objects.using(using).all().delete()
+
+
+def connect_sites_fingerprint_receivers() -> None:
+    """Connects receivers to delete the stored sites fingerprint
+    if a Site or SiteProfile is saved or deleted outside of
+    `add_or_update_django_sites`, e.g. in the admin.
+
+    Skipped within the sync, which stores the fingerprint once
+    its writes are done. Changes made in SQL, bypassing the ORM, are not
+    detected. See also `sites_check`.
+    """
+    for model_cls in [get_site_model_cls(), django_apps.get_model("edc_sites.siteprofile")]:
+        label_lower = model_cls._meta.label_lower
+        post_save.connect(
+            invalidate_sites_fingerprint,
+            sender=model_cls,
+            dispatch_uid=f"invalidate_sites_fingerprint_on_post_save.{label_lower}",
+        )
+        post_delete.connect(
+            invalidate_sites_fingerprint,
+            sender=model_cls,
+            dispatch_uid=f"invalidate_sites_fingerprint_on_post_delete.{label_lower}",
+        )
+
+
+def connect_site_counts_receivers() -> None:
+    """Connects receivers to update cached site counts for the
+    models in `settings.EDC_SITES_SITE_COUNTS_MODELS`.
+
+    Receivers are connected per model. A post_delete receiver
+    prevents Django from fast-deleting rows of that model.
+
+    Counts are updated when the transaction commits. A save that
+    moves a row to another site is counted unless `site_id` was
+    deferred when the instance was loaded. Queryset
+    `update()` and bulk operations do not send signals and are
+    only reflected once the cached counts expire.
+    """
+    for label_lower in get_site_counts_models():
+        model_cls = django_apps.get_model(label_lower)
+        post_init.connect(
+            update_site_counts_on_post_init,
+            sender=model_cls,
+            dispatch_uid=f"update_site_counts_on_post_init.{label_lower}",
+        )
+        post_save.connect(
+            update_site_counts_on_post_save,
+            sender=model_cls,
+            dispatch_uid=f"update_site_counts_on_post_save.{label_lower}",
+        )
+        post_delete.connect(
+            update_site_counts_on_post_delete,
+            sender=model_cls,
+            dispatch_uid=f"update_site_counts_on_post_delete.{label_lower}",
+        )
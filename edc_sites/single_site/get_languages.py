@@ -5,9 +5,10 @@ class SiteLanguagesError(Exception):
     pass
 
 
-def get_languages(language_codes: list[str], site_id: int) -> dict[str, str]:
-    defined_languages = get_languages_from_settings()
+def validate_language_codes(language_codes: list[str], site_id: int) -> None:
+    """Raises if a language code is not defined in settings.LANGUAGES."""
     if language_codes:
+        defined_languages = get_languages_from_settings()
         if unknown_language_codes := [c for c in language_codes if c not in defined_languages]:
             raise SiteLanguagesError(
                 "Unknown language code(s) associated with site. Language code must be "
@@ -15,7 +16,13 @@ def get_languages(language_codes: list[str], site_id: int) -> dict[str, str]:
                 f"Expected one of {list(defined_languages.keys())}. "
                 f"Got {unknown_language_codes} for site `{site_id}`."
             )
+
+
+def get_languages(language_codes: list[str], site_id: int) -> dict[str, str]:
+    defined_languages = get_languages_from_settings()
+    validate_language_codes(language_codes, site_id)
+    if language_codes:
         languages = {code: defined_languages[code] for code in language_codes}
     else:
-        languages = defined_languages
+        languages = dict(defined_languages)
     return languages
@@ -1,12 +1,33 @@
+from typing import Any
+
 from django.conf import settings
+from django.core.signals import setting_changed
+
+_cache: dict[str, Any] = {}
 
 
 def get_languages_from_settings() -> dict[str, str]:
     """Returns a dictionary of language codes mapped to language names,
     for all languages defined in settings.LANGUAGES.
+
+    The dictionary is cached for as long as settings.LANGUAGES is the
+    same object. Do not modify the returned dictionary.
     """
-    try:
-        lang_iterator = settings.LANGUAGES.items()
-    except AttributeError:
-        lang_iterator = settings.LANGUAGES
-    return {k: v for k, v in lang_iterator}
+    languages = settings.LANGUAGES
+    if "languages" not in _cache or _cache["settings_languages"] is not languages:
+        try:
+            lang_iterator = languages.items()
+        except AttributeError:
+            lang_iterator = languages
+        _cache.update(settings_languages=languages, languages={k: v for k, v in lang_iterator})
+    return _cache["languages"]
+
+
+def clear_languages_cache(setting: str | None = None, **kwargs) -> None:
+    if setting is None or setting == "LANGUAGES":
+        _cache.clear()
+
+
+setting_changed.connect(
+    clear_languages_cache, dispatch_uid="edc_sites.single_site.clear_languages_cache"
+)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import KW_ONLY, dataclass, field
 
-from .get_languages import get_languages
+from .get_languages import get_languages, validate_language_codes
 
 
 class SiteDomainRequiredError(Exception):
@@ -23,12 +23,45 @@ class SingleSite:
     country: str | None = None
     country_code: str | None = field(default=None, repr=False)
     title: str | None = field(default=None, repr=False)
-    languages: dict[str, str] = field(init=False, repr=False)
+    region: str | None = field(default=None, repr=False)
+    cluster: str | None = field(default=None, repr=False)
+    shard: str | None = field(default=None, repr=False)
     description: str = field(init=False)
+    _languages: dict[str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
-        self.languages = get_languages(self.language_codes, self.site_id)
+        validate_language_codes(self.language_codes, self.site_id)
         self.description = (self.title or self.name).title()
 
     def __str__(self):
         return str(self.domain)
+
+    @property
+    def group_names(self) -> list[str]:
+        """Returns the names of the groups this site belongs to in
+        the hierarchy country -> region -> cluster.
+
+        For example, ["botswana", "botswana.south",
+        "botswana.south.gaborone"].
+        """
+        group_names = []
+        path = []
+        for value in [self.country, self.region, self.cluster]:
+            if not value:
+                break
+            path.append(value)
+            group_names.append(".".join(path))
+        return group_names
+
+    @property
+    def languages(self) -> dict[str, str]:
+        """Returns a dictionary of language codes mapped to language
+        names for this site.
+
+        Evaluated on first access.
+        """
+        if self._languages is None:
+            self._languages = get_languages(self.language_codes, self.site_id)
+        return self._languages
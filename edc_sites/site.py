@@ -3,14 +3,17 @@ from __future__ import annotations
 import dataclasses
 import sys
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterable
 
+from asgiref.sync import sync_to_async
 from django.apps import apps as django_apps
 from django.conf import settings
 from django.contrib import messages
+from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.handlers.wsgi import WSGIRequest as BaseWSGIRequest
 from django.core.management.color import color_style
+from django.db import DEFAULT_DB_ALIAS
 from django.utils.module_loading import import_module, module_has_submodule
 from edc_auth.utils import user_has_change_perms
 from edc_constants.constants import OTHER
@@ -18,7 +21,12 @@ from edc_model_admin.utils import add_to_messages_once
 
 from .exceptions import InvalidSiteForUser
 from .single_site import SingleSite
+from .site_id_set import SiteIdSet, SiteOrdinals
 from .utils import (
+    aget_current_site_obj,
+    ahas_profile_or_raise,
+    get_current_site_obj,
+    get_fingerprint,
     get_message_text,
     get_site_model_cls,
     has_profile_or_raise,
@@ -33,6 +41,13 @@ if TYPE_CHECKING:
         site: Site
 
 
+async def arequest_user(request: WSGIRequest) -> User:
+    """Returns request.user without a synchronous lazy lookup."""
+    if auser := getattr(request, "auser", None):
+        return await auser()
+    return request.user
+
+
 class SiteDoesNotExist(Exception):
     pass
 
@@ -63,6 +78,9 @@ class SitesError(Exception):
 
 app_name: str = getattr(settings, "APP_NAME", "edc")
 
+# attribute on the user instance, see get_user_access_cache
+user_access_cache_attr = "_edc_sites_access_cache"
+
 
 def get_register_default_site() -> bool:
     return getattr(settings, "EDC_SITES_REGISTER_DEFAULT", False)
@@ -88,12 +106,49 @@ def get_autodiscover_sites():
     return getattr(settings, "EDC_SITES_AUTODISCOVER_SITES", True)
 
 
+def get_shards() -> dict[str, str]:
+    """Returns a dictionary of country mapped to database alias.
+
+    See also SingleSite.shard and SiteShardRouter.
+    """
+    return getattr(settings, "EDC_SITES_SHARDS", {})
+
+
+def get_user_access_cache(user: User) -> dict:
+    """Returns a dict cached on the user instance for the site
+    access resolved for the user, e.g. for the duration of a
+    request for `request.user`.
+
+    Like Django's permission cache, it is not invalidated if the
+    user's profile or groups change. Re-fetch the user instead.
+    """
+    if (user_access_cache := getattr(user, user_access_cache_attr, None)) is None:
+        user_access_cache = {}
+        setattr(user, user_access_cache_attr, user_access_cache)
+    return user_access_cache
+
+
+def get_group_access_prefix() -> str | None:
+    """Returns the prefix of auth Group names that grant view access
+    to a group of sites, e.g. "SITES:" for "SITES:botswana.south".
+
+    If None, access is not granted by group.
+    """
+    return getattr(settings, "EDC_SITES_GROUP_ACCESS_PREFIX", None)
+
+
 class Sites:
     uat_subdomain = "uat"
 
     def __init__(self):
         self.loaded = False
         self._registry = {}
+        self._fingerprint: tuple[int, int, str] | None = None
+        self._site_ids_by_country: dict[str, list[int]] = {}
+        self._groups: dict[str, tuple[list[int], list[str]]] = {}
+        self._site_ids_by_group: dict[str, frozenset[int]] = {}
+        self._group_names_by_site: dict[int, list[str]] = {}
+        self._ordinals = SiteOrdinals([])
         if get_register_default_site():
             self.loaded = True
             site_id = int(settings.SITE_ID)
@@ -107,6 +162,7 @@ class Sites:
                     title="what a site",
                 )
             }
+            self.update_indexes()
 
     def __repr__(self):
         return f"{self.__class__}(loaded={self.loaded})"
@@ -128,12 +184,14 @@ class Sites:
                 except ObjectDoesNotExist:
                     break
             get_site_model_cls().objects.all().delete()
+            django_apps.get_model("edc_sites.sitesfingerprint").objects.all().delete()
         self.__init__()
 
     def register(self, *single_sites: SingleSite):
         if not self.loaded:
             self._registry = {}
             self.loaded = True
+        self._fingerprint = None
         if "makemigrations" not in sys.argv:
             for single_site in single_sites:
                 if get_insert_uat_subdomain():
@@ -151,6 +209,85 @@ class Sites:
                         f"Site with this domain is already registered. Got `{single_site}`."
                     )
                 self._registry.update({single_site.site_id: single_site})
+            self.update_indexes()
+
+    def update_indexes(self) -> None:
+        """Updates the lookups precomputed from the registry.
+
+        Called by `register` and `register_group`. Call directly if
+        you manipulate the registry.
+        """
+        site_ids_by_country = {}
+        site_ids_by_group = {}
+        for single_site in self._registry.values():
+            site_ids_by_country.setdefault(single_site.country, []).append(single_site.site_id)
+            for group_name in single_site.group_names:
+                site_ids_by_group.setdefault(group_name, set()).add(single_site.site_id)
+        for group_name, (site_ids, group_names) in self._groups.items():
+            members = site_ids_by_group.setdefault(group_name, set())
+            members.update(site_id for site_id in site_ids if site_id in self._registry)
+            for name in group_names:
+                members.update(site_ids_by_group.get(name, []))
+        group_names_by_site = {}
+        for group_name, members in site_ids_by_group.items():
+            for site_id in members:
+                group_names_by_site.setdefault(site_id, []).append(group_name)
+        self._site_ids_by_country = site_ids_by_country
+        self._site_ids_by_group = {k: frozenset(v) for k, v in site_ids_by_group.items()}
+        self._group_names_by_site = group_names_by_site
+        self._ordinals = SiteOrdinals(self._registry)
+
+    def register_group(
+        self,
+        name: str,
+        site_ids: list[int] | None = None,
+        group_names: list[str] | None = None,
+    ) -> None:
+        """Registers a named group of sites in addition to the
+        country -> region -> cluster groups of SingleSite.
+
+        Members are the given site ids plus the sites of the given
+        groups. Groups may only include groups registered before them.
+        Site ids not in the registry are ignored.
+        """
+        if name in self._groups:
+            raise AlreadyRegistered(f"Site group already registered. Got `{name}`.")
+        self._groups.update({name: (list(site_ids or []), list(group_names or []))})
+        self.update_indexes()
+
+    @property
+    def group_names(self) -> list[str]:
+        return sorted(self._site_ids_by_group)
+
+    def get_site_ids_for_group(self, name: str) -> list[int]:
+        """Returns a sorted list of site ids for this group and
+        its descendants.
+
+        Read from an index updated when sites are registered.
+        """
+        return sorted(self._site_ids_by_group.get(name, []))
+
+    def get_site_ids_for_groups(self, *names: str) -> list[int]:
+        site_ids = set()
+        for name in names:
+            site_ids.update(self._site_ids_by_group.get(name, []))
+        return sorted(site_ids)
+
+    @property
+    def ordinals(self) -> SiteOrdinals:
+        """Returns the dense ordinals of the registered site ids."""
+        return self._ordinals
+
+    def get_site_id_set(self, site_ids: Iterable[int]) -> SiteIdSet:
+        """Returns a SiteIdSet of the given site ids."""
+        return SiteIdSet(site_ids, ordinals=self._ordinals)
+
+    def get_site_id_set_for_group(self, name: str) -> SiteIdSet:
+        return self.get_site_id_set(self._site_ids_by_group.get(name, []))
+
+    def get_group_names_for_site(self, site_id: int) -> list[str]:
+        """Returns the names of all groups that include this site."""
+        return list(self._group_names_by_site.get(site_id, []))
 
     def get(self, site_id: int) -> SingleSite:
         """Returns a SingleSite instance for this site_id or
@@ -184,10 +321,64 @@ class Sites:
             return list(self._registry.values())
         return self._registry
 
+    @property
+    def fingerprint(self) -> str:
+        """Returns a fingerprint of the registered sites.
+
+        The fingerprint is recalculated only if the registry
+        has changed.
+        """
+        key = (id(self._registry), len(self._registry))
+        if not self._fingerprint or self._fingerprint[:2] != key:
+            self._fingerprint = (*key, get_fingerprint(self._registry.values()))
+        return self._fingerprint[2]
+
+    def fingerprint_matches_db(self) -> bool:
+        """Returns True if the fingerprint stored when the Site /
+        SiteProfile tables were last synced matches the fingerprint
+        of the registry.
+
+        Costs a single query. Cheap enough to call per request
+        in DEBUG or periodically in long-running workers.
+        """
+        stored_fingerprint = (
+            django_apps.get_model("edc_sites.sitesfingerprint")
+            .objects.filter(pk=1)
+            .values_list("fingerprint", flat=True)
+            .first()
+        )
+        return stored_fingerprint == self.fingerprint
+
     @property
     def countries(self) -> list[str]:
         return list(set([single_site.country for single_site in self._registry.values()]))
 
+    def get_site_ids_by_country(self, country: str) -> list[int]:
+        """Returns a list of site ids for this country.
+
+        Read from an index updated when sites are registered.
+        """
+        return list(self._site_ids_by_country.get(country, []))
+
+    def get_shard(self, site_id: int) -> str | None:
+        """Returns the database alias for this site from
+        SingleSite.shard or, if not set, settings.EDC_SITES_SHARDS.
+
+        Returns None if the site is not registered or not sharded.
+        """
+        if not (single_site := self._registry.get(site_id)):
+            return None
+        return single_site.shard or get_shards().get(single_site.country)
+
+    @property
+    def shards(self) -> list[str]:
+        """Returns a sorted list of the database aliases of the
+        registered sites.
+        """
+        return sorted(
+            {self.get_shard(site_id) or DEFAULT_DB_ALIAS for site_id in self._registry}
+        )
+
     def get_by_country(
         self, country: str, aslist: bool | None = None
     ) -> dict[int, SingleSite] | list[SingleSite]:
@@ -220,6 +411,19 @@ class Sites:
             request=request, user=user, site_id=site_id
         )
 
+    def get_site_id_set_for_user(
+        self,
+        request: WSGIRequest | None = None,
+        user: User | None = None,
+        site_id: int | None = None,
+    ) -> SiteIdSet:
+        """Returns the site ids from `get_site_ids_for_user` as a
+        SiteIdSet, e.g. for membership checks in a loop.
+        """
+        return self.get_site_id_set(
+            self.get_site_ids_for_user(request=request, user=user, site_id=site_id)
+        )
+
     @staticmethod
     def get_view_only_site_ids_for_user(
         request: WSGIRequest | None = None,
@@ -232,29 +436,40 @@ class Sites:
         Checks for userprofile.is_multisite_viewer and
         confirms user does not have `add`, `change` or `delete`
         perms to any resources.
+
+        Includes sites granted by group (see
+        `get_site_ids_for_user_groups`).
+
+        Access is resolved once per user instance and site, e.g.
+        once per request for `request.user`, and cached on the
+        user instance (see `get_user_access_cache`).
         """
         if request:
             user = request.user
             site_id = request.site.id
         site_id = sites.get(site_id).site_id
-        has_profile_or_raise(user)
-        sites.site_in_profile_or_raise(user=user, site_id=site_id)
-        # now check for special view codename from user account
-        site_ids = []
-        if user.userprofile.is_multisite_viewer:
-            if user_has_change_perms(user=user):
-                if request:
-                    add_to_messages_once(
-                        request,
-                        messages.ERROR,
-                        get_message_text(messages.ERROR),
-                    )
-            else:
-                site_ids = [s.id for s in user.userprofile.sites.all() if s.id != site_id]
-                if request:
-                    add_to_messages_once(
-                        request, messages.WARNING, get_message_text(messages.WARNING)
+        cache_key = ("view_only_site_ids", site_id, get_group_access_prefix())
+        user_access_cache = get_user_access_cache(user)
+        if cache_key not in user_access_cache:
+            has_profile_or_raise(user)
+            sites.site_in_profile_or_raise(user=user, site_id=site_id)
+            # now check for special view codename from user account
+            site_ids, level = [], None
+            if user.userprofile.is_multisite_viewer:
+                if user_has_change_perms(user=user):
+                    level = messages.ERROR
+                else:
+                    level = messages.WARNING
+                    site_ids = [s.id for s in user.userprofile.sites.all() if s.id != site_id]
+                    site_ids.extend(
+                        s
+                        for s in sites.get_site_ids_for_user_groups(user)
+                        if s != site_id and s not in site_ids
                     )
+            user_access_cache[cache_key] = (site_ids, level)
+        site_ids, level = user_access_cache[cache_key]
+        if request and level:
+            add_to_messages_once(request, level, get_message_text(level))
         # else:
         #     if self.has_viewallsites_permission(request):
         #         site_ids = [
@@ -263,7 +478,103 @@ class Sites:
         #             if s.id != request.site.id
         #         ]
 
-        return site_ids
+        return list(site_ids)
+
+    async def aget_site_ids_for_user(
+        self,
+        request: WSGIRequest | None = None,
+        user: User | None = None,
+        site_id: int | None = None,
+    ) -> list[int]:
+        """Async version of `get_site_ids_for_user`."""
+        if request:
+            user = await arequest_user(request)
+            site_id = request.site.id
+        return [site_id] + await self.aget_view_only_site_ids_for_user(
+            request=request, user=user, site_id=site_id
+        )
+
+    @staticmethod
+    async def aget_view_only_site_ids_for_user(
+        request: WSGIRequest | None = None,
+        user: User | None = None,
+        site_id: int | None = None,
+    ) -> list[int]:
+        """Async version of `get_view_only_site_ids_for_user`.
+
+        Calls to edc_auth and to the messages framework are run
+        with `sync_to_async`.
+        """
+        if request:
+            user = await arequest_user(request)
+            site_id = request.site.id
+        site_id = sites.get(site_id).site_id
+        cache_key = ("view_only_site_ids", site_id, get_group_access_prefix())
+        user_access_cache = get_user_access_cache(user)
+        if cache_key not in user_access_cache:
+            await ahas_profile_or_raise(user)
+            await sites.asite_in_profile_or_raise(user=user, site_id=site_id)
+            userprofile_model_cls = user._meta.get_field("userprofile").related_model
+            userprofile = await userprofile_model_cls.objects.aget(user_id=user.id)
+            site_ids, level = [], None
+            if userprofile.is_multisite_viewer:
+                if await sync_to_async(user_has_change_perms)(user=user):
+                    level = messages.ERROR
+                else:
+                    level = messages.WARNING
+                    site_ids = [
+                        pk
+                        async for pk in userprofile.sites.values_list("id", flat=True)
+                        if pk != site_id
+                    ]
+                    site_ids.extend(
+                        s
+                        for s in await sites.aget_site_ids_for_user_groups(user)
+                        if s != site_id and s not in site_ids
+                    )
+            user_access_cache[cache_key] = (site_ids, level)
+        site_ids, level = user_access_cache[cache_key]
+        if request and level:
+            await sync_to_async(add_to_messages_once)(request, level, get_message_text(level))
+        return list(site_ids)
+
+    def get_site_ids_for_user_groups(self, user: User) -> list[int]:
+        """Returns a sorted list of site ids granted by the user's
+        auth Groups named with the EDC_SITES_GROUP_ACCESS_PREFIX,
+        e.g. "SITES:botswana.south".
+
+        Site ids are read from the group index, not from the DB.
+        The user's group names are queried once per user instance
+        and cached on the instance.
+        """
+        if not (prefix := get_group_access_prefix()):
+            return []
+        cache_key = ("group_names", prefix)
+        user_access_cache = get_user_access_cache(user)
+        if cache_key not in user_access_cache:
+            user_access_cache[cache_key] = list(
+                user.groups.filter(name__startswith=prefix).values_list("name", flat=True)
+            )
+        return self.get_site_ids_for_groups(
+            *[name[len(prefix) :] for name in user_access_cache[cache_key]]
+        )
+
+    async def aget_site_ids_for_user_groups(self, user: User) -> list[int]:
+        """Async version of `get_site_ids_for_user_groups`."""
+        if not (prefix := get_group_access_prefix()):
+            return []
+        cache_key = ("group_names", prefix)
+        user_access_cache = get_user_access_cache(user)
+        if cache_key not in user_access_cache:
+            user_access_cache[cache_key] = [
+                name
+                async for name in user.groups.filter(name__startswith=prefix).values_list(
+                    "name", flat=True
+                )
+            ]
+        return self.get_site_ids_for_groups(
+            *[name[len(prefix) :] for name in user_access_cache[cache_key]]
+        )
 
     def user_may_view_other_sites(
         self,
@@ -290,6 +601,19 @@ class Sites:
                 f"Got {site_id}."
             )
 
+    @staticmethod
+    async def asite_in_profile_or_raise(user: User, site_id: int) -> None:
+        """Async version of `site_in_profile_or_raise`."""
+        if not await (
+            get_user_model()
+            .objects.filter(id=user.id, userprofile__sites__id=site_id)
+            .aexists()
+        ):
+            raise InvalidSiteForUser(
+                "User is not configured to access this site. See also UserProfile. "
+                f"Got {site_id}."
+            )
+
     def get_language_choices_tuple(
         self, site: Site | None = None, site_id: int | None = None, other=None
     ) -> tuple | None:
@@ -300,21 +624,21 @@ class Sites:
         """
         site_id = getattr(site, "id", site_id)
         single_site = self.get(site_id)
-        languages = single_site.languages
+        languages = dict(single_site.languages)
         if other:
             languages.update({OTHER: "Other"})
         return tuple((k, v) for k, v in languages.items())
 
     @staticmethod
     def get_current_site_obj(request: WSGIRequest | None = None) -> Site:
-        if request:
-            return request.site
-        return get_site_model_cls().objects.get_current()
+        return get_current_site_obj(request)
 
     def get_current_site(self, request: WSGIRequest | None = None) -> SingleSite:
-        if request:
-            return self.get(request.site.id)
-        return self.get(get_site_model_cls().objects.get_current().id)
+        return self.get(get_current_site_obj(request).id)
+
+    async def aget_current_site(self, request: WSGIRequest | None = None) -> SingleSite:
+        """Async version of `get_current_site`."""
+        return self.get((await aget_current_site_obj(request)).id)
 
     def get_current_country(self, request: WSGIRequest | None = None) -> str:
         single_site = self.get_current_site(request)
@@ -334,6 +658,7 @@ class Sites:
                 mod = import_module(app)
                 try:
                     before_import_registry = deepcopy(sites._registry)
+                    before_import_groups = deepcopy(sites._groups)
                     import_module(f"{app}.{module_name}")
                     writer(f"   - registered '{module_name}' from '{app}'\n")
                 except SitesError as e:
@@ -341,6 +666,8 @@ class Sites:
                     writer(style.ERROR(f"ERROR! {e}\n"))
                 except ImportError as e:
                     sites._registry = before_import_registry
+                    sites._groups = before_import_groups
+                    sites.update_indexes()
                     if module_has_submodule(mod, module_name):
                         raise SitesError(str(e))
             except ImportError:
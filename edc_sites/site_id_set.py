@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from django.db.models import Q
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+__all__ = ["SiteIdSet", "SiteOrdinals"]
+
+
+class SiteOrdinals:
+    """Maps each registered site id to a dense ordinal, 0 to n-1,
+    in ascending order of site id.
+
+    Built by the `sites` registry when sites are registered.
+    """
+
+    __slots__ = ("site_ids", "index")
+
+    def __init__(self, site_ids: Iterable[int]):
+        self.site_ids: tuple[int, ...] = tuple(sorted(site_ids))
+        self.index: dict[int, int] = {site_id: i for i, site_id in enumerate(self.site_ids)}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self.site_ids)})"
+
+    def __len__(self):
+        return len(self.site_ids)
+
+
+class SiteIdSet:
+    """An immutable set of site ids encoded as a bitset over the
+    ordinals of the registered sites.
+
+    Membership, union, intersection and difference are O(1) for
+    registered sites. Site ids without an ordinal (e.g. a Site
+    in the DB but not in the registry) are kept in a frozenset.
+
+    Usage:
+        site_id_set = sites.get_site_id_set_for_user(request=request)
+        if obj.site_id in site_id_set:
+            ...
+        queryset = site_id_set.filter(queryset)
+    """
+
+    __slots__ = ("ordinals", "bits", "others")
+
+    def __init__(
+        self,
+        site_ids: Iterable[int] | None = None,
+        ordinals: SiteOrdinals | None = None,
+        bits: int | None = None,
+        others: frozenset[int] | None = None,
+    ):
+        self.ordinals = ordinals or SiteOrdinals([])
+        self.bits = bits or 0
+        others = set(others or [])
+        for site_id in site_ids or []:
+            if (ordinal := self.ordinals.index.get(site_id)) is None:
+                others.add(site_id)
+            else:
+                self.bits |= 1 << ordinal
+        self.others = frozenset(others)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.to_list()})"
+
+    def __contains__(self, site_id: int) -> bool:
+        if (ordinal := self.ordinals.index.get(site_id)) is None:
+            return site_id in self.others
+        return bool(self.bits >> ordinal & 1)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.to_list())
+
+    def __len__(self) -> int:
+        return self.bits.bit_count() + len(self.others)
+
+    def __bool__(self) -> bool:
+        return bool(self.bits or self.others)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, SiteIdSet):
+            if other.ordinals is self.ordinals:
+                return (self.bits, self.others) == (other.bits, other.others)
+            return self.to_list() == other.to_list()
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.to_list()))
+
+    def __or__(self, other: SiteIdSet) -> SiteIdSet:
+        other = self._coerce(other)
+        return self._new(self.bits | other.bits, self.others | other.others)
+
+    def __and__(self, other: SiteIdSet) -> SiteIdSet:
+        other = self._coerce(other)
+        return self._new(self.bits & other.bits, self.others & other.others)
+
+    def __sub__(self, other: SiteIdSet) -> SiteIdSet:
+        other = self._coerce(other)
+        return self._new(self.bits & ~other.bits, self.others - other.others)
+
+    def _new(self, bits: int, others: frozenset[int]) -> SiteIdSet:
+        return self.__class__(ordinals=self.ordinals, bits=bits, others=others)
+
+    def _coerce(self, other: SiteIdSet | Iterable[int]) -> SiteIdSet:
+        """Returns `other` as a SiteIdSet on the same ordinals."""
+        if isinstance(other, SiteIdSet) and other.ordinals is self.ordinals:
+            return other
+        return self.__class__(site_ids=other, ordinals=self.ordinals)
+
+    def to_list(self) -> list[int]:
+        """Returns a sorted list of site ids."""
+        bits = self.bits
+        site_ids = list(self.others)
+        while bits:
+            lowest = bits & -bits
+            site_ids.append(self.ordinals.site_ids[lowest.bit_length() - 1])
+            bits ^= lowest
+        return sorted(site_ids)
+
+    def as_q(self, lookup: str | None = None) -> Q:
+        """Returns a Q object to filter a queryset by these site ids."""
+        return Q(**{f"{lookup or 'site_id'}__in": self.to_list()})
+
+    def filter(self, queryset: QuerySet, lookup: str | None = None) -> QuerySet:
+        return queryset.filter(self.as_q(lookup))
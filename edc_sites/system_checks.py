@@ -2,7 +2,7 @@ import json
 import sys
 
 from django.core.checks import Error
-from django.db import OperationalError
+from django.db import DatabaseError
 
 from edc_sites.single_site import SingleSite
 from edc_sites.site import SitesCheckError
@@ -15,7 +15,7 @@ def sites_check(app_configs, **kwargs):  # noqa
     if "migrate" not in sys.argv and "makemigrations" not in sys.argv:
         try:
             compare_single_sites_with_db()
-        except (SitesCheckError, OperationalError) as e:
+        except (SitesCheckError, DatabaseError) as e:
             errors.append(
                 Error(
                     e,
@@ -36,7 +36,18 @@ def sites_check(app_configs, **kwargs):  # noqa
 
 
 def compare_single_sites_with_db():
-    """Checks the Site / SiteProfile tables are in sync"""
+    """Checks the Site / SiteProfile tables are in sync.
+
+    Compares the fingerprint stored at the last sync with that of
+    the registry first. Only if the fingerprints differ are the
+    sites compared one by one to find the difference.
+
+    The stored fingerprint is deleted if a Site or SiteProfile is
+    saved or deleted through the ORM (see `signals.py`). Changes
+    made in SQL are not detected while the fingerprints match.
+    """
+    if site_sites.all() and site_sites.fingerprint_matches_db():
+        return
     if not get_site_model_cls().objects.all().exists():
         raise SitesCheckError("No sites have been imported. You need to run migrate")
     ids1 = sorted(list(site_sites.all()))
@@ -46,8 +57,11 @@ def compare_single_sites_with_db():
             f"Site table is out of sync. Got registered sites = {ids1}. "
             f"Sites in Sites model = {ids2}. Try running migrate."
         )
+    site_objs = {
+        obj.id: obj for obj in get_site_model_cls().objects.select_related("siteprofile")
+    }
     for site_id, single_site in site_sites.all().items():
-        site_obj = get_site_model_cls().objects.get(id=site_id)
+        site_obj = site_objs[site_id]
         match_name_and_domain_or_raise(single_site, site_obj)
         match_country_and_country_code_or_raise(single_site, site_obj)
         match_languages_or_raise(single_site, site_obj)
@@ -1,10 +1,10 @@
 from django import template
 
-from ..site import sites
+from ..context_processors import get_site_context
 
 register = template.Library()
 
 
 @register.filter(name="country")
 def country(request):
-    return sites.get_current_country(request)
+    return get_site_context(request).country
@@ -0,0 +1,48 @@
+from django.contrib.auth.models import User
+from django.contrib.sites.models import Site
+from django.test import Client
+from django.test.utils import override_settings
+from multisite import SiteID
+
+from edc_sites.site import sites
+from edc_sites.utils import add_or_update_django_sites
+
+from ..models import TestModelWithSite
+from ..sites import sites as default_sites
+from .benchmark_test_case import BenchmarkTestCase
+
+row_counts = [10, 100, 1000]
+
+
+@override_settings(
+    SITE_ID=SiteID(default=10),
+    EDC_SITES_UAT_DOMAIN=False,
+    EDC_AUTH_SKIP_SITE_AUTHS=True,
+    EDC_AUTH_SKIP_AUTH_UPDATER=True,
+)
+class BenchAdmin(BenchmarkTestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*default_sites)
+        add_or_update_django_sites()
+        self.user = User.objects.create_superuser("user_login", "u@example.com", "pass")
+        self.user.userprofile.sites.add(Site.objects.get(id=10))
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def tearDown(self) -> None:
+        sites.initialize()
+
+    def test_changelist(self):
+        site = Site.objects.get(id=10)
+        for count in row_counts:
+            TestModelWithSite.objects.all().delete()
+            TestModelWithSite.objects.bulk_create(
+                [TestModelWithSite(site=site) for _ in range(count)]
+            )
+            self.benchmark(
+                f"admin.changelist[{count}]",
+                lambda: self.assertEqual(
+                    self.client.get("/admin/tests/testmodelwithsite/").status_code, 200
+                ),
+            )
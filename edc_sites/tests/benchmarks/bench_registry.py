@@ -0,0 +1,51 @@
+from django.contrib.auth.models import User
+from django.contrib.sites.models import Site
+from django.test.utils import override_settings
+
+from edc_sites.site import sites
+from edc_sites.utils import add_or_update_django_sites
+
+from .benchmark_test_case import BenchmarkTestCase, sites_factory
+
+site_counts = [10, 100, 1000]
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False, EDC_AUTH_SKIP_SITE_AUTHS=True)
+class BenchRegistry(BenchmarkTestCase):
+    def tearDown(self) -> None:
+        sites.initialize()
+
+    def test_register(self):
+        for count in site_counts:
+            single_sites = sites_factory(count)
+            self.benchmark(
+                f"registry.register[{count}]",
+                lambda: sites.register(*single_sites),
+                setup=sites.initialize,
+                max_queries=0,
+            )
+
+    def test_autodiscover(self):
+        for count in site_counts:
+            sites.initialize()
+            sites.register(*sites_factory(count))
+            self.benchmark(
+                f"registry.autodiscover[{count}]",
+                lambda: sites.autodiscover(verbose=False),
+                max_queries=0,
+            )
+
+    def test_get_site_ids_for_user(self):
+        user = User.objects.create(username="user_login")
+        user.userprofile.is_multisite_viewer = True
+        user.userprofile.save()
+        for count in site_counts:
+            sites.initialize()
+            sites.register(*sites_factory(count))
+            add_or_update_django_sites(single_sites=sites_factory(count))
+            user.userprofile.sites.set(Site.objects.filter(id__lte=count))
+            self.benchmark(
+                f"registry.get_site_ids_for_user[{count}]",
+                lambda: sites.get_site_ids_for_user(user=user, site_id=1),
+            )
+            self.assertEqual(len(sites.get_site_ids_for_user(user=user, site_id=1)), count)
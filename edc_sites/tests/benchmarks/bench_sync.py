@@ -0,0 +1,47 @@
+from django.test.utils import override_settings
+
+from edc_sites.models import SitesFingerprint
+from edc_sites.site import sites
+from edc_sites.system_checks import compare_single_sites_with_db, sites_check
+from edc_sites.utils import add_or_update_django_sites
+
+from .benchmark_test_case import BenchmarkTestCase, sites_factory
+
+site_counts = [10, 100, 1000]
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False)
+class BenchSync(BenchmarkTestCase):
+    def tearDown(self) -> None:
+        sites.initialize()
+
+    def test_add_or_update_django_sites(self):
+        for count in site_counts:
+            single_sites = sites_factory(count)
+            self.benchmark(
+                f"add_or_update_django_sites.create[{count}]",
+                lambda: add_or_update_django_sites(single_sites=single_sites),
+                setup=lambda: sites.initialize(initialize_site_model=True),
+                rounds=1,
+            )
+            self.benchmark(
+                f"add_or_update_django_sites.update[{count}]",
+                lambda: add_or_update_django_sites(single_sites=single_sites),
+            )
+
+    def test_sites_check(self):
+        for count in site_counts:
+            sites.initialize(initialize_site_model=True)
+            sites.register(*sites_factory(count))
+            add_or_update_django_sites()
+            self.benchmark(
+                f"sites_check.in_sync[{count}]",
+                lambda: self.assertEqual(sites_check(None), []),
+                max_queries=1,
+            )
+            self.benchmark(
+                f"sites_check.compare_without_fingerprint[{count}]",
+                compare_single_sites_with_db,
+                setup=lambda: SitesFingerprint.objects.all().delete(),
+                max_queries=4,
+            )
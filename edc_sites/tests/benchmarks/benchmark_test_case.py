@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import statistics
+import time
+from typing import Any, Callable
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from edc_sites.single_site import SingleSite
+
+__all__ = ["BenchmarkTestCase", "benchmark_results", "sites_factory"]
+
+benchmark_results: list[dict[str, Any]] = []
+
+
+def sites_factory(count: int, language_codes: list[str] | None = None) -> list[SingleSite]:
+    """Returns a list of `count` SingleSite instances over a few
+    countries.
+    """
+    countries = [("botswana", "bw"), ("namibia", "na"), ("tanzania", "tz"), ("uganda", "ug")]
+    single_sites = []
+    for site_id in range(1, count + 1):
+        country, country_code = countries[site_id % len(countries)]
+        single_sites.append(
+            SingleSite(
+                site_id,
+                f"site{site_id}",
+                title=f"Site {site_id}",
+                country=country,
+                country_code=country_code,
+                language_codes=language_codes or ["en"],
+                domain=f"site{site_id}.{country_code}.bench.clinicedc.org",
+            )
+        )
+    return single_sites
+
+
+class BenchmarkTestCase(TestCase):
+    """A TestCase to benchmark wall time and number of queries.
+
+    Results are collected in `benchmark_results` and reported
+    by `runbenchmarks.py`.
+    """
+
+    rounds: int = 5
+
+    def benchmark(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        setup: Callable[[], Any] | None = None,
+        rounds: int | None = None,
+        max_queries: int | None = None,
+    ) -> dict[str, Any]:
+        """Runs `func` `rounds` times, calling `setup`, if given,
+        before each round. Setup is not timed.
+        """
+        timings = []
+        queries = 0
+        for _ in range(rounds or self.rounds):
+            if setup:
+                setup()
+            with CaptureQueriesContext(connection) as ctx:
+                start = time.perf_counter()
+                func()
+                timings.append(time.perf_counter() - start)
+            queries = len(ctx.captured_queries)
+        result = dict(
+            name=name,
+            queries=queries,
+            rounds=len(timings),
+            min=min(timings),
+            median=statistics.median(timings),
+        )
+        benchmark_results.append(result)
+        if max_queries is not None:
+            self.assertLessEqual(queries, max_queries, msg=name)
+        return result
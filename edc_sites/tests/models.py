@@ -1,15 +1,26 @@
 from django.db import models
 
 from edc_sites.managers import CurrentSiteManager
-from edc_sites.model_mixins import SiteModelMixin
+from edc_sites.model_mixins import SiteModelMixin, SiteNaturalKeyModelMixin
 
 
 class TestModelWithSite(SiteModelMixin, models.Model):
     f1 = models.CharField(max_length=10, default="1")
 
+    modified = models.DateTimeField(auto_now=True)
+
     objects = models.Manager()
 
     on_site = CurrentSiteManager()
 
     class Meta:
         verbose_name = "Test Model"
+
+
+class TestModelWithSiteNaturalKey(SiteNaturalKeyModelMixin, SiteModelMixin, models.Model):
+    subject_identifier = models.CharField(max_length=25)
+
+    on_site = CurrentSiteManager()
+
+    class Meta(SiteNaturalKeyModelMixin.Meta):
+        verbose_name = "Test Model with site natural key"
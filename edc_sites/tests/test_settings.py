@@ -71,5 +71,11 @@ project_settings = DefaultTestSettings(
     add_dashboard_middleware=True,
 ).settings
 
+# a read replica, mirrors "default" in tests. See SiteReplicaRouter
+project_settings["DATABASES"]["replica"] = {
+    **project_settings["DATABASES"]["default"],
+    "TEST": {"MIRROR": "default"},
+}
+
 for k, v in project_settings.items():
     setattr(sys.modules[__name__], k, v)
@@ -0,0 +1,53 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.contrib.sites.models import Site
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.exceptions import InvalidSiteForUser
+from edc_sites.site import sites
+from edc_sites.utils import add_or_update_django_sites, ahas_profile_or_raise
+
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(SITE_ID=10, EDC_SITES_UAT_DOMAIN=False)
+class TestAsync(SiteTestCaseMixin, TestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*self.default_sites)
+        add_or_update_django_sites()
+        self.users = []
+        for i, site_ids in enumerate([[10], [10, 20], [10, 20, 30]]):
+            user = User.objects.create(username=f"user{i}")
+            user.userprofile.sites.add(*Site.objects.filter(id__in=site_ids))
+            user.userprofile.is_multisite_viewer = True
+            user.userprofile.save()
+            self.users.append(user)
+
+    async def test_aget_site_ids_for_user(self):
+        for user in self.users:
+            self.assertEqual(
+                await sites.aget_site_ids_for_user(user=user, site_id=10),
+                await sync_to_async(sites.get_site_ids_for_user)(user=user, site_id=10),
+            )
+
+    async def test_aget_site_ids_for_users_concurrently(self):
+        site_ids = await asyncio.gather(
+            *[sites.aget_site_ids_for_user(user=user, site_id=10) for user in self.users]
+        )
+        self.assertEqual([sorted(s) for s in site_ids], [[10], [10, 20], [10, 20, 30]])
+
+    async def test_aget_view_only_site_ids_for_user_raises(self):
+        with self.assertRaises(InvalidSiteForUser):
+            await sites.aget_view_only_site_ids_for_user(user=self.users[0], site_id=20)
+
+    async def test_ahas_profile_or_raise(self):
+        results = await asyncio.gather(*[ahas_profile_or_raise(user) for user in self.users])
+        self.assertEqual(results, [True, True, True])
+
+    async def test_aget_current_site(self):
+        single_sites = await asyncio.gather(*[sites.aget_current_site() for _ in range(3)])
+        self.assertEqual([s.site_id for s in single_sites], [10, 10, 10])
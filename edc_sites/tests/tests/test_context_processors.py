@@ -0,0 +1,55 @@
+from django.contrib.auth.models import AnonymousUser, User
+from django.contrib.sites.models import Site
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase
+from django.test.utils import override_settings
+
+from edc_sites.context_processors import get_site_context, site
+from edc_sites.site import sites
+from edc_sites.utils import add_or_update_django_sites
+
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(SITE_ID=10, EDC_SITES_UAT_DOMAIN=False)
+class TestContextProcessors(SiteTestCaseMixin, TestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*self.default_sites)
+        add_or_update_django_sites()
+        self.user = User.objects.create(username="viewer")
+        self.user.userprofile.sites.add(*Site.objects.filter(id__in=[10, 20]))
+        self.user.userprofile.is_multisite_viewer = True
+        self.user.userprofile.save()
+        self.request = RequestFactory().get("/")
+        self.request.site = Site.objects.get(id=10)
+        self.request.user = self.user
+
+    def test_site_context(self):
+        edc_site = site(self.request)["edc_site"]
+        self.assertIs(edc_site, get_site_context(self.request))
+        self.assertEqual(edc_site.single_site, sites.get(10))
+        self.assertEqual(edc_site.country, "botswana")
+        self.assertEqual(edc_site.title, sites.get(10).description)
+        self.assertEqual(edc_site.site_profile.site_id, 10)
+        self.assertEqual(edc_site.site_ids, [10, 20])
+        self.assertEqual([s.site_id for s in edc_site.accessible_sites], [10, 20])
+        self.assertTrue(edc_site.may_view_other_sites)
+
+    def test_anonymous_user(self):
+        self.request.user = AnonymousUser()
+        self.assertEqual(get_site_context(self.request).site_ids, [10])
+
+    def test_resolved_once_per_request(self):
+        template = Template(
+            "{% load edc_sites_extras %}"
+            "{{ edc_site.title }} {{ edc_site.site_profile.title }} "
+            "{{ edc_site.site_ids|length }} {{ request|country }}"
+        )
+        context = Context(dict(request=self.request, **site(self.request)))
+        template.render(context)
+        with self.assertNumQueries(0):
+            rendered = template.render(context)
+        self.assertEqual(
+            rendered, f"{sites.get(10).description} {sites.get(10).description} 2 botswana"
+        )
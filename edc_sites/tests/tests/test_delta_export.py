@@ -0,0 +1,129 @@
+import gzip
+import json
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from edc_sites.site import sites
+from edc_sites.utils import add_or_update_django_sites
+from edc_sites.utils.delta_export import (
+    DeltaCheckpoint,
+    DeltaExportError,
+    export_site_delta,
+    get_delta_models,
+)
+
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+def read_rows(folder: Path) -> list[dict]:
+    rows = []
+    for path in sorted(folder.glob("*/chunk-*.jsonl.gz")):
+        with gzip.open(path, "rt") as f:
+            rows.extend(json.loads(line) for line in f)
+    return rows
+
+
+@override_settings(SITE_ID=10, EDC_SITES_UAT_DOMAIN=False, EDC_SITES_DELTA_EXPORT_LAG=0)
+class TestDeltaExport(SiteTestCaseMixin, TestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*self.default_sites)
+        add_or_update_django_sites()
+        for site_id in [10, 10, 10, 20, 20, 30]:
+            TestModelWithSite.objects.create(site_id=site_id)
+        self.folder = Path(tempfile.mkdtemp())
+
+    def export(self, **kwargs):
+        return export_site_delta(self.folder, model_classes=[TestModelWithSite], **kwargs)
+
+    def test_get_delta_models(self):
+        self.assertIn(TestModelWithSite, get_delta_models())
+
+    def test_export_for_sites_in_chunks(self):
+        checkpoint = self.export(site_ids=[10, 20], chunk_size=2)
+        self.assertTrue(checkpoint.complete)
+        self.assertEqual(checkpoint.rows, 5)
+        self.assertEqual(checkpoint.chunks, 3)
+        rows = read_rows(self.folder)
+        self.assertEqual(
+            sorted(row["fields"]["site_id"] for row in rows), [10, 10, 10, 20, 20]
+        )
+        self.assertEqual(rows[0]["model"], "tests.testmodelwithsite")
+        self.assertEqual(DeltaCheckpoint.load(self.folder / "checkpoint.json"), checkpoint)
+
+    def test_next_export_is_delta(self):
+        checkpoint = self.export(site_ids=[10])
+        obj = TestModelWithSite.objects.filter(site_id=10).first()
+        obj.f1 = "2"
+        obj.save()
+        TestModelWithSite.objects.create(site_id=20)
+        checkpoint = export_site_delta(
+            Path(tempfile.mkdtemp()), checkpoint=checkpoint, model_classes=[TestModelWithSite]
+        )
+        self.assertEqual(checkpoint.rows, 1)
+        self.assertEqual(checkpoint.site_ids, [10])
+
+    def test_next_export_to_same_folder_keeps_previous_chunks(self):
+        checkpoint = self.export(site_ids=[10, 20])
+        obj = TestModelWithSite.objects.filter(site_id=10).first()
+        obj.f1 = "2"
+        obj.save()
+        TestModelWithSite.objects.create(site_id=20)
+        next_checkpoint = self.export(checkpoint=checkpoint)
+        self.assertEqual(next_checkpoint.rows, 2)
+        self.assertNotEqual(next_checkpoint.window_name, checkpoint.window_name)
+        self.assertEqual(len(list(self.folder.glob("*/chunk-*.jsonl.gz"))), 2)
+        self.assertEqual(len(read_rows(self.folder)), 7)
+
+    def test_lag_leaves_recent_rows_for_next_export(self):
+        checkpoint = self.export(lag=timedelta(minutes=5))
+        self.assertEqual(checkpoint.rows, 0)
+        self.assertLess(checkpoint.until, timezone.now() - timedelta(minutes=4))
+        checkpoint = export_site_delta(
+            Path(tempfile.mkdtemp()), checkpoint=checkpoint, model_classes=[TestModelWithSite]
+        )
+        self.assertEqual(checkpoint.rows, 6)
+
+    def test_empty_site_ids_exports_nothing(self):
+        checkpoint = self.export(site_ids=[])
+        self.assertEqual(checkpoint.site_ids, [])
+        self.assertEqual(checkpoint.rows, 0)
+
+    def test_resume_incomplete(self):
+        queryset = TestModelWithSite.objects.filter(site_id=10).order_by("modified", "pk")
+        first = queryset.first()
+        checkpoint = DeltaCheckpoint(
+            site_ids=[10],
+            since=None,
+            until=timezone.now() + timedelta(seconds=1),
+            positions={"tests.testmodelwithsite": [first.modified.isoformat(), first.pk]},
+            chunks=1,
+            rows=1,
+        )
+        checkpoint = self.export(checkpoint=checkpoint)
+        self.assertTrue(checkpoint.complete)
+        self.assertEqual(checkpoint.rows, 3)
+        self.assertEqual(len(read_rows(self.folder)), 2)
+
+    def test_resume_for_other_sites_raises(self):
+        checkpoint = DeltaCheckpoint(site_ids=[10], since=None, until=timezone.now())
+        self.assertRaises(DeltaExportError, self.export, site_ids=[20], checkpoint=checkpoint)
+
+    def test_command(self):
+        out = StringIO()
+        call_command(
+            "export_site_delta", f"--output-dir={self.folder}", "--site-id=30", stdout=out
+        )
+        self.assertTrue((self.folder / "checkpoint.json").exists())
+        self.assertIn(
+            {"site_id": 30},
+            [{"site_id": row["fields"]["site_id"]} for row in read_rows(self.folder)],
+        )
@@ -0,0 +1,105 @@
+import dataclasses
+from unittest.mock import MagicMock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from edc_sites.models import SiteProfile, SitesFingerprint
+from edc_sites.site import SitesCheckError, sites
+from edc_sites.system_checks import compare_single_sites_with_db
+from edc_sites.utils import (
+    add_or_update_django_sites,
+    get_fingerprint,
+    get_site_model_cls,
+)
+from edc_sites.utils.add_or_update_django_sites import update_sites_fingerprint
+
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False)
+class TestFingerprint(SiteTestCaseMixin, TestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*self.default_sites)
+
+    def test_fingerprint_ignores_order(self):
+        self.assertEqual(
+            get_fingerprint(self.default_sites),
+            get_fingerprint(reversed(self.default_sites)),
+        )
+
+    def test_fingerprint_changes_with_sites(self):
+        single_sites = list(self.default_sites)
+        fingerprint = get_fingerprint(single_sites)
+        single_sites[0] = dataclasses.replace(single_sites[0], country="tanzania")
+        self.assertNotEqual(fingerprint, get_fingerprint(single_sites))
+
+    def test_registry_fingerprint_updates_on_register(self):
+        fingerprint = sites.fingerprint
+        self.assertEqual(fingerprint, get_fingerprint(self.default_sites))
+        sites.register(
+            dataclasses.replace(
+                self.default_sites[0], site_id=70, name="ramotswa", domain="ramotswa.bw"
+            )
+        )
+        self.assertNotEqual(fingerprint, sites.fingerprint)
+
+    def test_fingerprint_stored_on_sync(self):
+        SitesFingerprint.objects.all().delete()
+        self.assertFalse(sites.fingerprint_matches_db())
+        add_or_update_django_sites()
+        self.assertEqual(SitesFingerprint.objects.get().fingerprint, sites.fingerprint)
+        self.assertTrue(sites.fingerprint_matches_db())
+
+    def test_compare_in_sync_uses_fingerprint(self):
+        add_or_update_django_sites()
+        with self.assertNumQueries(1):
+            compare_single_sites_with_db()
+
+    def test_compare_out_of_sync_raises(self):
+        add_or_update_django_sites()
+        sites.initialize()
+        sites.register(
+            *[dataclasses.replace(s, country="tanzania") for s in self.default_sites]
+        )
+        self.assertFalse(sites.fingerprint_matches_db())
+        self.assertRaises(SitesCheckError, compare_single_sites_with_db)
+
+    def test_fingerprint_deleted_on_site_change(self):
+        add_or_update_django_sites()
+        site_obj = get_site_model_cls().objects.get(id=self.default_sites[0].site_id)
+        site_obj.name = "changed"
+        site_obj.save()
+        self.assertFalse(SitesFingerprint.objects.exists())
+        self.assertRaises(SitesCheckError, compare_single_sites_with_db)
+
+    def test_fingerprint_deleted_on_site_profile_change(self):
+        add_or_update_django_sites()
+        site_profile = SiteProfile.objects.get(site_id=self.default_sites[0].site_id)
+        site_profile.title = "changed"
+        site_profile.save()
+        self.assertFalse(SitesFingerprint.objects.exists())
+        self.assertRaises(SitesCheckError, compare_single_sites_with_db)
+
+    def test_update_sites_fingerprint_without_model(self):
+        apps = MagicMock()
+        apps.get_model.side_effect = LookupError
+        self.assertIsNone(update_sites_fingerprint(self.default_sites, apps))
+
+    def test_sync_does_not_invalidate_fingerprint(self):
+        add_or_update_django_sites()
+        get_site_model_cls().objects.filter(id=self.default_sites[0].site_id).update(
+            name="changed"
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            add_or_update_django_sites()
+        self.assertFalse(
+            [
+                q
+                for q in ctx.captured_queries
+                if q["sql"].startswith('DELETE FROM "edc_sites_sitesfingerprint"')
+            ]
+        )
+        self.assertTrue(sites.fingerprint_matches_db())
@@ -0,0 +1,54 @@
+from django import forms
+from django.contrib.sites.models import Site
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.forms import SiteModelFormMixin
+from edc_sites.site import sites
+from edc_sites.utils import add_or_update_django_sites, get_site_obj
+
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+class TestModelWithSiteForm(SiteModelFormMixin, forms.ModelForm):
+    class Meta:
+        model = TestModelWithSite
+        fields = ["f1"]
+
+
+@override_settings(SITE_ID=10, EDC_SITES_UAT_DOMAIN=False)
+class TestFormSite(SiteTestCaseMixin, TestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*self.default_sites)
+        add_or_update_django_sites()
+        Site.objects.clear_cache()
+
+    def test_get_site_obj_cached(self):
+        with self.assertNumQueries(1):
+            get_site_obj(20)
+            get_site_obj(20)
+        site_obj = Site.objects.get(id=20)
+        site_obj.name = "changed"
+        site_obj.save()
+        self.assertEqual(get_site_obj(20).name, "changed")
+
+    def test_site_resolved_once_from_instance(self):
+        obj = TestModelWithSite.objects.create(site_id=20)
+        obj = TestModelWithSite.objects.get(id=obj.id)
+        form = TestModelWithSiteForm(data={"f1": "2"}, instance=obj)
+        form.current_site = get_site_obj(20)
+        self.assertTrue(form.is_valid())
+        with self.assertNumQueries(0):
+            self.assertEqual(form.site.id, 20)
+            form.validate_with_current_site()
+
+    def test_invalid_for_current_site(self):
+        obj = TestModelWithSite.objects.create(site_id=20)
+        form = TestModelWithSiteForm(data={"f1": "2"}, instance=obj)
+        form.current_site = get_site_obj(20)
+        self.assertTrue(form.is_valid())
+        form.current_site = get_site_obj(10)
+        with self.assertNumQueries(0):
+            self.assertRaises(forms.ValidationError, form.validate_with_current_site)
@@ -0,0 +1,46 @@
+from django.contrib.sites.models import Site
+from django.test import RequestFactory, TestCase
+from django.test.utils import override_settings
+
+from edc_sites.exceptions import InvalidSiteError
+from edc_sites.site import sites
+from edc_sites.utils import add_or_update_django_sites
+from edc_sites.utils.is_current_site_or_raise import (
+    all_current_site_or_raise,
+    is_current_site_or_raise,
+)
+
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(SITE_ID=10, EDC_SITES_UAT_DOMAIN=False)
+class TestIsCurrentSite(SiteTestCaseMixin, TestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*self.default_sites)
+        add_or_update_django_sites()
+
+    def test_is_current_site_or_raise(self):
+        self.assertTrue(is_current_site_or_raise(10))
+        self.assertRaises(InvalidSiteError, is_current_site_or_raise, 20)
+
+    def test_is_current_site_or_raise_with_request(self):
+        request = RequestFactory().get("/")
+        request.site = Site.objects.get(id=20)
+        self.assertTrue(is_current_site_or_raise(20, request=request))
+        self.assertRaises(InvalidSiteError, is_current_site_or_raise, 10, request=request)
+
+    def test_is_current_site_or_raise_with_current_site(self):
+        with self.assertNumQueries(0):
+            self.assertTrue(is_current_site_or_raise(20, current_site=20))
+            self.assertTrue(is_current_site_or_raise(20, current_site=sites.get(20)))
+            self.assertRaises(
+                InvalidSiteError, is_current_site_or_raise, 10, current_site=sites.get(20)
+            )
+
+    def test_all_current_site_or_raise(self):
+        with self.assertNumQueries(0):
+            self.assertTrue(all_current_site_or_raise([20, 20, 20], current_site=20))
+        with self.assertRaises(InvalidSiteError) as cm:
+            all_current_site_or_raise([10, 20, 30, 20], current_site=sites.get(10))
+        self.assertIn("[20, 30]", str(cm.exception))
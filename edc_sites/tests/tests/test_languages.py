@@ -0,0 +1,50 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.single_site import SingleSite, get_languages_from_settings
+from edc_sites.single_site.get_languages import SiteLanguagesError
+
+
+class TestLanguages(TestCase):
+    @override_settings(LANGUAGES=[("en", "English"), ("sw", "Swahili")])
+    def test_languages_from_settings_cached(self):
+        languages = get_languages_from_settings()
+        self.assertEqual(languages, {"en": "English", "sw": "Swahili"})
+        self.assertIs(languages, get_languages_from_settings())
+
+    def test_languages_from_settings_cleared_on_setting_changed(self):
+        with override_settings(LANGUAGES=[("en", "English")]):
+            self.assertEqual(get_languages_from_settings(), {"en": "English"})
+        with override_settings(LANGUAGES={"tn": "Setswana"}):
+            self.assertEqual(get_languages_from_settings(), {"tn": "Setswana"})
+
+    @override_settings(LANGUAGES=[("en", "English"), ("sw", "Swahili")])
+    def test_single_site_languages_evaluated_on_access(self):
+        with patch("edc_sites.single_site.single_site.get_languages") as get_languages:
+            get_languages.return_value = {"sw": "Swahili"}
+            single_site = SingleSite(
+                99, "amana", domain="amana.clinicedc.org", language_codes=["sw"]
+            )
+            get_languages.assert_not_called()
+            self.assertEqual(single_site.languages, {"sw": "Swahili"})
+            self.assertEqual(single_site.languages, {"sw": "Swahili"})
+            get_languages.assert_called_once()
+
+    @override_settings(LANGUAGES=[("en", "English"), ("sw", "Swahili")])
+    def test_single_site_languages_defaults_to_settings(self):
+        single_site = SingleSite(99, "amana", domain="amana.clinicedc.org")
+        self.assertEqual(single_site.languages, {"en": "English", "sw": "Swahili"})
+        self.assertIsNot(single_site.languages, get_languages_from_settings())
+
+    @override_settings(LANGUAGES=[("en", "English")])
+    def test_single_site_unknown_language_raises_on_init(self):
+        self.assertRaises(
+            SiteLanguagesError,
+            SingleSite,
+            99,
+            "amana",
+            domain="amana.clinicedc.org",
+            language_codes=["sw"],
+        )
@@ -0,0 +1,49 @@
+from django.contrib.sites.models import Site
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from django.test.utils import override_settings
+
+from edc_sites.middleware import SiteContextMiddleware
+from edc_sites.site import sites
+from edc_sites.utils import (
+    add_or_update_django_sites,
+    get_pinned_site,
+    pin_current_site,
+)
+
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(SITE_ID=10, EDC_SITES_UAT_DOMAIN=False)
+class TestCurrentSiteManager(SiteTestCaseMixin, TestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*self.default_sites)
+        add_or_update_django_sites()
+        for site_id, count in [(10, 3), (20, 2)]:
+            site = Site.objects.get(id=site_id)
+            for _ in range(count):
+                TestModelWithSite.objects.create(site=site)
+
+    def test_on_site(self):
+        self.assertEqual(TestModelWithSite.on_site.count(), 3)
+        self.assertNotIn("JOIN", str(TestModelWithSite.on_site.all().query))
+
+    def test_on_site_with_pinned_site(self):
+        site = Site.objects.get(id=20)
+        with pin_current_site(site):
+            with self.assertNumQueries(1):
+                self.assertEqual(TestModelWithSite.on_site.count(), 2)
+        self.assertEqual(TestModelWithSite.on_site.count(), 3)
+
+    def test_site_context_middleware(self):
+        def get_response(request):
+            self.assertEqual(get_pinned_site(), request.site)
+            return HttpResponse(str(TestModelWithSite.on_site.count()))
+
+        request = RequestFactory().get("/")
+        request.site = Site.objects.get(id=20)
+        response = SiteContextMiddleware(get_response)(request)
+        self.assertEqual(response.content, b"2")
+        self.assertIsNone(get_pinned_site())
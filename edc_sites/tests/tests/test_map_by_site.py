@@ -0,0 +1,78 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.sites.models import Site
+from django.test import TransactionTestCase
+from django.test.utils import override_settings
+
+from edc_sites.site import sites
+from edc_sites.utils import (
+    add_or_update_django_sites,
+    get_current_site_obj,
+    map_by_site,
+    partition_by_site,
+)
+
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+def first_for_site(site_id, queryset):
+    return queryset.first()
+
+
+def count_for_site(site_id, queryset):
+    return queryset.count(), get_current_site_obj().id
+
+
+@override_settings(SITE_ID=10, EDC_SITES_UAT_DOMAIN=False)
+class TestMapBySite(SiteTestCaseMixin, TransactionTestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*self.default_sites)
+        add_or_update_django_sites()
+        for site_id, count in [(10, 3), (20, 2), (30, 1)]:
+            site = Site.objects.get(id=site_id)
+            for _ in range(count):
+                TestModelWithSite.objects.create(site=site)
+
+    def test_partition_by_site(self):
+        partitions = partition_by_site(TestModelWithSite.objects.all())
+        self.assertEqual(list(partitions), [10, 20, 30, 40, 50, 60])
+        self.assertEqual(partitions[10].count(), 3)
+        self.assertEqual(partitions[40].count(), 0)
+
+    def test_partition_by_site_empty_site_ids(self):
+        self.assertEqual(partition_by_site(TestModelWithSite.objects.all(), []), {})
+
+    def test_map_by_site(self):
+        results = map_by_site(
+            TestModelWithSite.objects.all(), count_for_site, site_ids=[10, 20, 30]
+        )
+        self.assertEqual(results, {10: (3, 10), 20: (2, 20), 30: (1, 30)})
+
+    def test_map_by_site_with_reduce(self):
+        total = map_by_site(
+            TestModelWithSite.objects.filter(f1="1"),
+            count_for_site,
+            max_workers=2,
+            reduce=lambda results: sum(count for count, _ in results.values()),
+        )
+        self.assertEqual(total, 6)
+
+    def test_map_by_site_keeps_values(self):
+        results = map_by_site(
+            TestModelWithSite.objects.values("site_id"), first_for_site, site_ids=[10, 20]
+        )
+        self.assertEqual(results, {10: {"site_id": 10}, 20: {"site_id": 20}})
+        results = map_by_site(
+            TestModelWithSite.objects.values_list("site_id", flat=True),
+            first_for_site,
+            site_ids=[10],
+        )
+        self.assertEqual(results, {10: 10})
+
+    def test_map_by_site_does_not_shut_down_executor(self):
+        executor = ThreadPoolExecutor(max_workers=2)
+        map_by_site(TestModelWithSite.objects.all(), count_for_site, executor=executor)
+        self.assertEqual(executor.submit(lambda: 1).result(), 1)
+        executor.shutdown()
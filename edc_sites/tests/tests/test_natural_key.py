@@ -0,0 +1,66 @@
+from django.contrib.sites.models import Site
+from django.core import serializers
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.managers import prefetch_natural_keys
+from edc_sites.site import sites
+from edc_sites.utils import add_or_update_django_sites
+
+from ..models import TestModelWithSiteNaturalKey
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(SITE_ID=10, EDC_SITES_UAT_DOMAIN=False)
+class TestNaturalKey(SiteTestCaseMixin, TestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*self.default_sites)
+        add_or_update_django_sites()
+        for site_id in [10, 20]:
+            for subject_identifier in ["S1", "S2"]:
+                TestModelWithSiteNaturalKey.objects.create(
+                    subject_identifier=subject_identifier, site=Site.objects.get(id=site_id)
+                )
+
+    def test_natural_key(self):
+        obj = TestModelWithSiteNaturalKey.objects.get(subject_identifier="S1", site_id=20)
+        self.assertEqual(obj.natural_key(), ("S1", 20))
+        self.assertEqual(TestModelWithSiteNaturalKey.objects.get_by_natural_key("S1", 20), obj)
+        self.assertEqual(TestModelWithSiteNaturalKey.on_site.get_by_natural_key("S1", 20), obj)
+        # without a site_id, limited to the current site
+        self.assertEqual(
+            TestModelWithSiteNaturalKey.on_site.get_by_natural_key("S1").site_id, 10
+        )
+
+    def test_unique_within_site(self):
+        with transaction.atomic():
+            self.assertRaises(
+                IntegrityError,
+                TestModelWithSiteNaturalKey.objects.create,
+                subject_identifier="S1",
+                site=Site.objects.get(id=10),
+            )
+
+    def test_get_by_natural_keys(self):
+        with self.assertNumQueries(1):
+            objs = TestModelWithSiteNaturalKey.objects.get_by_natural_keys(
+                [("S1", 10), ("S2", 20), ("S3", 10)]
+            )
+        self.assertEqual(list(objs), [("S1", 10), ("S2", 20)])
+
+    def test_deserialize_with_prefetched_natural_keys(self):
+        data = serializers.serialize(
+            "json",
+            TestModelWithSiteNaturalKey.objects.all(),
+            use_natural_primary_keys=True,
+        )
+        natural_keys = [obj.natural_key() for obj in TestModelWithSiteNaturalKey.objects.all()]
+        pks = {obj.natural_key(): obj.pk for obj in TestModelWithSiteNaturalKey.objects.all()}
+        with prefetch_natural_keys(TestModelWithSiteNaturalKey, natural_keys):
+            with self.assertNumQueries(0):
+                deserialized = list(serializers.deserialize("json", data))
+        self.assertEqual(
+            {obj.object.natural_key(): obj.object.pk for obj in deserialized}, pks
+        )
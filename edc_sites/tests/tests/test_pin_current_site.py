@@ -0,0 +1,54 @@
+from django.contrib.sites.models import Site
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.site import sites
+from edc_sites.utils import (
+    add_or_update_django_sites,
+    get_current_site_obj,
+    get_pinned_site,
+    pin_current_site,
+)
+
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(SITE_ID=10, EDC_SITES_UAT_DOMAIN=False)
+class TestPinCurrentSite(SiteTestCaseMixin, TestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*self.default_sites)
+        add_or_update_django_sites()
+
+    def test_pin_current_site(self):
+        self.assertIsNone(get_pinned_site())
+        with pin_current_site(20) as site_obj:
+            self.assertEqual(site_obj.id, 20)
+            self.assertEqual(get_pinned_site(), site_obj)
+            with self.assertNumQueries(0):
+                self.assertEqual(get_current_site_obj(), site_obj)
+                self.assertEqual(sites.get_current_site().site_id, 20)
+                self.assertEqual(sites.get_current_country(), "botswana")
+        self.assertIsNone(get_pinned_site())
+        self.assertEqual(get_current_site_obj().id, 10)
+
+    def test_pin_current_site_with_site_or_single_site(self):
+        site_obj = Site.objects.get(id=60)
+        with pin_current_site(site_obj):
+            self.assertEqual(get_current_site_obj(), site_obj)
+        with pin_current_site(sites.get(60)):
+            self.assertEqual(get_current_site_obj().id, 60)
+
+    def test_nested_pin_current_site(self):
+        with pin_current_site(20):
+            with pin_current_site(30):
+                self.assertEqual(get_current_site_obj().id, 30)
+            self.assertEqual(get_current_site_obj().id, 20)
+
+    def test_model_site_on_create(self):
+        with pin_current_site(30):
+            obj = TestModelWithSite.objects.create()
+        self.assertEqual(obj.site.id, 30)
+        obj = TestModelWithSite.objects.create()
+        self.assertEqual(obj.site.id, 10)
@@ -0,0 +1,111 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.admin import AdminSite
+from django.contrib.auth.models import User
+from django.contrib.sites.models import Site
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from edc_sites.middleware import SiteQueryRecorderMiddleware
+from edc_sites.query_recorder import SiteQueryRecorder, site_query_recorder
+from edc_sites.site import sites
+from edc_sites.utils import add_or_update_django_sites
+
+from ..admin import TestModelWithSiteAdmin
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(SITE_ID=10, EDC_SITES_UAT_DOMAIN=False, EDC_SITES_RECORD_QUERIES=True)
+class TestQueryRecorder(SiteTestCaseMixin, TestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*self.default_sites)
+        add_or_update_django_sites()
+        site_query_recorder.reset()
+        self.user = User.objects.create_superuser("user_login", "u@example.com", "pass")
+        self.user.userprofile.sites.add(Site.objects.get(id=10))
+        self.request = RequestFactory().get("/")
+        self.request.site = Site.objects.get(id=10)
+        self.request.user = self.user
+        self.model_admin = TestModelWithSiteAdmin(TestModelWithSite, AdminSite())
+
+    def test_records_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.model_admin.get_view_only_site_ids_for_user(self.request)
+        stats = site_query_recorder.stats[
+            ("tests.testmodelwithsite", "get_view_only_site_ids_for_user")
+        ]
+        self.assertEqual(stats.calls, 1)
+        self.assertEqual(stats.queries, len(ctx.captured_queries))
+        self.assertGreater(stats.queries, 0)
+
+    def test_records_inclusive_calls(self):
+        with CaptureQueriesContext(connection) as ctx:
+            list(self.model_admin.get_queryset(self.request))
+        stats = site_query_recorder.stats[("tests.testmodelwithsite", "get_queryset")]
+        # evaluating the queryset is not counted
+        self.assertEqual(stats.queries, len(ctx.captured_queries) - 1)
+        self.assertIn(
+            ("tests.testmodelwithsite", "get_view_only_site_ids_for_user"),
+            site_query_recorder.stats,
+        )
+
+    @override_settings(EDC_SITES_RECORD_QUERIES=False)
+    def test_disabled(self):
+        self.model_admin.get_view_only_site_ids_for_user(self.request)
+        self.assertEqual(site_query_recorder.stats, {})
+
+    def test_report(self):
+        self.model_admin.get_view_only_site_ids_for_user(self.request)
+        out = StringIO()
+        call_command("site_query_report", "--reset", stdout=out)
+        self.assertEqual(site_query_recorder.get_cached_stats(), {})
+
+    def test_cached_stats_accumulate_across_recorders(self):
+        other_recorder = SiteQueryRecorder()
+        site_query_recorder.record("view", "label", 2, 0.5)
+        other_recorder.record("view", "label", 3, 0.25)
+        other_recorder.record("view", "other_label", 1, 0.0)
+        cached_stats = site_query_recorder.get_cached_stats()
+        self.assertEqual(cached_stats[("view", "label")].calls, 2)
+        self.assertEqual(cached_stats[("view", "label")].queries, 5)
+        self.assertAlmostEqual(cached_stats[("view", "label")].duration, 0.75)
+        self.assertEqual(cached_stats[("view", "other_label")].calls, 1)
+
+    def test_records_after_reset_by_other_recorder(self):
+        site_query_recorder.record("view", "label", 2, 0.0)
+        SiteQueryRecorder().reset()
+        self.assertEqual(site_query_recorder.get_cached_stats(), {})
+        site_query_recorder.record("view", "label", 1, 0.0)
+        cached_stats = site_query_recorder.get_cached_stats()
+        self.assertEqual(cached_stats[("view", "label")].calls, 1)
+        self.assertEqual(cached_stats[("view", "label")].queries, 1)
+
+    def test_recording_adds_to_cache_once_on_exit(self):
+        with site_query_recorder.recording():
+            for _ in range(3):
+                site_query_recorder.record("view", "label", 2, 0.0)
+            self.assertEqual(site_query_recorder.get_cached_stats(), {})
+            self.assertEqual(site_query_recorder.stats[("view", "label")].calls, 3)
+        cached_stats = site_query_recorder.get_cached_stats()
+        self.assertEqual(cached_stats[("view", "label")].calls, 3)
+        self.assertEqual(cached_stats[("view", "label")].queries, 6)
+
+    def test_middleware_records_once_per_request(self):
+        def get_response(request):
+            with patch("edc_sites.query_recorder.cache.incr") as incr:
+                self.model_admin.get_view_only_site_ids_for_user(request)
+                self.model_admin.get_view_only_site_ids_for_user(request)
+                incr.assert_not_called()
+            return None
+
+        SiteQueryRecorderMiddleware(get_response)(self.request)
+        cached_stats = site_query_recorder.get_cached_stats()
+        self.assertEqual(
+            cached_stats[("tests.testmodelwithsite", "get_view_only_site_ids_for_user")].calls,
+            2,
+        )
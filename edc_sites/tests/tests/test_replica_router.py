@@ -0,0 +1,71 @@
+from django.contrib.auth.models import Permission, User
+from django.contrib.sites.models import Site
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from django.test.utils import override_settings
+
+from edc_sites.middleware import SiteReplicaMiddleware
+from edc_sites.routers import use_replica_for_reads
+from edc_sites.site import sites
+from edc_sites.utils import add_or_update_django_sites
+
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(
+    SITE_ID=10,
+    EDC_SITES_UAT_DOMAIN=False,
+    EDC_SITES_REPLICA_DB_ALIAS="replica",
+    DATABASE_ROUTERS=["edc_sites.routers.SiteReplicaRouter"],
+)
+class TestReplicaRouter(SiteTestCaseMixin, TestCase):
+    databases = {"default", "replica"}
+
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*self.default_sites)
+        add_or_update_django_sites()
+        self.user = User.objects.create(username="viewer")
+        self.user.userprofile.sites.add(Site.objects.get(id=10))
+        self.user.userprofile.is_multisite_viewer = True
+        self.user.userprofile.save()
+
+    def get_response(self, request):
+        return HttpResponse(TestModelWithSite.objects.all().db)
+
+    def test_router(self):
+        self.assertEqual(TestModelWithSite.objects.all().db, "default")
+        with use_replica_for_reads():
+            self.assertEqual(TestModelWithSite.objects.all().db, "replica")
+            obj = TestModelWithSite.objects.using("default").create(site_id=10)
+            self.assertEqual(obj._state.db, "default")
+        self.assertEqual(TestModelWithSite.objects.all().db, "default")
+
+    @override_settings(EDC_SITES_REPLICA_DB_ALIAS=None)
+    def test_router_without_replica(self):
+        with use_replica_for_reads():
+            self.assertEqual(TestModelWithSite.objects.all().db, "default")
+
+    def test_middleware(self):
+        middleware = SiteReplicaMiddleware(self.get_response)
+        request = RequestFactory().get("/")
+        request.user = self.user
+        self.assertEqual(middleware(request).content, b"replica")
+
+        request = RequestFactory().post("/")
+        request.user = self.user
+        self.assertEqual(middleware(request).content, b"default")
+
+        self.user.userprofile.is_multisite_viewer = False
+        request = RequestFactory().get("/")
+        request.user = self.user
+        self.assertEqual(middleware(request).content, b"default")
+
+    def test_middleware_viewer_with_change_perms(self):
+        self.user.user_permissions.add(Permission.objects.get(codename="add_site"))
+        user = User.objects.get(username="viewer")
+        middleware = SiteReplicaMiddleware(self.get_response)
+        request = RequestFactory().get("/")
+        request.user = user
+        self.assertEqual(middleware(request).content, b"default")
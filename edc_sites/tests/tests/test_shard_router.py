@@ -0,0 +1,115 @@
+from django.contrib.sites.models import Site
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.models import SiteProfile
+from edc_sites.routers import SiteShardRouter, fan_out, fan_out_count, is_site_model
+from edc_sites.single_site import SingleSite
+from edc_sites.site import sites
+from edc_sites.utils import add_or_update_django_sites, pin_current_site
+
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(
+    SITE_ID=10,
+    EDC_SITES_UAT_DOMAIN=False,
+    EDC_SITES_SHARDS={"botswana": "default"},
+    DATABASE_ROUTERS=["edc_sites.routers.SiteShardRouter"],
+)
+class TestShardRouter(SiteTestCaseMixin, TestCase):
+    databases = {"default", "client"}
+
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(
+            *self.default_sites,
+            SingleSite(
+                70,
+                "kampala",
+                country="uganda",
+                country_code="ug",
+                domain="kampala.ug.clinicedc.org",
+                shard="client",
+            ),
+        )
+        add_or_update_django_sites()
+
+    def test_get_shard(self):
+        self.assertEqual(sites.get_shard(10), "default")
+        self.assertEqual(sites.get_shard(70), "client")
+        self.assertIsNone(sites.get_shard(999))
+        self.assertEqual(sites.shards, ["client", "default"])
+
+    def test_is_site_model(self):
+        self.assertTrue(is_site_model(TestModelWithSite))
+        self.assertFalse(is_site_model(Site))
+
+    def test_write_routed_by_site_id(self):
+        obj = TestModelWithSite(site_id=70)
+        obj.save()
+        self.assertEqual(obj._state.db, "client")
+        obj = TestModelWithSite(site_id=10)
+        obj.save()
+        self.assertEqual(obj._state.db, "default")
+        self.assertEqual(TestModelWithSite.objects.using("client").count(), 1)
+        self.assertEqual(TestModelWithSite.objects.using("default").count(), 1)
+
+    def test_queryset_write_routed_by_pinned_site(self):
+        with pin_current_site(70):
+            obj = TestModelWithSite.objects.create(site_id=70)
+        self.assertEqual(obj._state.db, "client")
+        obj = TestModelWithSite.objects.using(sites.get_shard(70)).create(site_id=70)
+        self.assertEqual(obj._state.db, "client")
+        self.assertEqual(TestModelWithSite.objects.using("client").count(), 2)
+        self.assertEqual(TestModelWithSite.objects.using("default").count(), 0)
+
+    def test_read_routed_by_pinned_site(self):
+        TestModelWithSite(site_id=70).save()
+        with pin_current_site(70):
+            self.assertEqual(TestModelWithSite.objects.all().db, "client")
+            self.assertEqual(TestModelWithSite.on_site.count(), 1)
+        self.assertEqual(TestModelWithSite.objects.all().db, "default")
+        self.assertEqual(TestModelWithSite.objects.count(), 0)
+
+    def test_fan_out(self):
+        for site_id in [10, 70, 20, 70]:
+            TestModelWithSite(site_id=site_id).save()
+        self.assertEqual(TestModelWithSite.objects.using("default").count(), 2)
+        self.assertEqual(TestModelWithSite.objects.using("client").count(), 2)
+        queryset = TestModelWithSite.objects.all().order_by("site_id")
+        self.assertEqual(fan_out_count(queryset), 4)
+        self.assertEqual(
+            [obj.site_id for obj in fan_out(queryset, key=lambda obj: obj.site_id)],
+            [10, 20, 70, 70],
+        )
+
+    def test_sites_synced_to_shards(self):
+        for model_cls in [Site, SiteProfile]:
+            self.assertEqual(
+                list(model_cls.objects.using("client").order_by("pk").values()),
+                list(model_cls.objects.using("default").order_by("pk").values()),
+            )
+
+    def test_unpinned_read_goes_to_default(self):
+        TestModelWithSite(site_id=70).save()
+        TestModelWithSite(site_id=10).save()
+        self.assertEqual(TestModelWithSite.objects.all().db, "default")
+        self.assertEqual(
+            list(TestModelWithSite.objects.values_list("site_id", flat=True)), [10]
+        )
+        self.assertEqual(fan_out_count(TestModelWithSite.objects.all()), 2)
+
+    def test_allow_relation(self):
+        router = SiteShardRouter()
+        obj_client = TestModelWithSite(site_id=70)
+        obj_client.save()
+        obj_default = TestModelWithSite(site_id=10)
+        obj_default.save()
+        site_obj = Site.objects.using("default").get(id=70)
+        self.assertTrue(router.allow_relation(obj_client, site_obj))
+        self.assertIsNone(router.allow_relation(obj_client, obj_default))
+        self.assertTrue(
+            router.allow_relation(obj_client, TestModelWithSite.objects.using("client").get())
+        )
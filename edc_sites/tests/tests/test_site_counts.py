@@ -0,0 +1,110 @@
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.signals import connect_site_counts_receivers
+from edc_sites.site import sites
+from edc_sites.utils import add_or_update_django_sites, get_site_counts
+
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(
+    SITE_ID=10,
+    EDC_SITES_UAT_DOMAIN=False,
+    EDC_SITES_SITE_COUNTS_MODELS=["tests.testmodelwithsite"],
+)
+class TestSiteCounts(SiteTestCaseMixin, TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        sites.initialize()
+        sites.register(*self.default_sites)
+        add_or_update_django_sites()
+        connect_site_counts_receivers()
+        for site_id, count in [(10, 3), (20, 2)]:
+            site = Site.objects.get(id=site_id)
+            for _ in range(count):
+                TestModelWithSite.objects.create(site=site)
+
+    def tearDown(self) -> None:
+        post_init.disconnect(
+            sender=TestModelWithSite,
+            dispatch_uid="update_site_counts_on_post_init.tests.testmodelwithsite",
+        )
+        post_save.disconnect(
+            sender=TestModelWithSite,
+            dispatch_uid="update_site_counts_on_post_save.tests.testmodelwithsite",
+        )
+        post_delete.disconnect(
+            sender=TestModelWithSite,
+            dispatch_uid="update_site_counts_on_post_delete.tests.testmodelwithsite",
+        )
+
+    def test_get_site_counts(self):
+        with self.assertNumQueries(1):
+            site_counts = get_site_counts(TestModelWithSite)
+        self.assertEqual(site_counts, {10: 3, 20: 2, 30: 0, 40: 0, 50: 0, 60: 0})
+        with self.assertNumQueries(0):
+            self.assertEqual(get_site_counts(TestModelWithSite), site_counts)
+
+    def test_site_counts_updated_on_save_and_delete(self):
+        get_site_counts(TestModelWithSite)
+        with self.captureOnCommitCallbacks(execute=True):
+            TestModelWithSite.objects.create(site=Site.objects.get(id=30))
+            TestModelWithSite.objects.filter(site_id=10).first().delete()
+        with self.assertNumQueries(0):
+            site_counts = get_site_counts(TestModelWithSite)
+        self.assertEqual(site_counts[10], 2)
+        self.assertEqual(site_counts[30], 1)
+        self.assertEqual(get_site_counts(TestModelWithSite, refresh=True), site_counts)
+
+    def test_site_counts_recounted_if_expired(self):
+        get_site_counts(TestModelWithSite)
+        cache.delete("edc_sites.site_counts.tests.testmodelwithsite.20")
+        with self.assertNumQueries(1):
+            self.assertEqual(get_site_counts(TestModelWithSite)[20], 2)
+
+    def test_site_counts_not_updated_before_commit(self):
+        get_site_counts(TestModelWithSite)
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            TestModelWithSite.objects.create(site=Site.objects.get(id=30))
+        self.assertEqual(get_site_counts(TestModelWithSite)[30], 0)
+        self.assertEqual(len(callbacks), 1)
+
+    def test_site_counts_unchanged_on_rollback(self):
+        get_site_counts(TestModelWithSite)
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    TestModelWithSite.objects.create(site=Site.objects.get(id=30))
+                    TestModelWithSite.objects.filter(site_id=10).first().delete()
+                    raise ValueError("rollback")
+            except ValueError:
+                pass
+        site_counts = get_site_counts(TestModelWithSite)
+        self.assertEqual(site_counts[10], 3)
+        self.assertEqual(site_counts[30], 0)
+        self.assertEqual(get_site_counts(TestModelWithSite, refresh=True), site_counts)
+
+    def test_site_counts_updated_on_move_to_other_site(self):
+        get_site_counts(TestModelWithSite)
+        obj = TestModelWithSite.objects.filter(site_id=10).first()
+        with self.captureOnCommitCallbacks(execute=True):
+            obj.site = Site.objects.get(id=30)
+            obj.save()
+        site_counts = get_site_counts(TestModelWithSite)
+        self.assertEqual(site_counts[10], 2)
+        self.assertEqual(site_counts[30], 1)
+        self.assertEqual(get_site_counts(TestModelWithSite, refresh=True), site_counts)
+
+    def test_site_counts_recounted_for_site_not_counted(self):
+        get_site_counts(TestModelWithSite)
+        site = Site.objects.create(id=70, name="site70", domain="site70.clinicedc.org")
+        with self.captureOnCommitCallbacks(execute=True):
+            TestModelWithSite.objects.create(site=site)
+        with self.assertNumQueries(1):
+            self.assertEqual(get_site_counts(TestModelWithSite)[70], 1)
@@ -0,0 +1,85 @@
+import dataclasses
+
+from django.contrib.auth.models import Group, User
+from django.contrib.sites.models import Site
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.site import AlreadyRegistered, sites
+from edc_sites.utils import add_or_update_django_sites
+
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(SITE_ID=10, EDC_SITES_UAT_DOMAIN=False)
+class TestSiteGroups(SiteTestCaseMixin, TestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        regions = {10: "north", 20: "north", 30: "south", 40: "south", 50: "south"}
+        sites.register(
+            *[
+                dataclasses.replace(
+                    single_site,
+                    region=regions.get(single_site.site_id),
+                    cluster="gaborone" if single_site.site_id in [40, 50] else None,
+                )
+                for single_site in self.default_sites
+            ]
+        )
+        add_or_update_django_sites()
+
+    def test_group_names_for_single_site(self):
+        self.assertEqual(
+            sites.get(40).group_names,
+            ["botswana", "botswana.south", "botswana.south.gaborone"],
+        )
+
+    def test_get_site_ids_for_group(self):
+        self.assertEqual(sites.get_site_ids_for_group("botswana.north"), [10, 20])
+        self.assertEqual(sites.get_site_ids_for_group("botswana.south"), [30, 40, 50])
+        self.assertEqual(sites.get_site_ids_for_group("botswana.south.gaborone"), [40, 50])
+        self.assertEqual(
+            sites.get_site_ids_for_group("botswana"), sites.get_site_ids_by_country("botswana")
+        )
+        self.assertEqual(sites.get_site_ids_for_group("blah"), [])
+
+    def test_get_group_names_for_site(self):
+        self.assertIn("botswana.south.gaborone", sites.get_group_names_for_site(50))
+        self.assertNotIn("botswana.north", sites.get_group_names_for_site(50))
+
+    def test_register_group(self):
+        sites.register_group(
+            "hub", site_ids=[10, 999], group_names=["botswana.south.gaborone"]
+        )
+        self.assertEqual(sites.get_site_ids_for_group("hub"), [10, 40, 50])
+        self.assertIn("hub", sites.get_group_names_for_site(10))
+        self.assertRaises(AlreadyRegistered, sites.register_group, "hub", site_ids=[20])
+
+    def test_site_ids_for_user_groups(self):
+        user = User.objects.create(username="coordinator")
+        user.userprofile.sites.add(Site.objects.get(id=10))
+        user.userprofile.is_multisite_viewer = True
+        user.userprofile.save()
+        user.groups.add(Group.objects.create(name="SITES:botswana.south"))
+        self.assertEqual(sites.get_site_ids_for_user_groups(user), [])
+        self.assertEqual(sites.get_site_ids_for_user(user=user, site_id=10), [10])
+        with override_settings(EDC_SITES_GROUP_ACCESS_PREFIX="SITES:"):
+            self.assertEqual(sites.get_site_ids_for_user_groups(user), [30, 40, 50])
+            self.assertEqual(
+                sites.get_site_ids_for_user(user=user, site_id=10), [10, 30, 40, 50]
+            )
+
+    @override_settings(EDC_SITES_GROUP_ACCESS_PREFIX="SITES:")
+    def test_user_access_resolved_once_per_user_instance(self):
+        user = User.objects.create(username="coordinator")
+        user.userprofile.sites.add(Site.objects.get(id=10))
+        user.userprofile.is_multisite_viewer = True
+        user.userprofile.save()
+        user.groups.add(Group.objects.create(name="SITES:botswana.south"))
+        user = User.objects.get(username="coordinator")
+        self.assertEqual(sites.get_site_ids_for_user(user=user, site_id=10), [10, 30, 40, 50])
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                sites.get_site_ids_for_user(user=user, site_id=10), [10, 30, 40, 50]
+            )
+            self.assertEqual(sites.get_site_ids_for_user_groups(user), [30, 40, 50])
@@ -0,0 +1,58 @@
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.site import sites
+from edc_sites.site_id_set import SiteIdSet
+from edc_sites.utils import add_or_update_django_sites
+
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(SITE_ID=10, EDC_SITES_UAT_DOMAIN=False)
+class TestSiteIdSet(SiteTestCaseMixin, TestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*self.default_sites)
+        add_or_update_django_sites()
+
+    def test_ordinals(self):
+        self.assertEqual(sites.ordinals.site_ids, (10, 20, 30, 40, 50, 60))
+        self.assertEqual(sites.ordinals.index[30], 2)
+
+    def test_membership(self):
+        site_id_set = sites.get_site_id_set([10, 30, 999])
+        self.assertIn(10, site_id_set)
+        self.assertIn(999, site_id_set)
+        self.assertNotIn(20, site_id_set)
+        self.assertEqual(len(site_id_set), 3)
+        self.assertEqual(site_id_set.to_list(), [10, 30, 999])
+        self.assertEqual(list(site_id_set), [10, 30, 999])
+
+    def test_set_operations(self):
+        a = sites.get_site_id_set([10, 20, 30])
+        b = sites.get_site_id_set([30, 40])
+        self.assertEqual((a | b).to_list(), [10, 20, 30, 40])
+        self.assertEqual((a & b).to_list(), [30])
+        self.assertEqual((a - b).to_list(), [10, 20])
+        self.assertEqual(a & [20, 50], sites.get_site_id_set([20]))
+        self.assertFalse(sites.get_site_id_set([]))
+
+    def test_different_ordinals(self):
+        a = SiteIdSet([10, 20])
+        b = sites.get_site_id_set([20, 30])
+        self.assertEqual((b & a).to_list(), [20])
+        self.assertEqual(a, sites.get_site_id_set([10, 20]))
+
+    def test_filter(self):
+        for site_id in [10, 20, 30]:
+            TestModelWithSite.objects.create(site_id=site_id)
+        site_id_set = sites.get_site_id_set([10, 30])
+        self.assertEqual(
+            sorted(
+                site_id_set.filter(TestModelWithSite.objects.all()).values_list(
+                    "site_id", flat=True
+                )
+            ),
+            [10, 30],
+        )
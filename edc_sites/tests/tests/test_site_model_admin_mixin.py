@@ -0,0 +1,45 @@
+from django.contrib.admin import AdminSite, ModelAdmin
+from django.contrib.sites.models import Site
+from django.test import RequestFactory, TestCase
+from django.test.utils import override_settings
+
+from edc_sites.admin import SiteModelAdminMixin
+from edc_sites.admin.site_model_admin_mixin import SiteModeAdminMixinError
+from edc_sites.site import sites
+from edc_sites.utils import add_or_update_django_sites
+
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+class CountryModelAdmin(SiteModelAdminMixin, ModelAdmin):
+    limit_related_to_current_country = ["site"]
+
+
+@override_settings(SITE_ID=10, EDC_SITES_UAT_DOMAIN=False)
+class TestSiteModelAdminMixin(SiteTestCaseMixin, TestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*self.default_sites)
+        add_or_update_django_sites()
+
+    def test_get_site_ids_by_country(self):
+        self.assertEqual(sites.get_site_ids_by_country("botswana"), [10, 20, 30, 40, 50])
+        self.assertEqual(sites.get_site_ids_by_country("namibia"), [60])
+        self.assertEqual(sites.get_site_ids_by_country("zambia"), [])
+
+    def test_dups_in_field_lists_raises_on_class_setup(self):
+        with self.assertRaises(SiteModeAdminMixinError):
+
+            class BadModelAdmin(SiteModelAdminMixin, ModelAdmin):
+                limit_related_to_current_country = ["site"]
+                limit_related_to_current_site = ["site"]
+
+    def test_formfield_for_foreignkey_limited_to_country(self):
+        request = RequestFactory().get("/")
+        request.site = Site.objects.get(id=60)
+        model_admin = CountryModelAdmin(TestModelWithSite, AdminSite())
+        db_field = TestModelWithSite._meta.get_field("site")
+        formfield = model_admin.formfield_for_foreignkey(db_field, request)
+        self.assertNotIn("JOIN", str(formfield.queryset.query))
+        self.assertEqual([obj.id for obj in formfield.queryset], [60])
@@ -0,0 +1,116 @@
+from django.contrib.admin import AdminSite, ModelAdmin
+from django.contrib.auth.models import User
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.test import Client, RequestFactory, TestCase
+from django.test.utils import override_settings
+from multisite import SiteID
+
+from edc_sites.admin import SiteCountPaginator, SiteModelAdminMixin
+from edc_sites.admin.paginator import is_unfiltered_changelist
+from edc_sites.site import sites
+from edc_sites.utils import add_or_update_django_sites
+
+from ..admin import TestModelWithSiteAdmin
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+class ThresholdModelAdmin(SiteModelAdminMixin, ModelAdmin):
+    site_paginator_threshold = 5
+
+
+class SiteCountsModelAdmin(SiteModelAdminMixin, ModelAdmin):
+    site_paginator_use_site_counts = True
+
+
+@override_settings(
+    SITE_ID=SiteID(default=10),
+    EDC_SITES_UAT_DOMAIN=False,
+    EDC_AUTH_SKIP_SITE_AUTHS=True,
+    EDC_AUTH_SKIP_AUTH_UPDATER=True,
+)
+class TestSitePaginator(SiteTestCaseMixin, TestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*self.default_sites)
+        add_or_update_django_sites()
+        cache.clear()
+        self.user = User.objects.create_superuser("user_login", "u@example.com", "pass")
+        self.user.userprofile.sites.add(Site.objects.get(id=10))
+        TestModelWithSite.objects.bulk_create(
+            [TestModelWithSite(site_id=10) for _ in range(12)]
+            + [TestModelWithSite(site_id=20) for _ in range(3)]
+        )
+        self.request = RequestFactory().get("/")
+        self.request.site = Site.objects.get(id=10)
+        self.request.user = self.user
+
+    def tearDown(self) -> None:
+        sites.initialize()
+
+    def get_paginator(self, model_admin_cls, request=None):
+        request = request or self.request
+        model_admin = model_admin_cls(TestModelWithSite, AdminSite())
+        return model_admin.get_paginator(request, model_admin.get_queryset(request), 2)
+
+    def test_is_unfiltered_changelist(self):
+        factory = RequestFactory()
+        self.assertTrue(
+            is_unfiltered_changelist(factory.get("/", {"p": 2, "o": "1", "q": ""}))
+        )
+        self.assertFalse(is_unfiltered_changelist(factory.get("/", {"q": "blah"})))
+        self.assertFalse(is_unfiltered_changelist(factory.get("/", {"f1": "1"})))
+
+    def test_default_paginator(self):
+        paginator = self.get_paginator(TestModelWithSiteAdmin)
+        self.assertNotIsInstance(paginator, SiteCountPaginator)
+        self.assertTrue(
+            TestModelWithSiteAdmin(TestModelWithSite, AdminSite()).show_full_result_count
+        )
+
+    def test_threshold(self):
+        paginator = self.get_paginator(ThresholdModelAdmin)
+        self.assertIsInstance(paginator, SiteCountPaginator)
+        self.assertEqual(paginator.count, 5)
+        self.assertTrue(paginator.estimated)
+        self.assertEqual(paginator.num_pages, 3)
+        # a page beyond the estimate triggers an exact count
+        self.assertEqual(len(paginator.page(6).object_list), 2)
+        self.assertEqual(paginator.count, 12)
+        self.assertFalse(
+            ThresholdModelAdmin(TestModelWithSite, AdminSite()).show_full_result_count
+        )
+
+    def test_threshold_not_reached(self):
+        paginator = SiteCountPaginator(
+            TestModelWithSite.objects.filter(site_id=20), 2, threshold=5
+        )
+        self.assertEqual(paginator.count, 3)
+        self.assertFalse(paginator.estimated)
+
+    def test_site_counts(self):
+        paginator = self.get_paginator(SiteCountsModelAdmin)
+        self.assertEqual(paginator.site_counts, {10: 12})
+        with self.assertNumQueries(0):
+            self.assertEqual(paginator.count, 12)
+
+    def test_site_counts_not_used_when_filtered(self):
+        request = RequestFactory().get("/", {"q": "blah"})
+        request.site = self.request.site
+        request.user = self.user
+        paginator = self.get_paginator(SiteCountsModelAdmin, request=request)
+        self.assertIsNone(paginator.site_counts)
+
+    def test_exact(self):
+        self.request.edc_sites_exact_count = True
+        paginator = self.get_paginator(ThresholdModelAdmin)
+        self.assertEqual(paginator.count, 12)
+        self.assertFalse(paginator.estimated)
+
+    def test_changelist_exact_count_param(self):
+        client = Client()
+        client.force_login(self.user)
+        response = client.get("/admin/tests/testmodelwithsite/", {"_exact_count": 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("e=1", response.get("Location", ""))
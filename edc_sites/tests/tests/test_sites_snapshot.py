@@ -0,0 +1,66 @@
+import dataclasses
+import json
+from io import StringIO
+
+from django.contrib.sites.models import Site
+from django.test import TestCase
+from django.test.utils import override_settings
+from multisite.models import Alias
+
+from edc_sites.models import SiteProfile, SitesFingerprint
+from edc_sites.site import sites
+from edc_sites.utils import add_or_update_django_sites
+from edc_sites.utils.sites_snapshot import (
+    SitesSnapshotError,
+    export_sites_snapshot,
+    import_sites_snapshot,
+)
+
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(SITE_ID=10, EDC_SITES_UAT_DOMAIN=False)
+class TestSitesSnapshot(SiteTestCaseMixin, TestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*self.default_sites)
+        add_or_update_django_sites()
+
+    def export(self) -> list[str]:
+        stream = StringIO()
+        export_sites_snapshot(stream)
+        return stream.getvalue().splitlines()
+
+    def test_export(self):
+        lines = self.export()
+        models = [json.loads(line)["model"] for line in lines]
+        self.assertEqual(models.count("sites.site"), 6)
+        self.assertEqual(models.count("edc_sites.siteprofile"), 6)
+        self.assertEqual(models.count("multisite.alias"), Alias.objects.count())
+
+    def test_import_restores_sites(self):
+        lines = self.export()
+        Site.objects.filter(id=20).update(name="changed", domain="changed.bw")
+        SiteProfile.objects.filter(site_id=30).update(country="zambia")
+        SitesFingerprint.objects.all().delete()
+        self.assertFalse(sites.fingerprint_matches_db())
+
+        fingerprint = import_sites_snapshot(lines)
+
+        self.assertEqual(fingerprint, sites.fingerprint)
+        self.assertTrue(sites.fingerprint_matches_db())
+        self.assertEqual(Site.objects.get(id=20).name, "molepolole")
+        self.assertEqual(SiteProfile.objects.get(site_id=30).country, "botswana")
+        self.assertEqual(
+            Alias.objects.get(site_id=20, is_canonical=True).domain,
+            "molepolole.bw.clinicedc.org",
+        )
+
+    def test_import_not_matching_registry_raises(self):
+        lines = self.export()
+        sites.initialize()
+        sites.register(
+            *[dataclasses.replace(s, country="tanzania") for s in self.default_sites]
+        )
+        self.assertRaises(SitesSnapshotError, import_sites_snapshot, lines)
+        self.assertNotEqual(import_sites_snapshot(lines, verify=False), sites.fingerprint)
@@ -0,0 +1,61 @@
+import dataclasses
+
+from django.contrib.sites.models import Site
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext, override_settings
+from multisite.models import Alias
+
+from edc_sites.models import SiteProfile
+from edc_sites.site import sites
+from edc_sites.utils import add_or_update_django_sites
+
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(EDC_SITES_UAT_DOMAIN=False)
+class TestSyncAliases(SiteTestCaseMixin, TestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*self.default_sites)
+
+    def test_canonical_alias_for_each_site(self):
+        add_or_update_django_sites()
+        self.assertEqual(
+            dict(Alias.objects.filter(is_canonical=True).values_list("site_id", "domain")),
+            {s.site_id: s.domain for s in self.default_sites},
+        )
+
+    def test_unchanged_sites_not_saved(self):
+        add_or_update_django_sites()
+        with CaptureQueriesContext(connection) as ctx:
+            add_or_update_django_sites()
+        sql = [q["sql"] for q in ctx.captured_queries]
+        self.assertFalse([q for q in sql if q.startswith('UPDATE "django_site"')])
+        self.assertFalse([q for q in sql if q.startswith('UPDATE "edc_sites_siteprofile"')])
+        self.assertFalse([q for q in sql if q.startswith('UPDATE "multisite_alias"')])
+
+    def test_changed_domain_syncs_alias(self):
+        add_or_update_django_sites()
+        single_site = dataclasses.replace(self.default_sites[0], domain="mochudi.example.com")
+        add_or_update_django_sites(single_sites=[single_site])
+        self.assertEqual(
+            Alias.objects.get(site_id=single_site.site_id, is_canonical=True).domain,
+            "mochudi.example.com",
+        )
+
+    def test_missing_alias_created_for_unchanged_site(self):
+        add_or_update_django_sites()
+        site_id = self.default_sites[0].site_id
+        Alias.objects.filter(site_id=site_id).delete()
+        add_or_update_django_sites()
+        self.assertEqual(
+            Alias.objects.get(site_id=site_id, is_canonical=True).domain,
+            Site.objects.get(id=site_id).domain,
+        )
+
+    def test_changed_title_updates_site_profile(self):
+        add_or_update_django_sites()
+        single_site = dataclasses.replace(self.default_sites[0], title="changed")
+        add_or_update_django_sites(single_sites=[single_site])
+        self.assertEqual(SiteProfile.objects.get(site_id=single_site.site_id).title, "Changed")
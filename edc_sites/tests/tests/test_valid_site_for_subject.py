@@ -0,0 +1,84 @@
+from django.contrib.sites.models import Site
+from django.test import RequestFactory, TestCase
+from django.test.utils import override_settings
+from edc_registration.models import RegisteredSubject
+from edc_registration.utils import RegisteredSubjectDoesNotExist
+from multisite import SiteID
+
+from edc_sites.exceptions import InvalidSiteForSubjectError
+from edc_sites.site import sites
+from edc_sites.utils import (
+    add_or_update_django_sites,
+    valid_site_for_subject_or_raise,
+    valid_sites_for_subjects,
+)
+
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(SITE_ID=SiteID(default=10), EDC_SITES_UAT_DOMAIN=False)
+class TestValidSiteForSubject(SiteTestCaseMixin, TestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*self.default_sites)
+        add_or_update_django_sites()
+        for subject_identifier, site_id in [("S1", 10), ("S2", 10), ("S3", 20)]:
+            RegisteredSubject.objects.create(
+                subject_identifier=subject_identifier, site=Site.objects.get(id=site_id)
+            )
+
+    def test_valid_sites_for_subjects(self):
+        current_site = Site.objects.get(id=10)
+        with self.assertNumQueries(1):
+            site_objs, errors = valid_sites_for_subjects(
+                ["S1", "S2", "S3", "S4"], current_site=current_site
+            )
+        self.assertEqual(site_objs, {"S1": current_site, "S2": current_site})
+        self.assertEqual(list(errors), ["S3", "S4"])
+        self.assertIsInstance(errors["S3"], InvalidSiteForSubjectError)
+        self.assertIsInstance(errors["S4"], RegisteredSubjectDoesNotExist)
+
+    def test_valid_sites_for_subjects_without_current_site(self):
+        site_objs, errors = valid_sites_for_subjects(["S1", "S3"])
+        self.assertEqual([s.id for s in site_objs.values()], [10])
+        self.assertEqual(list(errors), ["S3"])
+
+    def test_valid_sites_for_subjects_skip_get_current_site(self):
+        with self.assertWarns(UserWarning):
+            site_objs, errors = valid_sites_for_subjects(
+                ["S1", "S3"], skip_get_current_site=True
+            )
+        self.assertEqual({k: v.id for k, v in site_objs.items()}, {"S1": 10, "S3": 20})
+        self.assertEqual(errors, {})
+
+    def test_valid_site_for_subject_or_raise(self):
+        current_site = Site.objects.get(id=10)
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                valid_site_for_subject_or_raise("S1", current_site=current_site),
+                current_site,
+            )
+        self.assertEqual(valid_site_for_subject_or_raise("S2").id, 10)
+        self.assertRaises(
+            InvalidSiteForSubjectError,
+            valid_site_for_subject_or_raise,
+            "S3",
+            current_site=current_site,
+        )
+        self.assertRaises(
+            RegisteredSubjectDoesNotExist,
+            valid_site_for_subject_or_raise,
+            "S4",
+            current_site=current_site,
+        )
+
+    def test_valid_site_for_subject_or_raise_with_request(self):
+        request = RequestFactory().get("/")
+        request.site = Site.objects.get(id=20)
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                valid_site_for_subject_or_raise("S3", request=request), request.site
+            )
+        self.assertRaises(
+            InvalidSiteForSubjectError, valid_site_for_subject_or_raise, "S1", request=request
+        )
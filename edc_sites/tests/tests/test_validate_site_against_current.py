@@ -0,0 +1,71 @@
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from edc_sites.exceptions import InvalidSiteError
+from edc_sites.site import sites
+from edc_sites.utils import (
+    add_or_update_django_sites,
+    bypass_site_validation,
+    pin_current_site,
+)
+
+from ..models import TestModelWithSite
+from ..site_test_case_mixin import SiteTestCaseMixin
+
+
+@override_settings(
+    SITE_ID=10, EDC_SITES_UAT_DOMAIN=False, EDC_SITES_VALIDATE_SITE_ON_UPDATE=True
+)
+class TestValidateSiteAgainstCurrent(SiteTestCaseMixin, TestCase):
+    def setUp(self) -> None:
+        sites.initialize()
+        sites.register(*self.default_sites)
+        add_or_update_django_sites()
+        self.obj = TestModelWithSite.objects.create(site_id=20)
+
+    def test_not_pinned(self):
+        self.obj.f1 = "2"
+        self.obj.save()
+
+    def test_same_site(self):
+        with pin_current_site(20):
+            self.obj.f1 = "2"
+            with self.assertNumQueries(1):
+                self.obj.save()
+
+    def test_other_site_raises(self):
+        with pin_current_site(30):
+            self.obj.f1 = "2"
+            with self.assertNumQueries(0):
+                self.assertRaises(InvalidSiteError, self.obj.save)
+
+    def test_update_fields_without_site(self):
+        with pin_current_site(30):
+            self.obj.f1 = "2"
+            self.obj.save(update_fields=["f1"])
+
+    def test_bypass(self):
+        with pin_current_site(30), bypass_site_validation():
+            self.obj.f1 = "2"
+            self.obj.save()
+
+    def test_opt_out(self):
+        with pin_current_site(30):
+            self.obj.validate_site_on_update = False
+            self.obj.f1 = "2"
+            self.obj.save()
+
+    @override_settings(EDC_SITES_VALIDATE_SITE_ON_UPDATE=False)
+    def test_not_validated_unless_opted_in(self):
+        with pin_current_site(30):
+            self.obj.f1 = "2"
+            self.obj.save()
+        self.obj.refresh_from_db()
+        self.assertEqual(self.obj.f1, "2")
+
+    @override_settings(EDC_SITES_VALIDATE_SITE_ON_UPDATE=False)
+    def test_opt_in_by_model(self):
+        with pin_current_site(30):
+            self.obj.validate_site_on_update = True
+            self.obj.f1 = "2"
+            self.assertRaises(InvalidSiteError, self.obj.save)
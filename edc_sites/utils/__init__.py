@@ -1,8 +1,16 @@
 from .add_or_update_django_sites import add_or_update_django_sites
+from .bypass_site_validation import bypass_site_validation, site_validation_bypassed
+from .get_current_site_obj import aget_current_site_obj, get_current_site_obj
+from .get_fingerprint import get_fingerprint, get_fingerprint_from_values
 from .get_message_text import get_message_text
 from .get_or_create_site_obj import get_or_create_site_obj
 from .get_or_create_site_profile_obj import get_or_create_site_profile_obj
+from .get_site_counts import get_site_counts
 from .get_site_model_cls import get_site_model_cls
-from .has_profile_or_raise import has_profile_or_raise
+from .get_site_obj import get_site_obj
+from .has_profile_or_raise import ahas_profile_or_raise, has_profile_or_raise
 from .insert_into_domain import insert_into_domain
+from .map_by_site import map_by_site, partition_by_site
+from .pin_current_site import get_pinned_site, pin_current_site
 from .valid_site_for_subject_or_raise import valid_site_for_subject_or_raise
+from .valid_sites_for_subjects import valid_sites_for_subjects
@@ -1,19 +1,33 @@
 from __future__ import annotations
 
 import sys
+from contextvars import ContextVar
 
 from django.apps import apps as django_apps
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
 
 from ..single_site import SingleSite
-from .get_or_create_site_obj import get_or_create_site_obj
+from .get_fingerprint import get_fingerprint
+from .get_or_create_site_obj import update_or_create_site_obj
 from .get_or_create_site_profile_obj import get_or_create_site_profile_obj
+from .sites_snapshot import bulk_upsert
+
+_sites_sync_in_progress: ContextVar[bool] = ContextVar(
+    "edc_sites_sites_sync_in_progress", default=False
+)
 
 
 class UpdateDjangoSitesError(Exception):
     pass
 
 
+def sites_sync_in_progress() -> bool:
+    """Returns True within `add_or_update_django_sites`."""
+    return _sites_sync_in_progress.get()
+
+
 def get_sites():
     from ..site import sites  # prevent circular import
 
@@ -29,12 +43,35 @@ def add_or_update_django_sites(
 
     Title is stored in SiteProfile.
 
+    A fingerprint of the synced sites is stored in SitesFingerprint
+    once, at the end. Saves made by the sync do not invalidate it
+    (see `signals.invalidate_sites_fingerprint`).
+
+    If sites are sharded (see Sites.get_shard), the Site and
+    SiteProfile rows are copied to each shard database.
+
+    If `multisite` is installed, canonical aliases are synced for
+    sites that were created or changed, or that have no canonical
+    alias, in the same transaction.
+
     kwargs:
         * sites: format
             sites = (
                 (<site_id>, <site_name>, <title>),
                 ...)
     """
+    token = _sites_sync_in_progress.set(True)
+    try:
+        return _add_or_update_django_sites(apps, single_sites, verbose)
+    finally:
+        _sites_sync_in_progress.reset(token)
+
+
+def _add_or_update_django_sites(
+    apps: django_apps | None,
+    single_sites: list[SingleSite] | tuple[SingleSite] | None,
+    verbose: bool | None,
+):
     if verbose:
         sys.stdout.write("  * updating sites.\n")
     apps = apps or django_apps
@@ -53,13 +90,121 @@ def add_or_update_django_sites(
         single_sites = get_sites().all().values()
     if not single_sites:
         raise UpdateDjangoSitesError("No sites have been registered.")
-    for single_site in single_sites:
-        if single_site.name == "edc_sites.sites":
-            continue
-        if verbose:
-            sys.stdout.write(f"  * SingleSite: {single_site.site_id}: {single_site.domain}.\n")
-        site_obj = get_or_create_site_obj(single_site, apps)
-        if verbose:
-            sys.stdout.write(f"    - Site model: {site_obj.id}: {site_obj.domain}.\n")
-        get_or_create_site_profile_obj(single_site, site_obj, apps)
+    synced_single_sites = []
+    changed_site_objs = []
+    with transaction.atomic():
+        for single_site in single_sites:
+            if single_site.name == "edc_sites.sites":
+                continue
+            if verbose:
+                sys.stdout.write(
+                    f"  * SingleSite: {single_site.site_id}: {single_site.domain}.\n"
+                )
+            site_obj, changed = update_or_create_site_obj(single_site, apps)
+            if verbose:
+                sys.stdout.write(f"    - Site model: {site_obj.id}: {site_obj.domain}.\n")
+            get_or_create_site_profile_obj(single_site, site_obj, apps)
+            synced_single_sites.append(single_site)
+            if changed:
+                changed_site_objs.append(site_obj)
+        if (
+            "multisite" in settings.INSTALLED_APPS
+            or "multisite.apps.AppConfig" in settings.INSTALLED_APPS
+        ):
+            sync_canonical_aliases(
+                changed_site_objs, [s.site_id for s in synced_single_sites], apps
+            )
+        update_sites_fingerprint(synced_single_sites, apps)
+    sync_sites_to_shards(apps)
     return single_sites
+
+
+def update_sites_fingerprint(single_sites: list[SingleSite], apps) -> str | None:
+    """Stores the fingerprint of the synced sites.
+
+    Skipped if called with historical `apps` from before the
+    SitesFingerprint model was added, e.g. from a data migration.
+    """
+    try:
+        fingerprint_model_cls = apps.get_model("edc_sites", "SitesFingerprint")
+    except LookupError:
+        return None
+    fingerprint = get_fingerprint(single_sites)
+    fingerprint_model_cls.objects.update_or_create(
+        pk=1, defaults=dict(fingerprint=fingerprint)
+    )
+    return fingerprint
+
+
+def sync_canonical_aliases(site_objs: list, site_ids: list[int], apps) -> list:
+    """Creates or updates the canonical multisite Alias for each
+    Site in `site_objs` and for any of `site_ids` without a
+    canonical Alias.
+
+    Equivalent to `Alias.sync` without re-syncing every Site.
+    """
+    try:
+        alias_model_cls = apps.get_model("multisite", "Alias")
+    except LookupError:
+        return []
+    site_model_cls = apps.get_model("sites", "Site")
+    aliased_site_ids = alias_model_cls.objects.filter(
+        site_id__in=site_ids, is_canonical=True
+    ).values_list("site_id", flat=True)
+    site_objs = {obj.id: obj for obj in site_objs}
+    for site_obj in site_model_cls.objects.filter(id__in=site_ids).exclude(
+        id__in=list(aliased_site_ids) + list(site_objs)
+    ):
+        site_objs[site_obj.id] = site_obj
+    aliases = []
+    for site_obj in site_objs.values():
+        alias, _ = alias_model_cls.objects.update_or_create(
+            site_id=site_obj.id, is_canonical=True, defaults=dict(domain=site_obj.domain)
+        )
+        aliases.append(alias)
+    return aliases
+
+
+def sync_sites_to_shards(apps) -> list[str]:
+    """Copies the Site and SiteProfile rows from the default
+    database to each shard database and returns the aliases
+    synced.
+
+    Each shard holds its own copy of the site tables for foreign
+    keys to Site. Shards where the tables do not exist yet, e.g.
+    not yet migrated, are skipped.
+    """
+    aliases = [alias for alias in get_sites().shards if alias != DEFAULT_DB_ALIAS]
+    if not aliases:
+        return []
+    site_model_cls = apps.get_model("sites", "Site")
+    try:
+        site_profile_model_cls = apps.get_model("edc_sites", "SiteProfile")
+    except LookupError:
+        return []
+    site_rows = list(
+        site_model_cls.objects.using(DEFAULT_DB_ALIAS).values(
+            *[f.attname for f in site_model_cls._meta.concrete_fields]
+        )
+    )
+    site_profile_rows = list(
+        site_profile_model_cls.objects.using(DEFAULT_DB_ALIAS).values(
+            *[
+                f.attname
+                for f in site_profile_model_cls._meta.concrete_fields
+                if not f.primary_key
+            ]
+        )
+    )
+    synced_aliases = []
+    for alias in aliases:
+        table_names = connections[alias].introspection.table_names()
+        if site_profile_model_cls._meta.db_table not in table_names:
+            continue
+        with transaction.atomic(using=alias):
+            bulk_upsert(site_model_cls, site_rows, unique_fields=["id"], using=alias)
+            bulk_upsert(
+                site_profile_model_cls, site_profile_rows, unique_fields=["site"], using=alias
+            )
+        synced_aliases.append(alias)
+    return synced_aliases
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+__all__ = ["bypass_site_validation", "site_validation_bypassed"]
+
+_bypass_site_validation: ContextVar[bool] = ContextVar(
+    "edc_sites_bypass_site_validation", default=False
+)
+
+
+@contextmanager
+def bypass_site_validation() -> Iterator[None]:
+    """Context manager to skip `validate_site_against_current` on
+    save for a block of work, e.g. a batch import of data for
+    many sites.
+    """
+    token = _bypass_site_validation.set(True)
+    try:
+        yield
+    finally:
+        _bypass_site_validation.reset(token)
+
+
+def site_validation_bypassed() -> bool:
+    return _bypass_site_validation.get()
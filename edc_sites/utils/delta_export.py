@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.apps import apps as django_apps
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.utils import timezone
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+__all__ = [
+    "DeltaCheckpoint",
+    "DeltaExportError",
+    "export_site_delta",
+    "get_delta_models",
+]
+
+checkpoint_filename = "checkpoint.json"
+window_format = "%Y%m%dT%H%M%S%fZ"
+
+
+def get_delta_export_lag() -> timedelta:
+    """Returns the safety lag subtracted from `until`, in seconds
+    from settings.EDC_SITES_DELTA_EXPORT_LAG (default 300).
+    """
+    return timedelta(seconds=getattr(settings, "EDC_SITES_DELTA_EXPORT_LAG", 300))
+
+
+class DeltaExportError(Exception):
+    pass
+
+
+@dataclass
+class DeltaCheckpoint:
+    """The state of a delta export.
+
+    Written to the output folder after each chunk. Pass to
+    `export_site_delta` to resume an incomplete export or, once
+    complete, to start the next export from `until`.
+
+    The chunks of each export are written to a subfolder of the
+    output folder named for its window, see `window_name`.
+    """
+
+    site_ids: list[int]
+    since: datetime | None
+    until: datetime
+    positions: dict[str, list] = field(default_factory=dict)
+    done: list[str] = field(default_factory=list)
+    chunks: int = 0
+    rows: int = 0
+    complete: bool = False
+
+    @property
+    def window_name(self) -> str:
+        """Returns the name of the subfolder for the chunks of this
+        export, e.g. "20240101T000000000000Z-20240102T000000000000Z".
+        """
+        since, until = [
+            dt.astimezone(dt_timezone.utc).strftime(window_format) if dt else "initial"
+            for dt in (self.since, self.until)
+        ]
+        return f"{since}-{until}"
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        # isoformat, DjangoJSONEncoder truncates to milliseconds
+        data.update(
+            since=self.since.isoformat() if self.since else None,
+            until=self.until.isoformat(),
+        )
+        return json.dumps(data, cls=DjangoJSONEncoder, indent=2)
+
+    @classmethod
+    def from_json(cls, data: str) -> DeltaCheckpoint:
+        data = json.loads(data)
+        data.update(
+            since=datetime.fromisoformat(data["since"]) if data["since"] else None,
+            until=datetime.fromisoformat(data["until"]),
+        )
+        return cls(**data)
+
+    @classmethod
+    def load(cls, path: Path | str) -> DeltaCheckpoint:
+        return cls.from_json(Path(path).read_text())
+
+    def save(self, folder: Path) -> None:
+        """Writes the checkpoint to `folder`, replacing any
+        existing checkpoint atomically.
+        """
+        tmp_path = folder / f"{checkpoint_filename}.tmp"
+        tmp_path.write_text(self.to_json())
+        os.replace(tmp_path, folder / checkpoint_filename)
+
+
+def get_delta_models() -> list[type[Model]]:
+    """Returns the concrete models with a `site` foreign key
+    and a `modified` datetime, sorted by label.
+    """
+    from ..routers import is_site_model  # prevent circular import
+
+    model_classes = []
+    for model_cls in django_apps.get_models():
+        if model_cls._meta.proxy or not is_site_model(model_cls):
+            continue
+        try:
+            model_cls._meta.get_field("modified")
+        except FieldDoesNotExist:
+            continue
+        model_classes.append(model_cls)
+    return sorted(model_classes, key=lambda m: m._meta.label_lower)
+
+
+def export_site_delta(
+    folder: Path | str,
+    site_ids: list[int] | None = None,
+    since: datetime | None = None,
+    checkpoint: DeltaCheckpoint | None = None,
+    chunk_size: int | None = None,
+    model_classes: list[type[Model]] | None = None,
+    lag: timedelta | None = None,
+) -> DeltaCheckpoint:
+    """Writes the rows of the given sites modified after `since`
+    to gzipped JSON lines files in a subfolder of `folder` for the
+    window (see `DeltaCheckpoint.window_name`) and returns the
+    checkpoint. Chunks of previous exports to the same `folder`
+    are left as is.
+
+    * Each line is `{"model": <label_lower>, "fields": {<attname>: <value>}}`.
+    * Rows are read in keyset order on (modified, pk), `chunk_size`
+      rows per query and per file.
+    * The upper bound, `until`, is fixed when the export starts
+      as now less `lag` (see `get_delta_export_lag`).
+    * If `checkpoint` is incomplete, the export resumes after the
+      last chunk written. If complete, a new export starts from
+      `checkpoint.until` for the same sites.
+
+    `modified` is set when a row is saved, not when its
+    transaction commits. A row saved before `until` in a
+    transaction that commits after the export reads is skipped by
+    this export and, as the next export starts from `until`, by
+    the next one too. The lag leaves time for such transactions
+    to commit. Rows of transactions open for longer than `lag`
+    are still missed.
+
+    Deletions are not exported.
+
+    Site ids default to all registered sites if None. Models
+    default to `get_delta_models()`.
+    """
+    from ..site import sites  # prevent circular import
+
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    chunk_size = chunk_size or 1000
+    until = timezone.now() - (get_delta_export_lag() if lag is None else lag)
+    if checkpoint and checkpoint.complete:
+        checkpoint = DeltaCheckpoint(
+            site_ids=checkpoint.site_ids, since=checkpoint.until, until=until
+        )
+    elif not checkpoint:
+        checkpoint = DeltaCheckpoint(
+            site_ids=sorted(sites.all() if site_ids is None else site_ids),
+            since=since,
+            until=until,
+        )
+    elif site_ids is not None and sorted(site_ids) != checkpoint.site_ids:
+        raise DeltaExportError(
+            "Cannot resume export for other sites. "
+            f"Expected {checkpoint.site_ids}. Got {sorted(site_ids)}."
+        )
+    window_folder = folder / checkpoint.window_name
+    window_folder.mkdir(exist_ok=True)
+    for model_cls in model_classes or get_delta_models():
+        label_lower = model_cls._meta.label_lower
+        if label_lower in checkpoint.done:
+            continue
+        attnames = [f.attname for f in model_cls._meta.concrete_fields]
+        queryset = model_cls._default_manager.filter(
+            site_id__in=checkpoint.site_ids, modified__lte=checkpoint.until
+        )
+        if checkpoint.since:
+            queryset = queryset.filter(modified__gt=checkpoint.since)
+        while True:
+            chunk_queryset = queryset
+            if position := checkpoint.positions.get(label_lower):
+                modified, pk = datetime.fromisoformat(position[0]), position[1]
+                chunk_queryset = queryset.filter(
+                    Q(modified__gt=modified) | Q(modified=modified, pk__gt=pk)
+                )
+            rows = list(
+                chunk_queryset.order_by("modified", "pk").values(*attnames)[:chunk_size]
+            )
+            if rows:
+                write_chunk(window_folder, checkpoint.chunks, label_lower, rows)
+                checkpoint.chunks += 1
+                checkpoint.rows += len(rows)
+                checkpoint.positions[label_lower] = [
+                    rows[-1]["modified"].isoformat(),
+                    rows[-1][model_cls._meta.pk.attname],
+                ]
+            if len(rows) < chunk_size:
+                checkpoint.done.append(label_lower)
+                checkpoint.positions.pop(label_lower, None)
+            checkpoint.save(folder)
+            if len(rows) < chunk_size:
+                break
+    checkpoint.complete = True
+    checkpoint.save(folder)
+    return checkpoint
+
+
+def write_chunk(folder: Path, index: int, label_lower: str, rows: list[dict]) -> Path:
+    path = folder / f"chunk-{index:06d}.jsonl.gz"
+    tmp_path = folder / f"{path.name}.tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps({"model": label_lower, "fields": row}, cls=DjangoJSONEncoder))
+            f.write("\n")
+    os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from .get_site_model_cls import get_site_model_cls
+from .pin_current_site import get_pinned_site
+
+if TYPE_CHECKING:
+    from django.contrib.sites.models import Site
+    from django.core.handlers.wsgi import WSGIRequest
+
+
+def get_current_site_obj(request: WSGIRequest | None = None) -> Site:
+    """Returns the current Site model instance.
+
+    Looks in order for `request.site`, a site pinned with
+    `pin_current_site` and, lastly, `Site.objects.get_current()`.
+    """
+    return (
+        getattr(request, "site", None)
+        or get_pinned_site()
+        or get_site_model_cls().objects.get_current()
+    )
+
+
+async def aget_current_site_obj(request: WSGIRequest | None = None) -> Site:
+    """Async version of `get_current_site_obj`.
+
+    Uses the same SITE_CACHE as `Site.objects.get_current()`.
+    """
+    from django.contrib.sites.models import SITE_CACHE  # noqa
+
+    if site_obj := getattr(request, "site", None) or get_pinned_site():
+        return site_obj
+    if site_id := getattr(settings, "SITE_ID", ""):
+        if site_id not in SITE_CACHE:
+            SITE_CACHE[site_id] = await get_site_model_cls().objects.aget(pk=site_id)
+        return SITE_CACHE[site_id]
+    return await sync_to_async(get_site_model_cls().objects.get_current)(request)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from ..single_site import SingleSite
+
+
+def get_fingerprint_from_values(
+    values: Iterable[tuple[int, str, str, str, str, str, dict[str, str] | None]],
+) -> str:
+    """Returns a sha256 hex digest over an iterable of site values.
+
+    Each item is a tuple of (site_id, name, domain, country,
+    country_code, title, languages) as stored in the Site and
+    SiteProfile tables.
+    """
+    rows = sorted(
+        [
+            [site_id, name, domain, country, country_code, title, languages or {}]
+            for site_id, name, domain, country, country_code, title, languages in values
+        ],
+        key=lambda row: row[0],
+    )
+    data = json.dumps(rows, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def get_fingerprint(single_sites: Iterable[SingleSite]) -> str:
+    """Returns a fingerprint for a list of SingleSite instances.
+
+    The fingerprint is stored in model SitesFingerprint by
+    `add_or_update_django_sites` and compared to that of the
+    `sites` registry when checking if the Site / SiteProfile
+    tables are in sync.
+    """
+    return get_fingerprint_from_values(
+        (
+            single_site.site_id,
+            single_site.name,
+            single_site.domain,
+            single_site.country,
+            single_site.country_code,
+            single_site.description,
+            single_site.languages,
+        )
+        for single_site in single_sites
+    )
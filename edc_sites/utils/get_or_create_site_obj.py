@@ -8,23 +8,39 @@ from django.core.exceptions import ObjectDoesNotExist
 from ..single_site import SiteDomainRequiredError
 
 if TYPE_CHECKING:
+    from django.contrib.sites.models import Site
+
     from ..single_site import SingleSite
 
 
-def get_or_create_site_obj(single_site: SingleSite, apps):
+def get_or_create_site_obj(single_site: SingleSite, apps) -> Site:
+    site_obj, _ = update_or_create_site_obj(single_site, apps)
+    return site_obj
+
+
+def update_or_create_site_obj(single_site: SingleSite, apps) -> tuple[Site, bool]:
+    """Returns a tuple of (Site model instance, changed) where changed
+    is True if the instance was created or updated.
+
+    The instance is only saved if `name` or `domain` have changed.
+    """
     if "multisite" in settings.INSTALLED_APPS and not single_site.domain:
         raise SiteDomainRequiredError(
             f"Domain required when using `multisite`. Got None for `{single_site.name}`"
         )
     site_model_cls = apps.get_model("sites", "Site")
+    changed = False
     try:
         site_obj = site_model_cls.objects.get(pk=single_site.site_id)
     except ObjectDoesNotExist:
         site_obj = site_model_cls.objects.create(
             pk=single_site.site_id, name=single_site.name, domain=single_site.domain
         )
+        changed = True
     else:
-        site_obj.name = single_site.name
-        site_obj.domain = single_site.domain
-        site_obj.save()
-    return site_obj
+        if (site_obj.name, site_obj.domain) != (single_site.name, single_site.domain):
+            site_obj.name = single_site.name
+            site_obj.domain = single_site.domain
+            site_obj.save()
+            changed = True
+    return site_obj, changed
@@ -10,6 +10,9 @@ if TYPE_CHECKING:
 
 
 def get_or_create_site_profile_obj(single_site, site_obj, apps) -> SiteProfile | None:
+    """Returns the SiteProfile of the site, creating it or, if any
+    field has changed, updating it.
+    """
     site_profile_model_cls = apps.get_model("edc_sites", "SiteProfile")
     opts = dict(
         title=single_site.description,
@@ -22,7 +25,8 @@ def get_or_create_site_profile_obj(single_site, site_obj, apps) -> SiteProfile |
     except ObjectDoesNotExist:
         site_profile = site_profile_model_cls.objects.create(site=site_obj, **opts)
     else:
-        for k, v in opts.items():
-            setattr(site_profile, k, v)
-        site_profile.save()
+        if any(getattr(site_profile, k) != v for k, v in opts.items()):
+            for k, v in opts.items():
+                setattr(site_profile, k, v)
+            site_profile.save()
     return site_profile
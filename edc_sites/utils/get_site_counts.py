@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Type
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+
+if TYPE_CHECKING:
+    from ..model_mixins import SiteModelMixin
+
+__all__ = ["get_site_counts", "get_site_counts_cache_key", "update_site_count"]
+
+
+def get_site_counts_timeout() -> int:
+    return getattr(settings, "EDC_SITES_SITE_COUNTS_TIMEOUT", 60)
+
+
+def get_site_counts_cache_key(
+    model_cls: Type[SiteModelMixin], site_id: int | None = None
+) -> str:
+    cache_key = f"edc_sites.site_counts.{model_cls._meta.label_lower}"
+    return cache_key if site_id is None else f"{cache_key}.{site_id}"
+
+
+def get_site_counts(
+    model_cls: Type[SiteModelMixin], refresh: bool | None = None
+) -> dict[int, int]:
+    """Returns a dictionary of row counts by site_id for a
+    SiteModelMixin model.
+
+    Counts for all sites are fetched in a single query on the base
+    manager, not filtered by a CurrentSiteManager, and cached
+    for `settings.EDC_SITES_SITE_COUNTS_TIMEOUT` seconds (default
+    60). Registered sites without rows are included with a count
+    of 0.
+
+    For models listed in `settings.EDC_SITES_SITE_COUNTS_MODELS`,
+    cached counts are updated on post_save and post_delete.
+    """
+    from ..site import sites  # prevent circular import
+
+    index_key = get_site_counts_cache_key(model_cls)
+    if not refresh and (site_ids := cache.get(index_key)) is not None:
+        cache_keys = {
+            site_id: get_site_counts_cache_key(model_cls, site_id) for site_id in site_ids
+        }
+        cached_counts = cache.get_many(cache_keys.values())
+        if len(cached_counts) == len(cache_keys):
+            return {site_id: cached_counts[key] for site_id, key in cache_keys.items()}
+    site_counts = dict(
+        model_cls._base_manager.order_by()
+        .values("site_id")
+        .annotate(count=Count("pk"))
+        .values_list("site_id", "count")
+    )
+    for site_id in sites.all():
+        site_counts.setdefault(site_id, 0)
+    timeout = get_site_counts_timeout()
+    cache.set_many(
+        {get_site_counts_cache_key(model_cls, k): v for k, v in site_counts.items()},
+        timeout=timeout,
+    )
+    cache.set(index_key, list(site_counts), timeout=timeout)
+    return site_counts
+
+
+def update_site_count(model_cls: Type[SiteModelMixin], site_id: int, delta: int) -> None:
+    """Increments or decrements the cached count for a site, if
+    cached.
+
+    If the count for the site is not cached, e.g. a site without
+    rows when last counted or an expired count, the cached counts
+    of the model are invalidated so the next call to
+    `get_site_counts` recounts.
+    """
+    cache_key = get_site_counts_cache_key(model_cls, site_id)
+    try:
+        if delta > 0:
+            cache.incr(cache_key, delta)
+        else:
+            cache.decr(cache_key, -delta)
+    except ValueError:
+        cache.delete(get_site_counts_cache_key(model_cls))
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .get_site_model_cls import get_site_model_cls
+
+if TYPE_CHECKING:
+    from django.contrib.sites.models import Site
+
+
+def get_site_obj(site_id: int) -> Site:
+    """Returns the Site model instance for this site_id.
+
+    Uses the same SITE_CACHE as `Site.objects.get_current()`,
+    so costs at most one query per site per process. The
+    cache is cleared by django.contrib.sites when a Site
+    is saved or deleted.
+    """
+    from django.contrib.sites.models import SITE_CACHE  # noqa
+
+    if site_id not in SITE_CACHE:
+        SITE_CACHE[site_id] = get_site_model_cls().objects.get(pk=site_id)
+    return SITE_CACHE[site_id]
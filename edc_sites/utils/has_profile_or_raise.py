@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from django.contrib.auth import get_user_model
-from django.core.exceptions import ImproperlyConfigured
+from django.core.exceptions import FieldError, ImproperlyConfigured
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import User
@@ -25,3 +25,19 @@ def has_profile_or_raise(user: User) -> bool:
             "to `UserProfile`. See edc_sites."
         )
     return True
+
+
+async def ahas_profile_or_raise(user: User) -> bool:
+    """Async version of `has_profile_or_raise`."""
+    try:
+        user = await get_user_model().objects.select_related("userprofile").aget(id=user.id)
+    except FieldError:
+        userprofile = None
+    else:
+        userprofile = getattr(user, "userprofile", None)
+    if not userprofile:
+        raise ImproperlyConfigured(
+            "User instance has no `userprofile`. User accounts must have a relation "
+            "to `UserProfile`. See edc_sites."
+        )
+    return True
@@ -1,13 +1,67 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable
+
 from django.contrib.sites.shortcuts import get_current_site
 from django.core.handlers.wsgi import WSGIRequest
 
 from ..exceptions import InvalidSiteError
+from .pin_current_site import get_pinned_site
+
+if TYPE_CHECKING:
+    from django.contrib.sites.models import Site
+
+    from ..single_site import SingleSite
+
+__all__ = ["is_current_site_or_raise", "all_current_site_or_raise"]
+
+
+def get_current_site_id(
+    request: WSGIRequest | None = None,
+    current_site: int | SingleSite | Site | None = None,
+) -> int:
+    """Returns the current site id from `current_site`, if given,
+    otherwise from the request, the pinned site or settings.
+
+    `current_site` may be a site id, a SingleSite or a Site model
+    instance.
+    """
+    if current_site is None:
+        current_site = getattr(request, "site", None) or get_pinned_site()
+    if current_site is None:
+        return get_current_site(request).id
+    elif isinstance(current_site, int):
+        return current_site
+    return getattr(current_site, "site_id", None) or current_site.id
+
+
+def is_current_site_or_raise(
+    site_id: int,
+    request: WSGIRequest = None,
+    current_site: int | SingleSite | Site | None = None,
+) -> bool:
+    current_site_id = get_current_site_id(request, current_site)
+    if site_id != current_site_id:
+        raise InvalidSiteError(
+            f"Expected the current site. Current site is {current_site_id}. Got {site_id}."
+        )
+    return True
+
 
+def all_current_site_or_raise(
+    site_ids: Iterable[int],
+    request: WSGIRequest = None,
+    current_site: int | SingleSite | Site | None = None,
+) -> bool:
+    """Raises if any of the site ids is not the current site.
 
-def is_current_site_or_raise(site_id: int, request: WSGIRequest = None) -> bool:
-    if site_id != get_current_site(request).id:
+    The current site is resolved once for the whole sequence,
+    e.g. when validating rows for import.
+    """
+    current_site_id = get_current_site_id(request, current_site)
+    if invalid_site_ids := list(dict.fromkeys(s for s in site_ids if s != current_site_id)):
         raise InvalidSiteError(
-            f"Expected the current site. Current site is {get_current_site(request).id}. "
-            f"Got {site_id}."
+            f"Expected the current site. Current site is {current_site_id}. "
+            f"Got {invalid_site_ids}."
         )
     return True
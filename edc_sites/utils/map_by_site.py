@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from django.apps import apps as django_apps
+from django.db import connections
+
+from .pin_current_site import pin_current_site
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from django.db.models.sql import Query
+
+__all__ = ["map_by_site", "partition_by_site"]
+
+
+def get_site_ids(site_ids: Iterable[int] | None = None) -> list[int]:
+    from ..site import sites  # prevent circular import
+
+    return list(sites.all() if site_ids is None else site_ids)
+
+
+def partition_by_site(
+    queryset: QuerySet, site_ids: Iterable[int] | None = None
+) -> dict[int, QuerySet]:
+    """Returns a dictionary of querysets, one per site, filtered by
+    `site_id`.
+
+    If `site_ids` is None, partitions by the sites in the `sites`
+    registry. An empty `site_ids` returns no partitions.
+
+    Rows with a null `site_id` or a `site_id` not in `site_ids`
+    are not in any partition.
+    """
+    return {site_id: queryset.filter(site_id=site_id) for site_id in get_site_ids(site_ids)}
+
+
+def get_queryset_state(queryset: QuerySet) -> dict[str, Any]:
+    """Returns what is needed to rebuild the queryset in a worker
+    without pickling (and so evaluating) the queryset itself.
+    """
+    return dict(
+        queryset_cls=queryset.__class__,
+        label_lower=queryset.model._meta.label_lower,
+        query=queryset.query,
+        using=queryset.db,
+        iterable_class=queryset._iterable_class,
+        fields=queryset._fields,
+        prefetch_related_lookups=queryset._prefetch_related_lookups,
+    )
+
+
+def rebuild_queryset(
+    queryset_cls: type[QuerySet],
+    label_lower: str,
+    query: Query,
+    using: str,
+    iterable_class: type,
+    fields: tuple[str, ...] | None,
+    prefetch_related_lookups: tuple,
+) -> QuerySet:
+    """Returns a queryset rebuilt from `get_queryset_state`,
+    keeping the queryset class, `values()` / `values_list()` and
+    `prefetch_related()` of the original.
+    """
+    queryset = queryset_cls(model=django_apps.get_model(label_lower), query=query, using=using)
+    queryset._iterable_class = iterable_class
+    queryset._fields = fields
+    queryset._prefetch_related_lookups = prefetch_related_lookups
+    return queryset
+
+
+def run_for_site(
+    func: Callable[[int, QuerySet], Any],
+    site_id: int,
+    queryset_state: dict[str, Any],
+    caller: tuple[int, int],
+) -> Any:
+    """Runs `func` in a worker for a single site with the current
+    site pinned.
+
+    The queryset is rebuilt from its state so that the queryset
+    is not evaluated when pickled for a process pool.
+    """
+    queryset = rebuild_queryset(**queryset_state)
+    try:
+        with pin_current_site(site_id):
+            return func(site_id, queryset)
+    finally:
+        if (os.getpid(), threading.get_ident()) != caller:
+            connections.close_all()
+
+
+def map_by_site(
+    queryset: QuerySet,
+    func: Callable[[int, QuerySet], Any],
+    site_ids: Iterable[int] | None = None,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    reduce: Callable[[dict[int, Any]], Any] | None = None,
+) -> dict[int, Any] | Any:
+    """Runs `func(site_id, queryset)` for each site's partition of a
+    SiteModelMixin queryset on a thread or process pool and returns
+    a dictionary of results by site_id, or the result of `reduce`,
+    if given.
+
+    Sites are those of `partition_by_site`. Rows with a null
+    `site_id` or a `site_id` not in the registry (or not in
+    `site_ids`, if given) are never processed.
+
+    In each worker, the current site is pinned to the site of the
+    partition (see `pin_current_site`) and the worker's database
+    connections are closed when done.
+
+    By default, runs on a ThreadPoolExecutor that is shut down
+    when done. To run on a ProcessPoolExecutor, pass one created
+    with the `fork` start method and a `func` defined at the
+    module level. Database connections are closed before the
+    processes are started. An executor passed in is not shut
+    down.
+
+    The queryset class, `values()` / `values_list()` and
+    `prefetch_related()` of `queryset` are kept in each worker.
+
+    For example:
+
+        def count_visits(site_id, queryset):
+            return queryset.count()
+
+        totals = map_by_site(SubjectVisit.objects.all(), count_visits)
+    """
+    partitions = partition_by_site(queryset, site_ids)
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = submit_by_site(executor, func, partitions)
+    else:
+        if isinstance(executor, ProcessPoolExecutor):
+            connections.close_all()
+        # not shut down, the executor belongs to the caller
+        results = submit_by_site(executor, func, partitions)
+    return reduce(results) if reduce else results
+
+
+def submit_by_site(
+    executor: Executor,
+    func: Callable[[int, QuerySet], Any],
+    partitions: dict[int, QuerySet],
+) -> dict[int, Any]:
+    caller = (os.getpid(), threading.get_ident())
+    futures = {
+        site_id: executor.submit(
+            run_for_site, func, site_id, get_queryset_state(partition), caller
+        )
+        for site_id, partition in partitions.items()
+    }
+    return {site_id: future.result() for site_id, future in futures.items()}
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Iterator
+
+from .get_site_model_cls import get_site_model_cls
+
+if TYPE_CHECKING:
+    from django.contrib.sites.models import Site
+
+    from ..single_site import SingleSite
+
+__all__ = ["get_pinned_site", "pin_current_site"]
+
+_pinned_site: ContextVar[Site | None] = ContextVar("edc_sites_pinned_site", default=None)
+
+
+@contextmanager
+def pin_current_site(site: Site | SingleSite | int) -> Iterator[Site]:
+    """Context manager to pin the current site for a block of work.
+
+    For code not running in a request, e.g. a Celery task or a
+    management command. Within the block, `get_current_site_obj`
+    and the helpers that use it return the pinned site without
+    a query.
+
+    For example:
+
+        with pin_current_site(site_id):
+            ...
+    """
+    if isinstance(site, int) or hasattr(site, "site_id"):
+        site = get_site_model_cls().objects.get(id=getattr(site, "site_id", site))
+    token = _pinned_site.set(site)
+    try:
+        yield site
+    finally:
+        _pinned_site.reset(token)
+
+
+def get_pinned_site() -> Site | None:
+    """Returns the site pinned by `pin_current_site` or None."""
+    return _pinned_site.get()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Iterable, TextIO
+
+from django.apps import apps as django_apps
+from django.db import connections, router, transaction
+
+from .get_fingerprint import get_fingerprint_from_values
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+__all__ = ["SitesSnapshotError", "export_sites_snapshot", "import_sites_snapshot"]
+
+
+class SitesSnapshotError(Exception):
+    pass
+
+
+def get_snapshot_models() -> list[type[Model]]:
+    """Returns the models included in a snapshot, in dependency
+    order.
+    """
+    model_classes = [
+        django_apps.get_model("sites.site"),
+        django_apps.get_model("edc_sites.siteprofile"),
+    ]
+    if django_apps.is_installed("multisite"):
+        model_classes.append(django_apps.get_model("multisite.alias"))
+    return model_classes
+
+
+def export_sites_snapshot(stream: TextIO) -> int:
+    """Writes the Site, SiteProfile and multisite Alias rows to
+    `stream` as JSON lines and returns the number of rows written.
+
+    Each line is `{"model": <label_lower>, "fields": {<attname>: <value>}}`.
+    """
+    count = 0
+    for model_cls in get_snapshot_models():
+        attnames = [f.attname for f in model_cls._meta.concrete_fields]
+        for row in model_cls.objects.order_by("pk").values(*attnames).iterator():
+            stream.write(json.dumps({"model": model_cls._meta.label_lower, "fields": row}))
+            stream.write("\n")
+            count += 1
+    return count
+
+
+def get_fingerprint_from_snapshot(rows: dict[str, list[dict]]) -> str:
+    profiles = {row["site_id"]: row for row in rows.get("edc_sites.siteprofile", [])}
+    values = []
+    for site in rows.get("sites.site", []):
+        profile = profiles.get(site["id"], {})
+        languages = profile.get("languages")
+        values.append(
+            (
+                site["id"],
+                site["name"],
+                site["domain"],
+                profile.get("country"),
+                profile.get("country_code"),
+                profile.get("title"),
+                json.loads(languages) if languages else None,
+            )
+        )
+    return get_fingerprint_from_values(values)
+
+
+def bulk_upsert(
+    model_cls: type[Model],
+    rows: list[dict],
+    unique_fields: list[str],
+    using: str | None = None,
+):
+    """Inserts or updates rows in a single statement per batch."""
+    using = using or router.db_for_write(model_cls)
+    opts = dict(
+        update_conflicts=True,
+        update_fields=[
+            f.name
+            for f in model_cls._meta.concrete_fields
+            if not f.primary_key and f.name not in unique_fields
+        ],
+    )
+    if connections[using].features.supports_update_conflicts_with_target:
+        opts.update(unique_fields=unique_fields)
+    model_cls.objects.using(using).bulk_create([model_cls(**row) for row in rows], **opts)
+
+
+def import_sites_snapshot(lines: Iterable[str], verify: bool | None = None) -> str:
+    """Imports a snapshot written by `export_sites_snapshot` in a
+    single transaction and returns the fingerprint of the imported
+    sites.
+
+    If `verify` is not False, raises SitesSnapshotError before
+    writing anything if the snapshot does not match the `sites`
+    registry. The comparison is done in memory on the fingerprint.
+
+    Rows are inserted or updated in bulk. Site rows not in the
+    snapshot are not deleted. Aliases of the sites in the
+    snapshot are replaced.
+    """
+    from ..site import sites  # prevent circular import
+
+    rows: dict[str, list[dict]] = {}
+    for line in lines:
+        if line.strip():
+            data = json.loads(line)
+            rows.setdefault(data["model"], []).append(data["fields"])
+    fingerprint = get_fingerprint_from_snapshot(rows)
+    if verify is not False and fingerprint != sites.fingerprint:
+        raise SitesSnapshotError(
+            "Snapshot does not match the sites registry. "
+            f"Got fingerprint {fingerprint}. Expected {sites.fingerprint}."
+        )
+    site_model_cls, site_profile_model_cls, *alias_model_cls = get_snapshot_models()
+    site_ids = [row["id"] for row in rows.get("sites.site", [])]
+    with transaction.atomic():
+        bulk_upsert(site_model_cls, rows.get("sites.site", []), unique_fields=["id"])
+        bulk_upsert(
+            site_profile_model_cls,
+            [
+                {k: v for k, v in row.items() if k != "id"}
+                for row in rows.get("edc_sites.siteprofile", [])
+            ],
+            unique_fields=["site"],
+        )
+        if alias_model_cls:
+            alias_model_cls[0].objects.filter(site_id__in=site_ids).delete()
+            alias_model_cls[0].objects.bulk_create(
+                [
+                    alias_model_cls[0](**{k: v for k, v in row.items() if k != "id"})
+                    for row in rows.get("multisite.alias", [])
+                ]
+            )
+        django_apps.get_model("edc_sites.sitesfingerprint").objects.update_or_create(
+            pk=1, defaults=dict(fingerprint=fingerprint)
+        )
+    site_model_cls.objects.clear_cache()
+    return fingerprint
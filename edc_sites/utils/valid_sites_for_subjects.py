@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable
+from warnings import warn
+
+from edc_registration.utils import (
+    RegisteredSubjectDoesNotExist,
+    get_registered_subject_model_cls,
+)
+
+from ..exceptions import InvalidSiteForSubjectError
+from .get_current_site_obj import get_current_site_obj
+from .get_site_model_cls import get_site_model_cls
+
+if TYPE_CHECKING:
+    from django.contrib.sites.models import Site
+
+__all__ = ["valid_sites_for_subjects"]
+
+
+def valid_sites_for_subjects(
+    subject_identifiers: Iterable[str],
+    current_site: Site | None = None,
+    skip_get_current_site: bool | None = None,
+) -> tuple[dict[str, Site], dict[str, Exception]]:
+    """Returns a tuple of two dictionaries, the site for each valid
+    subject_identifier and the exception for each invalid
+    subject_identifier.
+
+    Bulk version of `valid_site_for_subject_or_raise`. Registered
+    subjects are fetched in a single query. Pass `current_site`, or
+    use `pin_current_site`, to avoid a call to
+    `Site.objects.get_current()`.
+
+    An exception is one of RegisteredSubjectDoesNotExist or
+    InvalidSiteForSubjectError.
+    """
+    subject_identifiers = list(dict.fromkeys(subject_identifiers))
+    registered_subject_model_cls = get_registered_subject_model_cls()
+    site_ids: dict[str, int | None] = dict(
+        registered_subject_model_cls.objects.filter(
+            subject_identifier__in=subject_identifiers
+        ).values_list("subject_identifier", "site_id")
+    )
+    site_objs: dict[str, Site] = {}
+    errors: dict[str, Exception] = {}
+    if skip_get_current_site:
+        warn("Skipping validation of current site against registered subject site.")
+        site_objs_by_id = get_site_model_cls().objects.in_bulk(
+            {site_id for site_id in site_ids.values() if site_id}
+        )
+    else:
+        current_site = current_site or get_current_site_obj()
+        site_objs_by_id = {current_site.id: current_site}
+    for subject_identifier in subject_identifiers:
+        if subject_identifier not in site_ids:
+            errors[subject_identifier] = RegisteredSubjectDoesNotExist(
+                "Unknown subject. "
+                f"Searched `{registered_subject_model_cls._meta.label_lower}`. "
+                f"Got subject_identifier=`{subject_identifier}`."
+            )
+        elif not site_ids[subject_identifier]:
+            errors[subject_identifier] = InvalidSiteForSubjectError(
+                "Site not defined for registered subject! "
+                f"Subject identifier=`{subject_identifier}`. "
+            )
+        elif site_ids[subject_identifier] not in site_objs_by_id:
+            errors[subject_identifier] = InvalidSiteForSubjectError(
+                f"Invalid site for subject. Subject identifier=`{subject_identifier}`. "
+                f"Expected site_id=`{site_ids[subject_identifier]}`. "
+                f"Got site_id=`{current_site.id}`"
+            )
+        else:
+            site_objs[subject_identifier] = site_objs_by_id[site_ids[subject_identifier]]
+    return site_objs, errors
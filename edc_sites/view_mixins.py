@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from django.core.exceptions import ObjectDoesNotExist
-
-from .models import SiteProfile
+from .context_processors import get_site_context
 from .site import SiteNotRegistered, sites
 
 
@@ -12,10 +10,7 @@ class SiteViewMixin:
         return super().get_context_data(**kwargs)
 
     def get_context_data_for_sites(self, **kwargs):
-        try:
-            site_profile = SiteProfile.objects.get(site__id=self.request.site.id)
-        except ObjectDoesNotExist:
-            site_profile = None
+        site_profile = get_site_context(self.request).site_profile
         kwargs.update(site_profile=site_profile)
         try:
             kwargs.update(site_title=site_profile.title)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""Runs the benchmarks in edc_sites.tests.benchmarks and reports the
+number of queries and wall time of each.
+
+Optionally:
+    --output=<path>    write the results as json
+    --baseline=<path>  compare with results written by a previous run. Fails
+                       if the number of queries increased or if the median
+                       wall time increased by more than --tolerance (default 1.5).
+"""
+
+import json
+import os
+import sys
+
+import django
+from django.test.runner import DiscoverRunner
+
+
+def get_arg(name: str, default: str | None = None) -> str | None:
+    return next((a.split("=", 1)[1] for a in sys.argv if a.startswith(f"--{name}=")), default)
+
+
+def compare_with_baseline(results: list[dict], baseline: list[dict], tolerance: float) -> int:
+    regressions = 0
+    baseline = {result["name"]: result for result in baseline}
+    for result in results:
+        if previous := baseline.get(result["name"]):
+            if result["queries"] > previous["queries"]:
+                regressions += 1
+                sys.stdout.write(
+                    f"REGRESSION {result['name']}: queries "
+                    f"{previous['queries']} -> {result['queries']}\n"
+                )
+            if result["median"] > previous["median"] * tolerance:
+                regressions += 1
+                sys.stdout.write(
+                    f"REGRESSION {result['name']}: median "
+                    f"{previous['median']:.6f}s -> {result['median']:.6f}s\n"
+                )
+    return regressions
+
+
+def main():
+    os.environ["DJANGO_SETTINGS_MODULE"] = "edc_sites.tests.test_settings"
+    django.setup()
+    from edc_sites.tests.benchmarks.benchmark_test_case import benchmark_results
+
+    keepdb = any([True for t in sys.argv if t.startswith("--keepdb")])
+    failures = DiscoverRunner(pattern="bench_*.py", keepdb=keepdb, verbosity=0).run_tests(
+        ["edc_sites.tests.benchmarks"]
+    )
+    sys.stdout.write(
+        f"\n{'benchmark':<55} {'queries':>8} {'min (ms)':>10} {'median (ms)':>12}\n"
+    )
+    for result in benchmark_results:
+        sys.stdout.write(
+            f"{result['name']:<55} {result['queries']:>8} "
+            f"{result['min'] * 1000:>10.2f} {result['median'] * 1000:>12.2f}\n"
+        )
+    if output := get_arg("output"):
+        with open(output, "w") as f:
+            json.dump(benchmark_results, f, indent=2)
+    if baseline := get_arg("baseline"):
+        with open(baseline) as f:
+            failures += compare_with_baseline(
+                benchmark_results, json.load(f), float(get_arg("tolerance", "1.5"))
+            )
+    sys.exit(bool(failures))
+
+
+if __name__ == "__main__":
+    main()